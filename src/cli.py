@@ -4,6 +4,7 @@ import click
 from click import Context
 from simple_logger.logger import get_logger
 
+from src.commands.config import config
 from src.commands.jira_config_gen import jira_config_gen
 from src.commands.report import report
 
@@ -26,6 +27,7 @@ def main(ctx: Context, pdb: bool) -> None:
 main.add_command(report)
 main.add_command(jira_config_gen)
 main.add_command(jira_escalation)
+main.add_command(config)
 
 if __name__ == "__main__":
     should_raise = False
@@ -0,0 +1,75 @@
+"""Module building config cli commands"""
+
+from typing import Optional
+
+import click
+from click import Context
+
+from src.objects.config_cache import DEFAULT_CONFIG_FETCH_TIMEOUT
+from src.objects.config_snapshot import DEFAULT_CONFIG_SNAPSHOT_PATH
+from src.objects.config_snapshot import write_config_snapshot
+from src.objects.configuration import Configuration
+
+
+@click.group("config")
+def config() -> None:
+    """Manage firewatch configurations."""
+
+
+@click.option(
+    "--firewatch-config-path",
+    help="The path to the firewatch configuration file. Can be used multiple times, later files override earlier ones.",
+    required=False,
+    multiple=True,
+    type=click.Path(),
+)
+@click.option(
+    "--output-file",
+    help="Where the compiled config snapshot will be stored",
+    default=DEFAULT_CONFIG_SNAPSHOT_PATH,
+    show_default=True,
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--config-cache-dir",
+    help="A directory firewatch caches remote firewatch configuration files in. The cached copy is revalidated on every run. If the config host is slow or down, the cached copy is used with a warning, even if it is stale. Disabled if not set.",
+    required=False,
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "--config-fetch-timeout",
+    help="The number of seconds to wait for a remote firewatch configuration file before giving up, or using the cached copy if --config-cache-dir is set.",
+    default=DEFAULT_CONFIG_FETCH_TIMEOUT,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--pdb",
+    help="Drop to `ipdb` shell on exception",
+    is_flag=True,
+)
+@config.command("compile")
+@click.pass_context
+def compile_config(
+    ctx: Context,
+    firewatch_config_path: tuple[str, ...],
+    output_file: str,
+    config_cache_dir: Optional[str],
+    config_fetch_timeout: float,
+    pdb: bool,
+) -> None:
+    """Validate a firewatch config and write a snapshot that `firewatch report --config-snapshot` loads."""
+    ctx.obj["PDB"] = pdb
+
+    # Compiling the rules does not talk to Jira
+    configuration = Configuration(
+        jira=None,  # type: ignore
+        fail_with_test_failures=False,
+        fail_with_pod_failures=False,
+        keep_job_dir=False,
+        verbose_test_failure_reporting=False,
+        config_file_path=firewatch_config_path,
+        config_cache_dir=config_cache_dir,
+        config_fetch_timeout=config_fetch_timeout,
+    )
+    write_config_snapshot(path=output_file, snapshot=configuration.to_snapshot())
@@ -16,13 +16,23 @@
 #
 """Module building report cli command"""
 
+import os
 from typing import Optional
 
 import click
 from click import Context
 
+from src.objects.artifact_cache import DEFAULT_ARTIFACT_CACHE_MAX_BYTES
+from src.objects.artifact_downloader import DEFAULT_DOWNLOAD_WORKERS
+from src.objects.artifact_downloader import DEFAULT_MAX_INFLIGHT_BYTES
+from src.objects.build_manifest import ARTIFACT_DISCOVERY_FULL
+from src.objects.build_manifest import ARTIFACT_DISCOVERY_MODES
+from src.objects.build_manifest import DEFAULT_JUNIT_PATTERNS
+from src.objects.config_cache import DEFAULT_CONFIG_FETCH_TIMEOUT
 from src.objects.configuration import Configuration
 from src.objects.jira_base import Jira
+from src.objects.jira_metadata_cache import DEFAULT_JIRA_METADATA_CACHE_TTL
+from src.objects.job import DEFAULT_BUILD_HISTORY_LOOKBACK_DAYS
 from src.objects.job import Job
 from src.report.report import Report
 
@@ -84,8 +94,9 @@ def validate_verbose_test_failure_reporting_ticket_limit(
 )
 @click.option(
     "--firewatch-config-path",
-    help="The path to the firewatch configuration file",
+    help="The path to the firewatch configuration file. Can be used multiple times, later files override earlier ones.",
     required=False,
+    multiple=True,
     type=click.Path(),
 )
 @click.option(
@@ -130,6 +141,101 @@ def validate_verbose_test_failure_reporting_ticket_limit(
     help="A file containing a list of additional labels separated by new lines to add to any new Jira issue.",
     type=click.Path(exists=True),
 )
+@click.option(
+    "--download-workers",
+    help="The maximum number of artifacts firewatch downloads from GCS at the same time.",
+    default=DEFAULT_DOWNLOAD_WORKERS,
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--download-max-inflight-mb",
+    help="The maximum number of megabytes firewatch downloads from GCS at the same time.",
+    default=DEFAULT_MAX_INFLIGHT_BYTES // (1024 * 1024),
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--build-history-lookback-days",
+    help="The number of days of earlier builds firewatch lists when checking if a build is a retrigger.",
+    default=DEFAULT_BUILD_HISTORY_LOOKBACK_DAYS,
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--artifact-discovery",
+    help="How firewatch finds the artifacts of a job. 'full' lists every artifact, 'targeted' only lists the steps and the JUnit files matching --junit-pattern.",
+    default=ARTIFACT_DISCOVERY_FULL,
+    show_default=True,
+    type=click.Choice(ARTIFACT_DISCOVERY_MODES),
+)
+@click.option(
+    "--junit-pattern",
+    "junit_patterns",
+    help="A glob pattern, relative to a step directory, of the JUnit files to list when --artifact-discovery is 'targeted'. Can be used multiple times.",
+    default=DEFAULT_JUNIT_PATTERNS,
+    show_default=True,
+    multiple=True,
+    type=click.STRING,
+)
+@click.option(
+    "--artifact-cache-dir",
+    help="A directory firewatch caches downloaded artifacts in, so later runs do not download unchanged artifacts again. Disabled if not set.",
+    required=False,
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "--artifact-cache-max-mb",
+    help="The maximum size of the artifact cache in megabytes. The least recently used artifacts are removed first.",
+    default=DEFAULT_ARTIFACT_CACHE_MAX_BYTES // (1024 * 1024),
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--parsed-result-cache",
+    help="A SQLite database firewatch caches the failures found in JUnit and finished.json files in, so reruns on the same build do not download or parse unchanged files again. Disabled if not set.",
+    required=False,
+    type=click.Path(dir_okay=False),
+)
+@click.option(
+    "--parse-workers",
+    help="The number of processes firewatch parses JUnit files in. Files are parsed one at a time when set to 1.",
+    default=1,
+    show_default=True,
+    type=click.IntRange(min=1),
+)
+@click.option(
+    "--jira-metadata-cache-dir",
+    help="A directory firewatch caches Jira security levels, transition IDs and user account IDs in, so later runs do not look them up again. Only cached for the current run if not set.",
+    required=False,
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "--jira-metadata-cache-ttl",
+    help="The number of seconds cached Jira metadata is used for before it is looked up again.",
+    default=DEFAULT_JIRA_METADATA_CACHE_TTL,
+    show_default=True,
+    type=click.IntRange(min=0),
+)
+@click.option(
+    "--config-cache-dir",
+    help="A directory firewatch caches remote firewatch configuration files in. The cached copy is revalidated on every run. If the config host is slow or down, the cached copy is used with a warning, even if it is stale. Disabled if not set.",
+    required=False,
+    type=click.Path(file_okay=False),
+)
+@click.option(
+    "--config-fetch-timeout",
+    help="The number of seconds to wait for a remote firewatch configuration file before giving up, or using the cached copy if --config-cache-dir is set.",
+    default=DEFAULT_CONFIG_FETCH_TIMEOUT,
+    show_default=True,
+    type=click.FloatRange(min=0, min_open=True),
+)
+@click.option(
+    "--config-snapshot",
+    help="A config snapshot written by `firewatch config compile`. Used instead of validating the config again if it was compiled from the same config.",
+    required=False,
+    type=click.Path(dir_okay=False),
+)
 @click.option(
     "--pdb",
     help="Drop to `ipdb` shell on exception",
@@ -145,7 +251,7 @@ def report(
     pr_id: str,
     gcs_bucket: str,
     gcs_creds_file: Optional[str],
-    firewatch_config_path: Optional[str],
+    firewatch_config_path: tuple[str, ...],
     jira_config_path: str,
     fail_with_test_failures: bool,
     fail_with_pod_failures: bool,
@@ -153,12 +259,30 @@ def report(
     verbose_test_failure_reporting: bool,
     verbose_test_failure_reporting_ticket_limit: Optional[int],
     additional_labels_file: Optional[str],
+    download_workers: int,
+    download_max_inflight_mb: int,
+    build_history_lookback_days: int,
+    artifact_discovery: str,
+    junit_patterns: tuple[str, ...],
+    artifact_cache_dir: Optional[str],
+    artifact_cache_max_mb: int,
+    parse_workers: int,
+    parsed_result_cache: Optional[str],
+    jira_metadata_cache_dir: Optional[str],
+    jira_metadata_cache_ttl: int,
+    config_cache_dir: Optional[str],
+    config_fetch_timeout: float,
+    config_snapshot: Optional[str],
     pdb: bool,
 ) -> None:
     ctx.obj["PDB"] = pdb
 
     # Build Objects
-    jira_connection = Jira(jira_config_path=jira_config_path)
+    jira_connection = Jira(
+        jira_config_path=jira_config_path,
+        metadata_cache_dir=jira_metadata_cache_dir,
+        metadata_cache_ttl=jira_metadata_cache_ttl,
+    )
     config = Configuration(
         jira=jira_connection,
         fail_with_test_failures=fail_with_test_failures,
@@ -168,6 +292,10 @@ def report(
         verbose_test_failure_reporting_ticket_limit=verbose_test_failure_reporting_ticket_limit,
         config_file_path=firewatch_config_path,
         additional_lables_file=additional_labels_file,
+        config_cache_dir=config_cache_dir,
+        config_fetch_timeout=config_fetch_timeout,
+        config_snapshot_path=config_snapshot,
+        job_name=job_name or os.getenv("JOB_NAME"),
     )
     job = Job(
         name=job_name,
@@ -177,7 +305,19 @@ def report(
         gcs_creds_file=gcs_creds_file,
         firewatch_config=config,
         pr_id=pr_id,
+        download_workers=download_workers,
+        download_max_inflight_mb=download_max_inflight_mb,
+        build_history_lookback_days=build_history_lookback_days,
+        artifact_discovery=artifact_discovery,
+        junit_patterns=junit_patterns,
+        artifact_cache_dir=artifact_cache_dir,
+        artifact_cache_max_mb=artifact_cache_max_mb,
+        parse_workers=parse_workers,
+        parsed_result_cache_path=parsed_result_cache,
     )
 
-    # Build the Report object and report issues to Jira
-    Report(firewatch_config=config, job=job)
+    # Build the Report object and report issues to Jira. Report exits the process, the job is closed on the way out.
+    try:
+        Report(firewatch_config=config, job=job)
+    finally:
+        job.close()
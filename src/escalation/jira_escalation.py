@@ -100,10 +100,10 @@ class Jira_Escalation:
           list : issues with no assignee
         """
 
-        issues_list = self.jira.search_issues(jql_query=jira_query)
-        LOGGER.info(f"Matching Jira issues : {issues_list}")
         issues_with_no_assignee = []
-        for issue_id in issues_list:
+        # Issues are fetched page by page as they are processed
+        for issue_id in self.jira.iter_search_issues(jql_query=jira_query):
+            LOGGER.info(f"Matching Jira issue : {issue_id}")
             jira_issue = self.jira.get_issue_by_id_or_key_with_changelog(issue_id)
             LOGGER.info(f"Starting to process Jira issue: {jira_issue.key}")
 
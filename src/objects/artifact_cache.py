@@ -0,0 +1,157 @@
+import base64
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+from typing import Optional
+
+from simple_logger.logger import get_logger
+
+from src.objects.build_manifest import ManifestEntry
+
+DEFAULT_ARTIFACT_CACHE_MAX_BYTES = 2 * 1024 * 1024 * 1024
+
+
+class ArtifactCache:
+    def __init__(self, cache_dir: str, max_size_bytes: int = DEFAULT_ARTIFACT_CACHE_MAX_BYTES) -> None:
+        """
+        Constructs the ArtifactCache object. Used to keep downloaded artifacts on disk between firewatch runs. Objects
+        are stored under a key built from their GCS generation and MD5 hash, so a cached object is only reused while
+        the listing still reports the same content. The least recently used objects are removed once the cache grows
+        larger than max_size_bytes.
+
+        Args:
+            cache_dir (str): The directory the cached objects are stored in. It is created if it does not exist.
+            max_size_bytes (int): The maximum total size of the cached objects in bytes.
+        """
+        self.logger = get_logger(__name__)
+
+        self.cache_dir = cache_dir
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.max_size_bytes = max_size_bytes
+
+        self._eviction_lock = threading.Lock()
+
+        os.makedirs(self.objects_dir, exist_ok=True)
+
+    def _get_key(self, entry: ManifestEntry) -> Optional[str]:
+        """
+        Builds the cache key of a manifest entry.
+
+        Args:
+            entry (ManifestEntry): The manifest entry to build the key for.
+
+        Returns:
+            Optional[str]: The cache key, or None if the entry can not be cached because its content is unknown.
+        """
+        if not entry.listed or entry.generation is None or not entry.md5_hash:
+            return None
+        return hashlib.sha256(f"{entry.name}#{entry.generation}#{entry.md5_hash}".encode()).hexdigest()
+
+    def _get_path(self, key: str) -> str:
+        return os.path.join(self.objects_dir, key[:2], key)
+
+    def fetch(self, entry: ManifestEntry, file_path: str) -> bool:
+        """
+        Copies a cached object to the given path if the cache holds a valid copy of the manifest entry.
+
+        Args:
+            entry (ManifestEntry): The manifest entry to look up.
+            file_path (str): The path the cached object should be copied to.
+
+        Returns:
+            bool: True if the object was found in the cache and copied, otherwise False.
+        """
+        key = self._get_key(entry=entry)
+        if key is None:
+            return False
+
+        cached_path = self._get_path(key=key)
+        try:
+            if entry.size is not None and os.path.getsize(cached_path) != entry.size:
+                self.logger.warning(f"Cached copy of {entry.name} has an unexpected size, ignoring it.")
+                os.remove(cached_path)
+                return False
+            shutil.copyfile(cached_path, file_path)
+            # The modification time is used as the last access time for eviction
+            os.utime(cached_path)
+        except FileNotFoundError:
+            return False
+
+        self.logger.debug(f"{file_path} restored from the artifact cache...")
+        return True
+
+    def store(self, entry: ManifestEntry, file_path: str) -> None:
+        """
+        Adds a downloaded object to the cache. Objects whose content does not match the MD5 hash of the manifest entry
+        are not stored.
+
+        Args:
+            entry (ManifestEntry): The manifest entry the file was downloaded from.
+            file_path (str): The path of the downloaded file.
+
+        Returns:
+            None
+        """
+        key = self._get_key(entry=entry)
+        if key is None:
+            return
+
+        md5 = hashlib.md5()
+        with open(file_path, "rb") as file:
+            for chunk in iter(lambda: file.read(1024 * 1024), b""):
+                md5.update(chunk)
+        if base64.b64encode(md5.digest()).decode() != entry.md5_hash:
+            self.logger.warning(f"{file_path} does not match the MD5 hash of {entry.name}, not caching it.")
+            return
+
+        cached_path = self._get_path(key=key)
+        os.makedirs(os.path.dirname(cached_path), exist_ok=True)
+
+        # Write to a temporary file first so concurrent runs never read a partial object
+        fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(cached_path), prefix=".tmp-")
+        os.close(fd)
+        try:
+            shutil.copyfile(file_path, temp_path)
+            os.replace(temp_path, cached_path)
+        except OSError as ex:
+            self.logger.warning(f"Failed to cache {entry.name}: {ex}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def evict(self) -> None:
+        """
+        Removes the least recently used objects until the cache is no larger than its maximum size.
+
+        Returns:
+            None
+        """
+        with self._eviction_lock:
+            cached_files = []
+            total_size = 0
+            for root, _, files in os.walk(self.objects_dir):
+                for file_name in files:
+                    path = os.path.join(root, file_name)
+                    try:
+                        stat = os.stat(path)
+                    except FileNotFoundError:
+                        continue
+                    cached_files.append((stat.st_mtime, stat.st_size, path))
+                    total_size += stat.st_size
+
+            if total_size <= self.max_size_bytes:
+                return
+
+            evicted = 0
+            for _, size, path in sorted(cached_files):
+                if total_size <= self.max_size_bytes:
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+                total_size -= size
+                evicted += 1
+
+            self.logger.info(f"Evicted {evicted} objects from the artifact cache in {self.cache_dir}")
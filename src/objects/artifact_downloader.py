@@ -0,0 +1,146 @@
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from google.api_core.exceptions import NotFound
+from pyhelper_utils.general import ignore_exceptions
+from simple_logger.logger import get_logger
+
+from src.objects.artifact_cache import ArtifactCache
+from src.objects.build_manifest import BuildManifest
+from src.objects.build_manifest import ManifestEntry
+
+DEFAULT_DOWNLOAD_WORKERS = 8
+DEFAULT_DOWNLOAD_RETRIES = 3
+DEFAULT_MAX_INFLIGHT_BYTES = 512 * 1024 * 1024
+
+
+class ArtifactDownloader:
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        retries: int = DEFAULT_DOWNLOAD_RETRIES,
+        retry_interval: int = 1,
+        max_inflight_bytes: int = DEFAULT_MAX_INFLIGHT_BYTES,
+        cache: Optional[ArtifactCache] = None,
+    ) -> None:
+        """
+        Constructs the ArtifactDownloader object. Used to download the artifacts of a job from GCS using a bounded
+        pool of worker threads.
+
+        Args:
+            max_workers (int): The maximum number of blobs downloaded at the same time.
+            retries (int): The number of times a failed blob download is retried before giving up.
+            retry_interval (int): The number of seconds to wait between retries.
+            max_inflight_bytes (int): The maximum number of bytes being downloaded at the same time. A single blob
+                larger than this value is still downloaded, but only once nothing else is in flight.
+            cache (Optional[ArtifactCache]): The cache used to skip downloads of objects fetched by an earlier run.
+        """
+        self.logger = get_logger(__name__)
+
+        self.max_workers = max(1, max_workers)
+        self.retries = retries
+        self.retry_interval = retry_interval
+        self.max_inflight_bytes = max_inflight_bytes
+        self.cache = cache
+
+        self._inflight_bytes = 0
+        self._inflight_condition = threading.Condition()
+
+    def download(self, manifest: BuildManifest, targets: list[tuple[ManifestEntry, str]]) -> None:
+        """
+        Downloads every manifest entry to its target file path. The target directories must already exist and the
+        target paths must be unique.
+
+        Args:
+            manifest (BuildManifest): The manifest the entries were listed from.
+            targets (list[tuple[ManifestEntry, str]]): A list of (entry, target file path) pairs.
+
+        Returns:
+            None
+        """
+        if not targets:
+            return
+
+        errors: list[BaseException] = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(targets))) as executor:
+            futures = [
+                executor.submit(self._download_entry, manifest=manifest, entry=entry, file_path=file_path)
+                for entry, file_path in targets
+            ]
+            for future in futures:
+                error = future.exception()
+                if error is not None:
+                    errors.append(error)
+
+        if self.cache:
+            self.cache.evict()
+
+        if errors:
+            self.logger.error(f"{len(errors)} of {len(targets)} artifact downloads failed.")
+            raise errors[0]
+
+    def _download_entry(self, manifest: BuildManifest, entry: ManifestEntry, file_path: str) -> None:
+        """
+        Downloads a single manifest entry, retrying on failure, while holding its size against the in-flight byte cap.
+        Entries that were not listed are skipped if they do not exist. Entries found in the cache are not downloaded.
+
+        Args:
+            manifest (BuildManifest): The manifest the entry was listed from.
+            entry (ManifestEntry): The entry to download.
+            file_path (str): The path the entry should be downloaded to.
+
+        Returns:
+            None
+        """
+        if self.cache and self.cache.fetch(entry=entry, file_path=file_path):
+            return
+
+        download_to_file = self._download_to_file
+        if self.retries > 0:
+            download_to_file = ignore_exceptions(
+                retry=self.retries,
+                retry_interval=self.retry_interval,
+                raise_final_exception=True,
+                logger=self.logger,
+            )(download_to_file)
+
+        size = self._acquire_bytes(size=entry.size)
+        try:
+            if not download_to_file(manifest=manifest, entry=entry, file_path=file_path):
+                os.remove(file_path)
+            elif self.cache:
+                self.cache.store(entry=entry, file_path=file_path)
+        except Exception:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+        finally:
+            self._release_bytes(size=size)
+
+    def _download_to_file(self, manifest: BuildManifest, entry: ManifestEntry, file_path: str) -> bool:
+        with open(file_path, "wb") as target:
+            try:
+                manifest.get_blob(entry).download_to_file(target)
+            except NotFound:
+                # An unlisted object that does not exist is expected, it must not be retried
+                if entry.listed:
+                    raise
+                self.logger.debug(f"{entry.name} does not exist, skipping...")
+                return False
+        self.logger.debug(f"{file_path} downloaded successfully...")
+        return True
+
+    def _acquire_bytes(self, size: Optional[int]) -> int:
+        size = size or 0
+        with self._inflight_condition:
+            while self._inflight_bytes > 0 and self._inflight_bytes + size > self.max_inflight_bytes:
+                self._inflight_condition.wait()
+            self._inflight_bytes += size
+        return size
+
+    def _release_bytes(self, size: int) -> None:
+        with self._inflight_condition:
+            self._inflight_bytes -= size
+            self._inflight_condition.notify_all()
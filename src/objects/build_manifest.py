@@ -0,0 +1,275 @@
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+from typing import Optional
+
+from simple_logger.logger import get_logger
+
+# Only request the object metadata the manifest keeps, this keeps listing pages small for large artifact trees.
+MANIFEST_LIST_FIELDS = "items(name,size,generation,md5Hash),nextPageToken"
+STEP_LIST_FIELDS = "prefixes,nextPageToken"
+
+ARTIFACT_DISCOVERY_FULL = "full"
+ARTIFACT_DISCOVERY_TARGETED = "targeted"
+ARTIFACT_DISCOVERY_MODES = (ARTIFACT_DISCOVERY_FULL, ARTIFACT_DISCOVERY_TARGETED)
+
+# The files stored directly in every step directory, fetched without listing in targeted discovery
+STEP_FILES = ("finished.json", "build-log.txt")
+
+# Globs relative to a step directory, matching any file with "junit" in its name under the step artifacts
+DEFAULT_JUNIT_PATTERNS = ("artifacts/*junit*", "artifacts/**/*junit*")
+DEFAULT_LISTING_WORKERS = 8
+
+GLOB_WILDCARD_REGEX = re.compile(r"[*?\[{]")
+
+
+@dataclass(frozen=True)
+class ManifestEntry:
+    """
+    A single object found while listing the artifacts of a build.
+
+    Attributes:
+        name (str): The full object name in the GCS bucket.
+        size (Optional[int]): The size of the object in bytes.
+        generation (Optional[int]): The GCS generation of the object.
+        md5_hash (Optional[str]): The base64 encoded MD5 hash of the object.
+        step (str): The step directory the object belongs to. Empty if the object is not inside a step directory.
+        relative_path (str): The path of the object relative to its step directory.
+        listed (bool): False if the object was not listed, in which case it may not exist.
+    """
+
+    name: str
+    size: Optional[int]
+    generation: Optional[int]
+    md5_hash: Optional[str]
+    step: str
+    relative_path: str
+    listed: bool = True
+
+    @property
+    def filename(self) -> str:
+        return self.relative_path.split("/")[-1]
+
+
+class BuildManifest:
+    def __init__(self, storage_client: Any, gcs_bucket: str, prefix: str) -> None:
+        """
+        Constructs the BuildManifest object. The artifacts prefix of a build is listed exactly once and the result is
+        shared by step discovery, log downloads and JUnit downloads.
+
+        Args:
+            storage_client (Any): The storage client used to list the artifacts from GCS.
+            gcs_bucket (str): The GCS bucket that job logs are stored in.
+            prefix (str): The artifacts prefix of the build, ending in the safe job name directory.
+        """
+        self.logger = get_logger(__name__)
+
+        self.storage_client = storage_client
+        self.gcs_bucket = gcs_bucket
+        self.prefix = prefix if prefix.endswith("/") else f"{prefix}/"
+
+        self.entries: list[ManifestEntry] = []
+        self._entries_by_step: dict[str, list[ManifestEntry]] = {}
+
+        self._load()
+        self.logger.info(f"Listed {len(self.entries)} objects under {self.prefix}")
+
+    def _load(self) -> None:
+        """
+        Lists every object under the artifacts prefix.
+
+        Returns:
+            None
+        """
+        for blob in self.storage_client.list_blobs(self.gcs_bucket, prefix=self.prefix, fields=MANIFEST_LIST_FIELDS):
+            self._add_entry(entry=self._to_entry(blob=blob))
+
+    def _add_entry(self, entry: ManifestEntry) -> None:
+        self.entries.append(entry)
+        if entry.step:
+            self._entries_by_step.setdefault(entry.step, []).append(entry)
+
+    def _to_entry(self, blob: Any) -> ManifestEntry:
+        """
+        Converts a listed blob into a ManifestEntry.
+
+        Args:
+            blob (Any): A blob returned by the storage client listing.
+
+        Returns:
+            ManifestEntry: The manifest entry for the blob.
+        """
+        path = blob.name[len(self.prefix) :] if blob.name.startswith(self.prefix) else blob.name
+        step, _, relative_path = path.partition("/")
+        if not relative_path:
+            step, relative_path = "", path
+
+        return ManifestEntry(
+            name=blob.name,
+            size=blob.size,
+            generation=blob.generation,
+            md5_hash=blob.md5_hash,
+            step=step,
+            relative_path=relative_path,
+        )
+
+    @property
+    def steps(self) -> list[str]:
+        """
+        Returns:
+            list[str]: The step directories found in the build, in listing order.
+        """
+        return list(self._entries_by_step)
+
+    def get_step_entries(self, step: str) -> list[ManifestEntry]:
+        """
+        Args:
+            step (str): The name of the step.
+
+        Returns:
+            list[ManifestEntry]: Every object found under the step directory.
+        """
+        return self._entries_by_step.get(step, [])
+
+    def get_step_file(self, step: str, filename: str) -> Optional[ManifestEntry]:
+        """
+        Finds a file stored directly in a step directory (e.g. "finished.json").
+
+        Args:
+            step (str): The name of the step.
+            filename (str): The name of the file.
+
+        Returns:
+            Optional[ManifestEntry]: The manifest entry if the file exists, otherwise None.
+        """
+        for entry in self.get_step_entries(step):
+            if entry.relative_path == filename:
+                return entry
+        return None
+
+    def find_files(self, substring: str) -> list[ManifestEntry]:
+        """
+        Finds every object inside a step directory whose filename contains the given substring.
+
+        Args:
+            substring (str): The substring to search filenames for (e.g. "junit").
+
+        Returns:
+            list[ManifestEntry]: The matching manifest entries, in listing order.
+        """
+        return [entry for entry in self.entries if entry.step and substring in entry.filename]
+
+    def get_blob(self, entry: ManifestEntry) -> Any:
+        """
+        Builds a blob handle for a manifest entry, pinned to the listed generation so the downloaded content matches
+        the manifest.
+
+        Args:
+            entry (ManifestEntry): The manifest entry to build the blob handle for.
+
+        Returns:
+            Any: A blob object that can be downloaded.
+        """
+        return self.storage_client.bucket(self.gcs_bucket).blob(entry.name, generation=entry.generation)
+
+
+class TargetedBuildManifest(BuildManifest):
+    def __init__(
+        self,
+        storage_client: Any,
+        gcs_bucket: str,
+        prefix: str,
+        junit_patterns: tuple[str, ...] = DEFAULT_JUNIT_PATTERNS,
+        max_workers: int = DEFAULT_LISTING_WORKERS,
+    ) -> None:
+        """
+        Constructs the TargetedBuildManifest object. Instead of listing the whole artifacts tree, the steps are found
+        with a single delimiter listing, the well-known step files are added without being listed and only the paths
+        matching the JUnit patterns are listed. Large unrelated trees (e.g. must-gathers) are never enumerated.
+
+        Args:
+            storage_client (Any): The storage client used to list the artifacts from GCS.
+            gcs_bucket (str): The GCS bucket that job logs are stored in.
+            prefix (str): The artifacts prefix of the build, ending in the safe job name directory.
+            junit_patterns (tuple[str, ...]): Glob patterns, relative to a step directory, of the JUnit files to list.
+            max_workers (int): The maximum number of steps listed at the same time.
+        """
+        self.junit_patterns = junit_patterns
+        self.max_workers = max(1, max_workers)
+        super().__init__(storage_client=storage_client, gcs_bucket=gcs_bucket, prefix=prefix)
+
+    def _load(self) -> None:
+        """
+        Lists the steps and the JUnit files of every step.
+
+        Returns:
+            None
+        """
+        steps = self._list_steps()
+        if not steps:
+            return
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(steps))) as executor:
+            junit_entries = list(executor.map(self._list_junit_entries, steps))
+
+        for step, step_junit_entries in zip(steps, junit_entries):
+            for filename in STEP_FILES:
+                self._add_entry(
+                    entry=ManifestEntry(
+                        name=f"{self.prefix}{step}/{filename}",
+                        size=None,
+                        generation=None,
+                        md5_hash=None,
+                        step=step,
+                        relative_path=filename,
+                        listed=False,
+                    ),
+                )
+            for entry in step_junit_entries:
+                self._add_entry(entry=entry)
+
+    def _list_steps(self) -> list[str]:
+        """
+        Lists the step directories directly under the artifacts prefix without listing their content.
+
+        Returns:
+            list[str]: The names of the step directories, sorted.
+        """
+        blobs = self.storage_client.list_blobs(
+            self.gcs_bucket,
+            prefix=self.prefix,
+            delimiter="/",
+            fields=STEP_LIST_FIELDS,
+        )
+
+        # The prefixes are only populated once every page has been read
+        for _ in blobs:
+            pass
+
+        return sorted(prefix[len(self.prefix) :].rstrip("/") for prefix in blobs.prefixes)
+
+    def _list_junit_entries(self, step: str) -> list[ManifestEntry]:
+        """
+        Lists the objects of a step matching any of the JUnit patterns. Each pattern is listed from its longest literal
+        prefix, so only the subpaths that can hold JUnit files are enumerated.
+
+        Args:
+            step (str): The name of the step.
+
+        Returns:
+            list[ManifestEntry]: The matching manifest entries, without duplicates.
+        """
+        step_prefix = f"{self.prefix}{step}/"
+        entries: dict[str, ManifestEntry] = {}
+        for pattern in self.junit_patterns:
+            literal_prefix = GLOB_WILDCARD_REGEX.split(pattern, maxsplit=1)[0]
+            for blob in self.storage_client.list_blobs(
+                self.gcs_bucket,
+                prefix=f"{step_prefix}{literal_prefix}",
+                match_glob=f"{step_prefix}{pattern}",
+                fields=MANIFEST_LIST_FIELDS,
+            ):
+                if blob.name not in entries:
+                    entries[blob.name] = self._to_entry(blob=blob)
+        return list(entries.values())
@@ -0,0 +1,140 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Any
+from typing import Optional
+from urllib.error import HTTPError
+from urllib.request import Request
+from urllib.request import urlopen
+
+from simple_logger.logger import get_logger
+
+DEFAULT_CONFIG_FETCH_TIMEOUT = 10
+
+LOGGER = get_logger(name=__name__)
+
+
+class ConfigCache:
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        timeout: float = DEFAULT_CONFIG_FETCH_TIMEOUT,
+    ) -> None:
+        """
+        Constructs the ConfigCache object. Used to fetch remote firewatch configs. If a cache directory is set, the last
+        good copy of each URL is kept on disk and revalidated with ETag/If-Modified-Since, so an unchanged config is
+        not downloaded again. When the config host is slow or down, the cached copy is used and a warning is logged,
+        even though it may be stale.
+
+        Args:
+            cache_dir (Optional[str]): The directory cached configs are stored in. The cache is disabled if not set.
+            timeout (float): The number of seconds to wait for the config host before giving up.
+        """
+        self.cache_dir = cache_dir
+        self.timeout = timeout
+
+    def _get_paths(self, cache_dir: str, url: str) -> tuple[str, str]:
+        """
+        Args:
+            cache_dir (str): The directory cached configs are stored in.
+            url (str): The URL of the config.
+
+        Returns:
+            tuple[str, str]: The paths of the cached config content and of its metadata.
+        """
+        key = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(cache_dir, f"{key}.config"), os.path.join(cache_dir, f"{key}.meta.json")
+
+    def _read_cached(self, url: str) -> tuple[Optional[str], dict[str, Any]]:
+        """
+        Reads the cached copy of a config.
+
+        Args:
+            url (str): The URL of the config.
+
+        Returns:
+            tuple[Optional[str], dict[str, Any]]: The cached content (None if there is no cached copy) and its metadata.
+        """
+        if not self.cache_dir:
+            return None, {}
+
+        content_path, meta_path = self._get_paths(cache_dir=self.cache_dir, url=url)
+        try:
+            with open(content_path) as file:
+                content = file.read()
+            with open(meta_path) as file:
+                meta = json.load(file)
+        except (OSError, ValueError):
+            return None, {}
+        return content, meta
+
+    def _write_cached(self, url: str, content: str, meta: dict[str, Any]) -> None:
+        """
+        Stores a config and its metadata in the cache. Files are written to a temporary path first, so concurrent runs
+        never read a partial copy.
+
+        Args:
+            url (str): The URL of the config.
+            content (str): The config content.
+            meta (dict[str, Any]): The validators (ETag, Last-Modified) returned with the config.
+
+        Returns:
+            None
+        """
+        if not self.cache_dir:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            for path, data in zip(self._get_paths(cache_dir=self.cache_dir, url=url), (content, json.dumps(meta))):
+                fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+                with os.fdopen(fd, "w") as file:
+                    file.write(data)
+                os.replace(temp_path, path)
+        except OSError as ex:
+            LOGGER.warning(f"Unable to cache the firewatch config from {url}: {ex}")
+
+    def fetch(self, url: str) -> Optional[str]:
+        """
+        Fetches a remote config, revalidating the cached copy if there is one.
+
+        Args:
+            url (str): The URL of the config.
+
+        Returns:
+            Optional[str]: The config content, or None if it could not be fetched and no cached copy exists.
+        """
+        cached_content, meta = self._read_cached(url=url)
+
+        headers = {}
+        if cached_content is not None:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        try:
+            with urlopen(Request(url, headers=headers), timeout=self.timeout) as response:
+                content = response.read().decode("utf-8")
+                self._write_cached(
+                    url=url,
+                    content=content,
+                    meta={"etag": response.headers.get("ETag"), "last_modified": response.headers.get("Last-Modified")},
+                )
+                return content
+        except HTTPError as ex:
+            if ex.code == 304 and cached_content is not None:
+                LOGGER.info(f"Firewatch config at {url} is unchanged, using the cached copy.")
+                return cached_content
+            error: Exception = ex
+        except Exception as ex:
+            # URLError, timeouts and connection errors
+            error = ex
+
+        if cached_content is not None:
+            LOGGER.warning(f"Unable to fetch the firewatch config from {url} ({error}), using the last cached copy.")
+            return cached_content
+
+        LOGGER.error(f"Unable to fetch the firewatch config from {url}: {error}")
+        return None
@@ -0,0 +1,91 @@
+import hashlib
+import json
+import os
+import tempfile
+from collections.abc import Sequence
+from typing import Any
+from typing import Optional
+from typing import Union
+
+from simple_logger.logger import get_logger
+
+from src.objects.rule_defaults import RULE_DEFAULT_ENV_VARS
+
+CONFIG_SNAPSHOT_VERSION = 1
+DEFAULT_CONFIG_SNAPSHOT_PATH = "/tmp/firewatch-config.snapshot.json"
+
+# The config and the rule defaults are read from these environment variables, so they are part of the snapshot
+# checksum. Other FIREWATCH_* variables do not change the compiled rules.
+CONFIG_CHECKSUM_ENV_VARS = ("FIREWATCH_CONFIG", *RULE_DEFAULT_ENV_VARS.values())
+
+LOGGER = get_logger(name=__name__)
+
+
+def get_config_checksum(config_sources: Sequence[Union[str, bytes]]) -> str:
+    """
+    Computes the checksum of the inputs of a firewatch config: the raw config layers, $FIREWATCH_CONFIG and the
+    FIREWATCH_DEFAULT_* environment variables that rule defaults are read from.
+
+    Args:
+        config_sources (Sequence[Union[str, bytes]]): The raw content of every config layer, in merge order.
+
+    Returns:
+        str: The hex digest of the checksum.
+    """
+    checksum = hashlib.sha256(f"v{CONFIG_SNAPSHOT_VERSION}".encode())
+    for config_source in config_sources:
+        data = config_source.encode() if isinstance(config_source, str) else config_source
+        checksum.update(len(data).to_bytes(8, "big"))
+        checksum.update(data)
+
+    for name in sorted(CONFIG_CHECKSUM_ENV_VARS):
+        if name in os.environ:
+            checksum.update(f"\0{name}={os.environ[name]}".encode())
+
+    return checksum.hexdigest()
+
+
+def write_config_snapshot(path: str, snapshot: dict[str, Any]) -> None:
+    """
+    Writes a config snapshot. The file is written to a temporary path first, so readers never see a partial snapshot.
+
+    Args:
+        path (str): The path of the snapshot file.
+        snapshot (dict[str, Any]): The snapshot content, as returned by Configuration.to_snapshot.
+
+    Returns:
+        None
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    with os.fdopen(fd, "w") as file:
+        json.dump({"version": CONFIG_SNAPSHOT_VERSION, **snapshot}, file, separators=(",", ":"))
+    os.replace(temp_path, path)
+
+    LOGGER.info(f"Firewatch config snapshot written to {path}")
+
+
+def load_config_snapshot(path: str, checksum: str) -> Optional[dict[str, Any]]:
+    """
+    Loads a config snapshot if it was compiled from the same config inputs.
+
+    Args:
+        path (str): The path of the snapshot file.
+        checksum (str): The checksum of the current config inputs, from get_config_checksum.
+
+    Returns:
+        Optional[dict[str, Any]]: The snapshot content, or None if the snapshot is missing, unreadable or stale.
+    """
+    try:
+        with open(path) as file:
+            snapshot = json.load(file)
+    except (OSError, ValueError) as ex:
+        LOGGER.warning(f"Unable to read the firewatch config snapshot at {path}, validating the config instead: {ex}")
+        return None
+
+    if snapshot.get("version") != CONFIG_SNAPSHOT_VERSION or snapshot.get("checksum") != checksum:
+        LOGGER.warning(f"The firewatch config snapshot at {path} is out of date, validating the config instead.")
+        return None
+
+    LOGGER.info(f"Loaded firewatch config snapshot from {path}")
+    return snapshot
@@ -1,20 +1,33 @@
 import json
 import os
-import fnmatch
+from collections.abc import Sequence
+from functools import cached_property
 from typing import Any
 from typing import Optional
 from typing import Union
+from urllib.parse import urlparse
 
 from simple_logger.logger import get_logger
 
+from src.objects.config_cache import ConfigCache
+from src.objects.config_cache import DEFAULT_CONFIG_FETCH_TIMEOUT
+from src.objects.config_snapshot import get_config_checksum
+from src.objects.config_snapshot import load_config_snapshot
 from src.objects.failure_rule import FailureRule
+from src.objects.failure_rule_matcher import FailureRuleMatcher
+from src.objects.failure_rule_matcher import StepPatternIndex
 from src.objects.jira_base import Jira
 from src.objects.rule import Rule
+from src.objects.rule_defaults import RuleDefaults
 
 
-def read_base_config_file(path: str) -> str:
+def read_base_config_file(path: str, config_cache: Optional[ConfigCache] = None) -> str:
     from urllib.request import urlopen
 
+    # Remote configs are fetched with a timeout, and through the cache if one is set
+    if urlparse(path).scheme in ("http", "https"):
+        return (config_cache or ConfigCache()).fetch(url=path)  # type: ignore
+
     try:
         response = urlopen(path)
         response_data = response.read()
@@ -35,6 +48,51 @@ def read_base_config_file(path: str) -> str:
     return None  # type: ignore
 
 
+def merge_config_layers(config_layers: Sequence[dict[Any, Any]]) -> dict[Any, Any]:
+    """
+    Merges firewatch config layers, from the lowest priority (e.g. a shared base config) to the highest (e.g. the
+    $FIREWATCH_CONFIG environment variable).
+
+    Top-level keys of a higher layer replace those of the layers below it. A rule of a lower layer is kept unless a
+    rule of a higher layer has the same step or a step pattern matching it.
+
+    Args:
+        config_layers (Sequence[dict[Any, Any]]): The config layers, lowest priority first.
+
+    Returns:
+        dict[Any, Any]: A dictionary object representing the merged config data.
+    """
+    config_data: dict[Any, Any] = {}
+    for config_layer in config_layers:
+        lower_config_data = config_data
+        config_data = {**lower_config_data, **config_layer}
+
+        # Include patterns from the lower layers and extend the rules of this layer
+        for key in ["failure_rules", "success_rules"]:
+            if key not in lower_config_data or key not in config_layer:
+                continue
+
+            rules = list(config_data[key])
+            config_data[key] = rules
+
+            # The steps and step patterns that override rules of the lower layers, compiled once for every lookup
+            overriding_steps = {rule.get("step") for rule in rules}
+            overriding_patterns: StepPatternIndex[str] = StepPatternIndex()
+            for step in overriding_steps:
+                if isinstance(step, str):
+                    overriding_patterns.add(pattern=step, value=step)
+
+            for rule in lower_config_data[key]:
+                step = rule.get("step")
+                if step and step not in overriding_steps and not overriding_patterns.matches(step):
+                    rules.append(rule)
+                    # Also override later rules of the lower layers with this step
+                    overriding_steps.add(step)
+                    overriding_patterns.add(pattern=step, value=step)
+
+    return config_data
+
+
 class Configuration:
     def __init__(
         self,
@@ -44,8 +102,12 @@ class Configuration:
         keep_job_dir: bool,
         verbose_test_failure_reporting: bool,
         verbose_test_failure_reporting_ticket_limit: Optional[int] = 10,
-        config_file_path: Union[str, None] = None,
+        config_file_path: Union[str, Sequence[str], None] = None,
         additional_lables_file: Optional[str] = None,
+        config_cache_dir: Optional[str] = None,
+        config_fetch_timeout: float = DEFAULT_CONFIG_FETCH_TIMEOUT,
+        config_snapshot_path: Optional[str] = None,
+        job_name: Optional[str] = None,
     ):
         """
         Constructs the Configuration object. This class is mainly used to validate the firewatch configuration given.
@@ -56,49 +118,219 @@ class Configuration:
             keep_job_dir (bool): If true, firewatch will not delete the job directory (/tmp/12345) that is created to hold logs and results for a job following execution.
             verbose_test_failure_reporting (bool): If true, firewatch will report all test failures found in the job.
             verbose_test_failure_reporting_ticket_limit (Optional[int]): Used as a safeguard to prevent firewatch from filing too many bugs. If verbose_test_reporting is set to true, this value will be used to limit the number of bugs filed. Defaults to 10.
-            config_file_path (Union[str, None], optional): The firewatch config can be stored in a file or an environment var. Defaults to None.
+            config_file_path (Union[str, Sequence[str], None], optional): The firewatch config can be stored in a file or an environment var. Several files are merged in order, later files overriding earlier ones. Defaults to None.
             additional_lables_file (Optional[str]): If set, the filepath provided will be parsed for additional labels. Each label should be separated by a new line.
+            config_cache_dir (Optional[str]): The directory remote config files are cached in. The cache is disabled if not set.
+            config_fetch_timeout (float): The number of seconds to wait for a remote config file before using the cached copy, or giving up if there is none.
+            config_snapshot_path (Optional[str]): The path of a snapshot written by "firewatch config compile". If it was compiled from the same config, the rules are loaded from it without being validated again.
+            job_name (Optional[str]): The name of the job being reported. Rules scoped to other jobs are skipped before they are built. If not set, every rule is built.
         """
         self.logger = get_logger(__name__)
 
         self.jira = jira
         self.default_jira_project = self._get_default_jira_project()
+        self.rule_defaults = RuleDefaults.from_env()
         self.fail_with_test_failures = fail_with_test_failures
         self.fail_with_pod_failures = fail_with_pod_failures
         self.keep_job_dir = keep_job_dir
         self.additional_labels_file = additional_lables_file
         self.verbose_test_failure_reporting = verbose_test_failure_reporting
         self.verbose_test_failure_reporting_ticket_limit = verbose_test_failure_reporting_ticket_limit
-        self.config_data = self._get_config_data(base_config_file_path=config_file_path)
-        self.success_rules = self._get_success_rules(
-            rules_list=self.config_data.get("success_rules"),
+        self.config_cache = ConfigCache(cache_dir=config_cache_dir, timeout=config_fetch_timeout)
+        self.job_name = job_name
+        self._failure_rule_matcher: Optional[FailureRuleMatcher] = None
+
+        config_sources = self._read_config_sources(base_config_file_path=config_file_path)
+        self.config_checksum = get_config_checksum(config_sources=config_sources)
+        snapshot = (
+            load_config_snapshot(path=config_snapshot_path, checksum=self.config_checksum)
+            if config_snapshot_path
+            else None
         )
-        self.failure_rules = self._get_failure_rules(
-            rules_list=self.config_data.get("failure_rules"),
+
+        self.success_rules: Optional[list[Rule]]
+        self.failure_rules: Optional[list[FailureRule]]
+        if snapshot:
+            self.config_data = snapshot["config_data"]
+            self.success_rules = [
+                Rule.from_snapshot(rule) for rule in self._get_job_rules(rules_list=snapshot["success_rules"]) or []
+            ] or None
+            self.failure_rules = self._get_failure_rules(rules_list=snapshot["failure_rules"], from_snapshot=True)
+            self._failure_rule_matcher = FailureRuleMatcher(
+                rules=self.failure_rules,
+                step_regexes=snapshot["step_regexes"],
+            )
+        else:
+            self.config_data = self._get_config_data(
+                base_config_file_path=config_file_path,
+                config_sources=config_sources,
+            )
+            self.success_rules = self._get_success_rules(
+                rules_list=self._get_job_rules(rules_list=self.config_data.get("success_rules")),
+            )
+            self.failure_rules = self._get_failure_rules(rules_list=self.config_data.get("failure_rules"))
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """
+        Builds the content of a config snapshot: the validated rules with defaults applied and the translated step
+        patterns of the failure rule matcher.
+
+        Returns:
+            dict[str, Any]: The snapshot content, to be written with write_config_snapshot.
+        """
+        return {
+            "checksum": self.config_checksum,
+            "config_data": self.config_data,
+            "success_rules": [rule.to_snapshot() for rule in self.success_rules or []],
+            "failure_rules": [rule.to_snapshot() for rule in self.failure_rules or []],
+            "step_regexes": self.failure_rule_matcher.get_step_regexes(),
+        }
+
+    @cached_property
+    def default_failure_rule(self) -> FailureRule:
+        """
+        The rule used for failures that do not match any failure rule. It is built once and shared by those failures.
+
+        Returns:
+            FailureRule: A rule reporting to the default Jira project.
+        """
+        return FailureRule(
+            rule_dict={
+                "step": "!none",
+                "failure_type": "!none",
+                "classification": "!none",
+                "jira_project": self.default_jira_project,
+            },
+            defaults=self.rule_defaults,
         )
 
+    @property
+    def failure_rule_matcher(self) -> FailureRuleMatcher:
+        """
+        The compiled matcher of the failure rules. It is built on first use and rebuilt if failure_rules is replaced.
+
+        Returns:
+            FailureRuleMatcher: The matcher of the failure rules.
+        """
+        if self._failure_rule_matcher is None or self._failure_rule_matcher.rules is not self.failure_rules:
+            self._failure_rule_matcher = FailureRuleMatcher(rules=self.failure_rules)
+        return self._failure_rule_matcher
+
+    def _get_job_rules(self, rules_list: Optional[list[dict[Any, Any]]]) -> Optional[list[dict[Any, Any]]]:
+        """
+        Filters out the rules scoped to other jobs, so only the rules that can apply to this job are built.
+
+        Args:
+            rules_list (Optional[list[dict[Any, Any]]]): The rules from the firewatch config.
+
+        Returns:
+            Optional[list[dict[Any, Any]]]: The rules without a "jobs" scope and the rules whose scope matches the job name, in configuration order.
+        """
+        if rules_list is None or not self.job_name:
+            return rules_list
+
+        # Every distinct job pattern is compiled and matched against the job name once
+        job_patterns: StepPatternIndex[str] = StepPatternIndex()
+        for rule in rules_list:
+            for pattern in self._get_rule_job_patterns(rule=rule) or []:
+                job_patterns.add(pattern=pattern, value=pattern)
+        matching_patterns = set(job_patterns.match(self.job_name))
+
+        job_rules = []
+        for rule in rules_list:
+            patterns = self._get_rule_job_patterns(rule=rule)
+            if patterns is None or matching_patterns.intersection(patterns):
+                job_rules.append(rule)
+
+        self.logger.debug(f"{len(job_rules)} of {len(rules_list)} rules apply to job {self.job_name}")
+        return job_rules
+
+    @staticmethod
+    def _get_rule_job_patterns(rule: dict[Any, Any]) -> Optional[list[str]]:
+        """
+        Args:
+            rule (dict[Any, Any]): A rule from the firewatch config.
+
+        Returns:
+            Optional[list[str]]: The job name patterns of the rule, or None if it is not scoped or its scope is invalid. Invalid scopes are reported when the rule is built.
+        """
+        jobs = rule.get("jobs")
+        if isinstance(jobs, str):
+            return [jobs]
+        if isinstance(jobs, list) and jobs and all(isinstance(job, str) for job in jobs):
+            return jobs
+        return None
+
+    def _expand_job_scopes(self, config_layer: dict[Any, Any]) -> dict[Any, Any]:
+        """
+        Adds the rules of the "job_scopes" of a config layer to its "failure_rules" and "success_rules". Each rule is
+        scoped to the jobs of its scope unless it defines "jobs" itself.
+        Will exit with code 1 if a scope is not properly formatted.
+
+        Args:
+            config_layer (dict[Any, Any]): A config layer.
+
+        Returns:
+            dict[Any, Any]: The config layer without "job_scopes".
+        """
+        job_scopes = config_layer.get("job_scopes")
+        if job_scopes is None:
+            return config_layer
+
+        if not isinstance(job_scopes, list):
+            self.logger.error(f'Value for "job_scopes" is not a list in firewatch config: "{job_scopes}"')
+            exit(1)
+
+        config_layer = {key: value for key, value in config_layer.items() if key != "job_scopes"}
+        for job_scope in job_scopes:
+            if not isinstance(job_scope, dict) or self._get_rule_job_patterns(rule=job_scope) is None:
+                self.logger.error(
+                    f'Each of "job_scopes" must be a dictionary with "jobs" set to a string or a non-empty list of strings: "{job_scope}"',
+                )
+                exit(1)
+
+            for key in ["failure_rules", "success_rules"]:
+                if key in job_scope:
+                    config_layer[key] = list(config_layer.get(key, [])) + [
+                        {"jobs": job_scope["jobs"], **rule} for rule in job_scope[key]
+                    ]
+
+        return config_layer
+
     def _get_failure_rules(
         self,
         rules_list: Optional[list[dict[Any, Any]]],
-    ) -> Optional[list[FailureRule]]:
+        from_snapshot: bool = False,
+    ) -> list[FailureRule]:
         """
-        Creates a list of FailureRule objects.
+        Creates a list of FailureRule objects from the rules that apply to this job.
+        Will exit with code 1 if the firewatch config does not contain any failure rules.
+
+        Args:
+            rules_list (Optional[list[dict[Any, Any]]]): The failure rules from the firewatch config or a config snapshot, before they are scoped to the job.
+            from_snapshot (bool): If true, the rules come from a config snapshot and are not validated again.
 
         Returns:
-            Optional[list[FailureRule]]: A list of FailureRule objects.
+            list[FailureRule]: A list of FailureRule objects. Empty if every rule is scoped to other jobs, failures are then reported with the default failure rule.
         """
-        if rules_list is not None:
-            rules = []
-            for line in rules_list:
-                rules.append(FailureRule(rule_dict=line))
+        if not rules_list:
+            self.logger.error(
+                'Firewatch config does not contain any "failure_rules". Please populate the configuration and try again.',
+            )
+            exit(1)
 
-            if len(rules) > 0:
-                return rules
+        rules = []
+        for line in self._get_job_rules(rules_list=rules_list) or []:
+            if from_snapshot:
+                rules.append(FailureRule.from_snapshot(line))
+            else:
+                rules.append(FailureRule(rule_dict=line, defaults=self.rule_defaults))
 
-        self.logger.error(
-            'Firewatch config does not contain any "failure_rules". Please populate the configuration and try again.',
-        )
-        exit(1)
+        if len(rules) < 1:
+            self.logger.info(
+                f"No failure rules apply to job {self.job_name}, failures will be reported with the default failure rule",
+            )
+        return rules
 
     def _get_success_rules(
         self,
@@ -113,7 +345,7 @@ class Configuration:
         if rules_list is not None:
             rules = []
             for line in rules_list:
-                rules.append(Rule(rule_dict=line))
+                rules.append(Rule(rule_dict=line, defaults=self.rule_defaults))
 
             if len(rules) > 0:
                 return rules
@@ -145,53 +377,72 @@ class Configuration:
             )
             exit(1)
 
-    def _get_config_data(self, base_config_file_path: Optional[str]) -> dict[Any, Any]:
+    def _read_config_sources(self, base_config_file_path: Union[str, Sequence[str], None]) -> list[Union[str, bytes]]:
         """
-        Gets the config data from either a configuration file or from the FIREWATCH_CONFIG environment variable or
-        both.
-        Will exit with code 1 if both a config file isn't provided (or isn't readable) or the FIREWATCH_CONFIG environment variable isn't set.
-        The configuration file is considered as the basis of the configuration data,
-        And it will be overridden and expended by the additional set of rules that will be applied to the env var.
+        Reads the raw content of every config layer: the configuration files in the order given, then the
+        FIREWATCH_CONFIG environment variable.
+        Will exit with code 1 if a config file isn't readable.
 
         Args:
-            base_config_file_path (Optional[str]): The firewatch config can be stored in a file or url path.
+            base_config_file_path (Union[str, Sequence[str], None]): The file or url path, or a list of them, that the
+                firewatch config is stored in.
 
         Returns:
-            dict[Any, Any]: A dictionary object representing the firewatch config data.
+            list[Union[str, bytes]]: The raw content of the config layers, lowest priority first.
         """
-        base_config_str = ""
-        base_config_data = {}
-        steps_map = {}
+        if base_config_file_path is None:
+            config_file_paths: Sequence[str] = []
+        elif isinstance(base_config_file_path, str):
+            config_file_paths = [base_config_file_path]
+        else:
+            config_file_paths = base_config_file_path
 
-        if base_config_file_path is not None:
-            base_config_str = read_base_config_file(path=base_config_file_path)
-            if not base_config_str:
+        config_sources: list[Union[str, bytes]] = []
+        for config_file_path in config_file_paths:
+            config_str = read_base_config_file(path=config_file_path, config_cache=self.config_cache)
+            if not config_str:
                 self.logger.error(
-                    f"Unable to read configuration file at {base_config_file_path}."
+                    f"Unable to read configuration file at {config_file_path}."
                     f"\nPlease verify permissions/path and try again.",
                 )
                 exit(1)
+            config_sources.append(config_str)
 
-        # Verify that the config data is properly formatted JSON
-        try:
-            if base_config_str:
-                base_config_data = json.loads(base_config_str)
+        # Will update the config files with additional logic from env vars
+        config_sources.append(os.getenv("FIREWATCH_CONFIG") or "{}")
 
-            # Will update base config with additional logic from env vars
-            additional_config_data = json.loads(os.getenv("FIREWATCH_CONFIG") or "{}")
+        return config_sources
 
-        except json.decoder.JSONDecodeError as error:
-            self.logger.error(
-                "Firewatch config contains malformed JSON. Please check for missing or additional commas:",
-            )
-            self.logger.error(error)
-            self.logger.info(
-                'HINT: If there is a comma following the last rule item in the "rules" list, it should be removed.',
-            )
-            exit(1)
+    def _get_config_data(
+        self,
+        base_config_file_path: Union[str, Sequence[str], None],
+        config_sources: Optional[list[Union[str, bytes]]] = None,
+    ) -> dict[Any, Any]:
+        """
+        Gets the config data from either a configuration file or from the FIREWATCH_CONFIG environment variable or
+        both.
+        Will exit with code 1 if both a config file isn't provided (or isn't readable) or the FIREWATCH_CONFIG environment variable isn't set.
+        The configuration files are merged in the order given, each one overriding and extending the ones before it.
+        The FIREWATCH_CONFIG environment variable is applied last.
 
-        # If a step exists in base config, and mentioned by use, update and override it using unpack
-        config_data = {**base_config_data, **additional_config_data}
+        Args:
+            base_config_file_path (Union[str, Sequence[str], None]): The file or url path, or a list of them, that the
+                firewatch config is stored in.
+            config_sources (Optional[list[Union[str, bytes]]]): The config layers already read by _read_config_sources.
+                Read from base_config_file_path if not set.
+
+        Returns:
+            dict[Any, Any]: A dictionary object representing the firewatch config data.
+        """
+        if config_sources is None:
+            config_sources = self._read_config_sources(base_config_file_path=base_config_file_path)
+
+        config_layers = [
+            self._expand_job_scopes(config_layer=self._load_config_json(config_str=config_source))
+            for config_source in config_sources
+        ]
+
+        config_data = merge_config_layers(config_layers=config_layers)
 
         if not config_data:
             self.logger.error(
@@ -200,19 +451,26 @@ class Configuration:
             )
             exit(1)
 
-        # Include patterns from base config and expend user input
-        for key in ["failure_rules", "success_rules"]:
-            if key in config_data:
-                steps_map = {d.get("step"): d for d in config_data[key]}
-            if key in base_config_data:
-                for step_dict in base_config_data[key]:
-                    step = step_dict.get("step")
-                    if step and step not in steps_map.keys():
-                        # Check if user didn't mention a pattern that already overrides this step
-                        if not any(fnmatch.fnmatch(step, k) for k in steps_map.keys()):
-                            if key not in config_data:
-                                config_data[key] = step_dict
-                            else:
-                                config_data[key].append(step_dict)
-                            steps_map[step] = step_dict  # Also update the steps_map to include this step
-        return config_data  # type: ignore
+        return config_data
+
+    def _load_config_json(self, config_str: Union[str, bytes]) -> dict[Any, Any]:
+        """
+        Loads a config layer, exiting if it is not properly formatted JSON.
+
+        Args:
+            config_str (Union[str, bytes]): The JSON content of the config layer.
+
+        Returns:
+            dict[Any, Any]: A dictionary object representing the config layer.
+        """
+        try:
+            return json.loads(config_str)
+        except json.decoder.JSONDecodeError as error:
+            self.logger.error(
+                "Firewatch config contains malformed JSON. Please check for missing or additional commas:",
+            )
+            self.logger.error(error)
+            self.logger.info(
+                'HINT: If there is a comma following the last rule item in the "rules" list, it should be removed.',
+            )
+            exit(1)
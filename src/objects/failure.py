@@ -1,55 +1,39 @@
+from dataclasses import dataclass
+from dataclasses import field
+from typing import Literal
 from typing import Optional
+from typing import get_args
 
 from simple_logger.logger import get_logger
 
+LOGGER = get_logger(name=__name__)
 
+FailureType = Literal["pod_failure", "test_failure"]
+
+
+@dataclass(frozen=True, slots=True)
 class Failure:
-    def __init__(
-        self,
-        failed_step: str,
-        failure_type: str,
-        failed_test_name: Optional[str] = None,
-        failed_test_junit_path: Optional[str] = None,
-        ignore: bool = False,
-    ):
-        """
-        Initializes the Failure object.
-
-        Args:
-            failed_step (str): The failed step
-            failure_type (str): The failure type
-            failed_test_name (Optional[str], optional): The failed test name. Defaults to None.
-            failed_test_junit_path (Optional[str], optional): The path to the failed test's junit file. Defaults to None.
-            ignore (bool): Flag to indicate that the failure should be ignored.
-        """
-        self.logger = get_logger(__name__)
-
-        self.step = failed_step
-        self.failure_type = self._get_failure_type(failure_type)
-
-        # if the failure is a test failure, set additional attributes
-        if self.failure_type == "test_failure":
-            self.failed_test_name = failed_test_name
-            self.failed_test_junit_path = failed_test_junit_path
-
-        self.ignore = ignore
-
-    def _get_failure_type(self, failure_type: str) -> str:
-        """
-        Gets the failure type. Used to validate the value provided.
-
-        Args:
-            failure_type (str): Failure type.
-
-        Returns:
-            str: A string value representing failure type
-        """
-
-        valid_failure_types = ["pod_failure", "test_failure"]
-        if isinstance(failure_type, str) and (failure_type in valid_failure_types):
-            return failure_type
-        else:
-            self.logger.error(
-                f'Failure type "{failure_type}" is either not a string or not a valid failure type.',
+    """
+    A failure found in a prow job. Failures are immutable values, verbose runs create one for every failed test case.
+    The ignore flag is excluded from equality and hashing, so failures that differ only in ignore are duplicates.
+
+    Attributes:
+        step (str): The failed step.
+        failure_type (FailureType): The failure type, "pod_failure" or "test_failure".
+        failed_test_name (Optional[str]): The failed test name. Only set for test failures.
+        failed_test_junit_path (Optional[str]): The path to the failed test's junit file. Only set for test failures.
+        ignore (bool): Flag to indicate that the failure should be ignored.
+    """
+
+    step: str
+    failure_type: FailureType
+    failed_test_name: Optional[str] = None
+    failed_test_junit_path: Optional[str] = None
+    ignore: bool = field(default=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.failure_type not in get_args(FailureType):
+            LOGGER.error(
+                f'Failure type "{self.failure_type}" is either not a string or not a valid failure type.',
             )
             exit(1)
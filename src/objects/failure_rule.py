@@ -2,19 +2,35 @@ import fnmatch
 from typing import Any
 from typing import Optional
 
+from simple_logger.logger import get_logger
+
 from src.objects.failure import Failure
 from src.objects.rule import Rule
+from src.objects.rule_defaults import RuleDefaults
+
+LOGGER = get_logger(name=__name__)
 
 
 class FailureRule(Rule):
-    def __init__(self, rule_dict: dict[Any, Any]):
+    __slots__ = (
+        "step",
+        "failure_type",
+        "classification",
+        "group_name",
+        "group_priority",
+        "ignore",
+    )
+    SNAPSHOT_FIELDS = Rule.SNAPSHOT_FIELDS + __slots__
+
+    def __init__(self, rule_dict: dict[Any, Any], defaults: RuleDefaults):
         """
         Initializes the FailureRule object which inherits the Rule object.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a firewatch rule.
+            defaults (RuleDefaults): The values used for "!default", shared by the rules of a configuration.
         """
-        super().__init__(rule_dict=rule_dict)
+        super().__init__(rule_dict=rule_dict, defaults=defaults)
 
         self.step = self._get_step(rule_dict=rule_dict)
         self.failure_type = self._get_failure_type(rule_dict=rule_dict)
@@ -36,7 +52,7 @@ class FailureRule(Rule):
         step = rule_dict.get("step")
 
         if not step:
-            self.logger.error(
+            LOGGER.error(
                 f'Unable to find value for "step" in firewatch rule: "{rule_dict}"',
             )
             exit(1)
@@ -44,7 +60,7 @@ class FailureRule(Rule):
         if isinstance(step, str):
             return step
         else:
-            self.logger.error(
+            LOGGER.error(
                 f'Value for "step" is not a string in firewatch rule: "{rule_dict}"',
             )
             exit(1)
@@ -64,7 +80,7 @@ class FailureRule(Rule):
         failure_type = rule_dict.get("failure_type")
 
         if not failure_type:
-            self.logger.error(
+            LOGGER.error(
                 f'Unable to find value for "failure_type" in firewatch rule: "{rule_dict}"',
             )
             exit(1)
@@ -73,12 +89,12 @@ class FailureRule(Rule):
             if failure_type.lower() in valid_failure_types:
                 return failure_type.lower()
             else:
-                self.logger.error(
+                LOGGER.error(
                     f'Value for "failure_type" is not a valid failure type (pod_failure, test_failure, or all) in firewatch rule: "{rule_dict}"',
                 )
                 exit(1)
         else:
-            self.logger.error(
+            LOGGER.error(
                 f'Value for "failure_type" is not a string in firewatch rule: "{rule_dict}"',
             )
             exit(1)
@@ -96,7 +112,7 @@ class FailureRule(Rule):
         classification = rule_dict.get("classification")
 
         if not classification:
-            self.logger.error(
+            LOGGER.error(
                 f'Unable to find value for "classification" in firewatch rule: "{rule_dict}"',
             )
             exit(1)
@@ -104,7 +120,7 @@ class FailureRule(Rule):
         if isinstance(classification, str):
             return classification
         else:
-            self.logger.error(
+            LOGGER.error(
                 f'Value for "classification" is not a string in firewatch rule: "{rule_dict}"',
             )
             exit(1)
@@ -125,14 +141,14 @@ class FailureRule(Rule):
             if isinstance(group_name, str) or not group_name:
                 return group_name
 
-            self.logger.error(
+            LOGGER.error(
                 f'Value for "name" in the "group" key is not a string in firewatch rule: "{rule_dict}"',
             )
             exit(1)
         elif not rule_dict.get("group"):
             return None
         else:
-            self.logger.error(
+            LOGGER.error(
                 f'Value for "group" is not a dictionary in firewatch rule: "{rule_dict}"',
             )
             exit(1)
@@ -152,14 +168,14 @@ class FailureRule(Rule):
             if isinstance(group_priority, int) or not group_priority:
                 return group_priority
 
-            self.logger.error(
+            LOGGER.error(
                 f'Value for "priority" in the "group" key is not a integer in firewatch rule: "{rule_dict}"',
             )
             exit(1)
         elif not rule_dict.get("group"):
             return None
         else:
-            self.logger.error(
+            LOGGER.error(
                 f'Value for "group" is not a dictionary in firewatch rule: "{rule_dict}"',
             )
             exit(1)
@@ -183,7 +199,7 @@ class FailureRule(Rule):
         elif isinstance(ignore, bool):
             return ignore
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "ignore" is not a boolean or string value in firewatch rule: "{rule_dict}"',
         )
         exit(1)
@@ -0,0 +1,122 @@
+import fnmatch
+import re
+from collections.abc import Iterator
+from typing import Generic
+from typing import Optional
+from typing import TypeVar
+
+from src.objects.failure import Failure
+from src.objects.failure_rule import FailureRule
+
+STEP_WILDCARD_REGEX = re.compile(r"[*?\[]")
+
+T = TypeVar("T")
+
+
+class StepPatternIndex(Generic[T]):
+    def __init__(self) -> None:
+        """
+        Constructs the StepPatternIndex object. Used to find the step patterns (fnmatch syntax) that match a step name
+        without running fnmatch against every pattern.
+
+        Plain step names are indexed by name. Patterns are grouped by the literal text before their first wildcard and
+        matched with a precompiled regular expression, so a lookup only checks the groups whose prefix starts the step.
+        """
+        self._exact: dict[str, list[tuple[int, T]]] = {}
+        self._patterns: dict[str, list[tuple[int, T, re.Pattern[str]]]] = {}
+        self._size = 0
+
+    def add(self, pattern: str, value: T, regex: Optional[str] = None) -> None:
+        """
+        Adds a step pattern to the index.
+
+        Args:
+            pattern (str): The step name or fnmatch pattern.
+            value (T): The value returned when the pattern matches.
+            regex (Optional[str]): The pattern already translated to a regular expression, e.g. loaded from a config
+                snapshot. Translated from pattern if not set.
+
+        Returns:
+            None
+        """
+        match = STEP_WILDCARD_REGEX.search(pattern)
+        if match is None:
+            self._exact.setdefault(pattern, []).append((self._size, value))
+        else:
+            self._patterns.setdefault(pattern[: match.start()], []).append(
+                (self._size, value, re.compile(regex or fnmatch.translate(pattern))),
+            )
+        self._size += 1
+
+    def _iter_matches(self, step: str) -> Iterator[tuple[int, T]]:
+        yield from self._exact.get(step, [])
+        for length in range(len(step) + 1):
+            for index, value, pattern in self._patterns.get(step[:length], []):
+                if pattern.match(step):
+                    yield index, value
+
+    def match(self, step: str) -> list[T]:
+        """
+        Args:
+            step (str): The step name.
+
+        Returns:
+            list[T]: The values of every pattern matching the step, in the order they were added.
+        """
+        return [value for _, value in sorted(self._iter_matches(step), key=lambda match: match[0])]
+
+    def matches(self, step: str) -> bool:
+        """
+        Args:
+            step (str): The step name.
+
+        Returns:
+            bool: True if any pattern matches the step.
+        """
+        return next(self._iter_matches(step), None) is not None
+
+
+class FailureRuleMatcher:
+    def __init__(self, rules: Optional[list[FailureRule]], step_regexes: Optional[dict[str, str]] = None) -> None:
+        """
+        Constructs the FailureRuleMatcher object. The step patterns of the rules are compiled once, so finding the
+        rules a failure matches does not run fnmatch against every rule.
+
+        Args:
+            rules (Optional[list[FailureRule]]): The failure rules to match, in configuration order.
+            step_regexes (Optional[dict[str, str]]): Step patterns already translated to regular expressions, as
+                returned by get_step_regexes.
+        """
+        self.rules = rules
+        self._index: StepPatternIndex[FailureRule] = StepPatternIndex()
+
+        step_regexes = step_regexes or {}
+        for rule in rules or []:
+            self._index.add(pattern=rule.step, value=rule, regex=step_regexes.get(rule.step))
+
+    def get_step_regexes(self) -> dict[str, str]:
+        """
+        Returns:
+            dict[str, str]: The step patterns of the rules mapped to their regular expressions.
+        """
+        return {
+            rule.step: fnmatch.translate(rule.step)
+            for rule in self.rules or []
+            if STEP_WILDCARD_REGEX.search(rule.step)
+        }
+
+    def match(self, failure: Failure) -> list[FailureRule]:
+        """
+        Finds the rules a failure matches, the same rules FailureRule.matches_failure would accept.
+
+        Args:
+            failure (Failure): The failure to match.
+
+        Returns:
+            list[FailureRule]: The matching rules, in configuration order.
+        """
+        return [
+            rule
+            for rule in self._index.match(failure.step)
+            if rule.failure_type == failure.failure_type or rule.failure_type == "all"
+        ]
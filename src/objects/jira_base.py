@@ -1,6 +1,9 @@
 import json
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 from typing import Optional
+from typing import Union
 
 from jira import Issue
 from jira import JIRA
@@ -11,17 +14,37 @@ from simple_logger.logger import get_logger
 from src.objects.jira_adf import closed_by_firewatch_adf
 from src.objects.jira_adf import plain_text_to_adf_doc
 from src.objects.jira_adf import sanitize_jira_adf_doc
+from src.objects.jira_issue_ref import IssueRef
+from src.objects.jira_metadata_cache import DEFAULT_JIRA_METADATA_CACHE_TTL
+from src.objects.jira_metadata_cache import JiraMetadataCache
 
 LOGGER = get_logger(name=__name__)
 
+# The custom field holding the additional assignees of an issue
+ADDITIONAL_ASSIGNEES_FIELD = "customfield_10465"
+# Fields set in the create payload that Jira may reject depending on the project configuration
+OPTIONAL_CREATE_FIELDS = ("parent", "assignee", ADDITIONAL_ASSIGNEES_FIELD)
+# The maximum number of concurrent user lookups and watcher calls for a single issue
+JIRA_USER_WORKERS = 8
+# The number of issues requested per page of a search
+SEARCH_PAGE_SIZE = 100
+
 
 class Jira:
-    def __init__(self, jira_config_path: str) -> None:
+    def __init__(
+        self,
+        jira_config_path: str,
+        metadata_cache_dir: Optional[str] = None,
+        metadata_cache_ttl: float = DEFAULT_JIRA_METADATA_CACHE_TTL,
+    ) -> None:
         """
         Constructs the Jira object used for authenticating and interacting with a Jira server.
 
         Args:
             jira_config_path (str): The path to the configuration file that hold authentication credentials.
+            metadata_cache_dir (Optional[str]): The directory security levels, transition IDs and account IDs
+                are cached in between runs. None only caches them for the lifetime of this object.
+            metadata_cache_ttl (float): The number of seconds cached Jira metadata is used for.
         """
         self.logger = LOGGER
         self.proxies: dict[str, str] = {}
@@ -48,6 +71,9 @@ class Jira:
             jira_kwargs["proxies"] = self.proxies
 
         self.connection = JIRA(**jira_kwargs)
+        self.metadata_cache = JiraMetadataCache(
+            server_url=self.url, cache_dir=metadata_cache_dir, ttl=metadata_cache_ttl
+        )
 
         LOGGER.info("Jira authentication successful...")
 
@@ -71,7 +97,9 @@ class Jira:
         close_issue: Optional[bool] = False,
     ) -> Issue:
         """
-        Used to create a Jira issue and attach any given files to that issue.
+        Used to create a Jira issue and attach any given files to that issue. The epic, assignee and additional
+        assignees are set in the create payload, so only attachments, watchers and closing the issue need requests
+        after it is created. If Jira rejects one of them in the payload, it is set with a separate request instead.
 
         Args:
             project (str): The Jira project the issue should be filed under.
@@ -86,6 +114,8 @@ class Jira:
             assignee (Optional[str]): An optional string for the assignee of an issue. Should be the email address of the user.
             priority (Optional[str]): An optional string representing the desired priority of the issue being created.
             security_level (Optional[str]): An optional string representing the desired security level of the issue being created.
+            watchers (Optional[list[str]]): An optional list of email addresses of users to add as watchers of the issue.
+            additional_assignees (Optional[list[str]]): An optional list of email addresses of users to set as additional assignees of the issue.
             close_issue (Optional[bool]): Close issue if set to True
 
         Returns:
@@ -125,40 +155,56 @@ class Jira:
             if security_id:
                 issue_dict.update({"security": {"id": security_id}})
 
+        if epic is not None:
+            issue_dict.update({"parent": {"key": epic}})
+
+        if assignee is not None:
+            assignee_id = self._resolve_account_id(assignee)
+            if assignee_id is not None:
+                issue_dict.update({"assignee": {"accountId": assignee_id}})
+            else:
+                LOGGER.error(f"Unable to assign the issue to user {assignee}.")
+
+        if additional_assignees:
+            account_ids = self._get_account_ids(emails=additional_assignees)
+            if account_ids:
+                issue_dict.update({ADDITIONAL_ASSIGNEES_FIELD: account_ids})  # type: ignore
+            else:
+                LOGGER.warning("No valid account IDs resolved for additional assignees, none will be set")
+
         LOGGER.info(
             "A Jira issue will be reported.",
         )
-        response = self._jira_request("post", f"{self.url}/rest/api/3/issue", {"fields": issue_dict})
-        issue = self.connection.issue(response.json()["key"])
+        response, rejected_fields = self._post_new_issue(issue_dict=issue_dict)
+        # The create response holds the ID, key and URL of the issue, which is all the calls below need
+        issue = Issue(self.connection._options, self.connection._session, raw=response.json())
         LOGGER.info(
             f"{issue} has been reported to Jira: {self.url}/browse/{issue}",
         )
 
+        # Fields Jira rejected in the create payload are set with the requests used before they were folded into it
+        if "parent" in rejected_fields and epic is not None:
+            try:
+                self.connection.add_issues_to_epic(epic_id=epic, issue_keys=issue.key)
+            except JIRAError as error:
+                LOGGER.error(f"Unable to add issue {issue} to epic {epic}: {error.text}")
+
+        assigned = "assignee" in issue_dict and "assignee" not in rejected_fields
+        if "assignee" in rejected_fields and assignee is not None:
+            assigned = self.assign_issue(user_email=assignee, issue=issue.key)
+        if assigned:
+            LOGGER.info(f"Issue {issue} has been assigned to user {assignee}")
+
+        if ADDITIONAL_ASSIGNEES_FIELD in rejected_fields and additional_assignees:
+            self._set_additional_assignees(issue_key=issue.key, assignee_emails=additional_assignees)
+
         if file_attachments is not None:
             for file_path in file_attachments:
                 self.add_attachment_to_issue(issue=issue, attachment_path=file_path)
 
-        if epic is not None:
-            epic_search = self.connection.search_issues(f"issue={epic}", maxResults=False)
-            if len(epic_search) == 1:
-                epic_id = epic_search[0].id
-                self.connection.add_issues_to_epic(
-                    epic_id=epic_id,
-                    issue_keys=issue.key,
-                )
-            else:
-                LOGGER.error(f"Error finding Jira ID of epic {epic}")
-
-        if assignee is not None:
-            self.assign_issue(user_email=assignee, issue=issue.key)
-            LOGGER.info(f"Issue {issue} has been assigned to user {assignee}")
-
         if watchers:
             self.add_watchers_to_issue(issue_key=issue.key, watcher_emails=watchers)
 
-        if additional_assignees:
-            self._set_additional_assignees(issue_key=issue.key, assignee_emails=additional_assignees)
-
         if close_issue:
             self._transition_issue_with_adf_comment(
                 issue_key=issue.key,
@@ -168,13 +214,39 @@ class Jira:
 
         return issue
 
+    def _post_new_issue(self, issue_dict: dict[str, Any]) -> tuple[Any, list[str]]:
+        """
+        Creates an issue. If Jira rejects one of the optional fields folded into the payload (parent, assignee and
+        additional assignees), for example because it is not on the create screen of the project, the issue is
+        created again without those fields.
+
+        Args:
+            issue_dict (dict[str, Any]): The fields of the new issue.
+
+        Returns:
+            tuple[Any, list[str]]: The response of the create request, and the optional fields that were rejected and
+                left out of the issue. The caller sets those fields with separate requests.
+        """
+        url = f"{self.url}/rest/api/3/issue"
+        try:
+            return self._jira_request("post", url, {"fields": issue_dict}), []
+        except JIRAError as error:
+            rejected_fields = [
+                field for field in OPTIONAL_CREATE_FIELDS if field in issue_dict and field in (error.text or "")
+            ]
+            if error.status_code != 400 or not rejected_fields:
+                raise
+            LOGGER.warning(f"Jira rejected the fields {rejected_fields}, creating the issue without them: {error.text}")
+            fields = {field: value for field, value in issue_dict.items() if field not in rejected_fields}
+            return self._jira_request("post", url, {"fields": fields}), rejected_fields
+
     @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
-    def add_attachment_to_issue(self, issue: Issue, attachment_path: str) -> None:
+    def add_attachment_to_issue(self, issue: Union[Issue, IssueRef], attachment_path: str) -> None:
         """
         Add and upload the attachment from attachment_path to the Jira Issue object provided.
 
         Args:
-            issue (Issue): The Jira issue the attachment should be added to.
+            issue (Union[Issue, IssueRef]): The Jira issue the attachment should be added to.
             attachment_path (str): The path of the file to upload as an attachment to the issue.
 
         Returns:
@@ -194,19 +266,162 @@ class Jira:
             )
 
     @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
-    def search(self, jql_query: str) -> list[Any]:
+    def _search_page(
+        self,
+        jql_query: str,
+        fields: list[str],
+        page_size: int,
+        next_page_token: Optional[str],
+    ) -> Any:
+        # The client translates field names in place, so it is given a copy
+        return self.connection.enhanced_search_issues(
+            jql_query,
+            nextPageToken=next_page_token,
+            maxResults=page_size,
+            fields=list(fields),
+        )
+
+    @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
+    def _search_page_at(self, jql_query: str, fields: list[str], page_size: int, start_at: int) -> Any:
+        return self.connection.search_issues(
+            jql_query,
+            startAt=start_at,
+            maxResults=page_size,
+            fields=list(fields),
+        )
+
+    def _iter_search_pages_by_offset(self, jql_query: str, fields: list[str], page_size: int) -> Iterator[list[Any]]:
+        """
+        Yields the pages of a Jira JQL query with the offset-based search API, for servers without token-based search.
+
+        Args:
+            jql_query (str): JQL query to run.
+            fields (list[str]): The fields to fetch for each issue.
+            page_size (int): The number of issues requested per page.
+
+        Returns:
+            Iterator[list[Any]]: The pages of issues returned from the query.
+        """
+        start_at = 0
+        while True:
+            page = self._search_page_at(jql_query=jql_query, fields=fields, page_size=page_size, start_at=start_at)
+            if len(page) < 1:
+                return
+            yield list(page)
+
+            # The server may return fewer issues than requested, so only the total or an empty page ends the search
+            start_at += len(page)
+            total = getattr(page, "total", None)
+            if total is not None and start_at >= total:
+                return
+
+    def iter_search_pages(
+        self,
+        jql_query: str,
+        fields: Optional[list[str]] = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+    ) -> Iterator[list[Any]]:
+        """
+        Performs a Jira JQL query and yields the matching issues one page at a time. Pages are requested with the
+        token-based search API only when the previous page has been consumed, so a caller that stops iterating does
+        not fetch the remaining pages. Servers without token-based search are paged with the offset-based search API.
+
+        Args:
+            jql_query (str): JQL query to run.
+            fields (Optional[list[str]]): The fields to fetch for each issue. None only fetches the issue key.
+            page_size (int): The number of issues requested per page.
+
+        Returns:
+            Iterator[list[Any]]: The pages of issues returned from the query.
+        """
+        fields = fields or ["key"]
+        next_page_token = None
+        while True:
+            page = self._search_page(
+                jql_query=jql_query,
+                fields=fields,
+                page_size=page_size,
+                next_page_token=next_page_token,
+            )
+            # The client only offers token-based search on Jira Cloud, elsewhere it logs a warning and returns None
+            if page is None and next_page_token is None:
+                LOGGER.warning("Token-based search is not available on this Jira server, using offset-based search")
+                yield from self._iter_search_pages_by_offset(jql_query=jql_query, fields=fields, page_size=page_size)
+                return
+            if page is None:
+                raise JIRAError(f"Token-based search stopped returning results for query: {jql_query}")
+            if len(page) > 0:
+                yield list(page)
+
+            next_page_token = getattr(page, "nextPageToken", None)
+            if not next_page_token:
+                return
+
+    def iter_search(
+        self,
+        jql_query: str,
+        fields: Optional[list[str]] = None,
+        max_results: Optional[int] = None,
+        page_size: int = SEARCH_PAGE_SIZE,
+    ) -> Iterator[Any]:
+        """
+        Performs a Jira JQL query and yields the matching issues, fetching the next page only when it is needed.
+
+        Args:
+            jql_query (str): JQL query to run.
+            fields (Optional[list[str]]): The fields to fetch for each issue. None only fetches the issue key.
+            max_results (Optional[int]): The maximum number of issues to yield. None yields every match.
+            page_size (int): The number of issues requested per page.
+
+        Returns:
+            Iterator[Any]: The issues returned from the query.
+        """
+        if max_results is not None:
+            if max_results <= 0:
+                return
+            page_size = min(page_size, max_results)
+
+        count = 0
+        for page in self.iter_search_pages(jql_query=jql_query, fields=fields, page_size=page_size):
+            for issue in page:
+                yield issue
+                count += 1
+                if max_results is not None and count >= max_results:
+                    return
+
+    def iter_search_issues(self, jql_query: str, page_size: int = SEARCH_PAGE_SIZE) -> Iterator[str]:
         """
-        Performs a Jira JQL query using the Jira connection and returns a list of issues, including all fields.
+        Performs a Jira JQL query and yields the keys of the matching issues. Only the key of each issue is fetched.
 
         Args:
             jql_query (str): JQL query to run.
+            page_size (int): The number of issues requested per page.
+
+        Returns:
+            Iterator[str]: The keys of the issues returned from the query.
+        """
+        for issue in self.iter_search(jql_query=jql_query, fields=["key"], page_size=page_size):
+            yield issue.key
+
+    def search(
+        self,
+        jql_query: str,
+        max_results: Optional[int] = None,
+        fields: Optional[list[str]] = None,
+    ) -> list[Any]:
+        """
+        Performs a Jira JQL query using the Jira connection and returns a list of issues.
+
+        Args:
+            jql_query (str): JQL query to run.
+            max_results (Optional[int]): The maximum number of issues to return. None returns every match.
+            fields (Optional[list[str]]): The fields to fetch for each issue. None fetches all fields.
 
         Returns:
             list[Any]: List of issues that are returned from the query.
         """
-        return self.connection.search_issues(jql_query, maxResults=False)
+        return list(self.iter_search(jql_query=jql_query, fields=fields or ["*all"], max_results=max_results))
 
-    @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
     def search_issues(self, jql_query: str) -> list[str]:
         """
         Performs a Jira JQL query using the Jira connection and returns a list of strings representing issue keys.
@@ -217,13 +432,7 @@ class Jira:
         Returns:
             list[str]: List of issues that are returned from the query.
         """
-        issues = []
-        results = self.search(jql_query)
-
-        for issue in results:
-            issues.append(issue.key)
-
-        return issues
+        return list(self.iter_search_issues(jql_query=jql_query))
 
     def _jira_request(self, method: str, url: str, payload: dict[str, Any]) -> Any:
         fn = getattr(self.connection._session, method)
@@ -236,12 +445,51 @@ class Jira:
         url = self.connection._get_url(f"issue/{issue_key}/comment")
         self._jira_request("post", url, {"body": sanitize_jira_adf_doc(adf_body)})
 
+    def _get_issue_project_key(self, issue_key: str) -> str:
+        """
+        Gets the key of the project an issue belongs to. Issue keys (PROJECT-123) start with it, the project of a
+        numeric issue ID is fetched once and cached.
+
+        Args:
+            issue_key (str): The key or numeric ID of the issue.
+
+        Returns:
+            str: The key of the project of the issue.
+        """
+        project_key, separator, number = issue_key.rpartition("-")
+        if separator and number.isdigit():
+            return project_key
+
+        cached_project_key = self.metadata_cache.get(namespace="issue_project", key=issue_key)
+        if cached_project_key is not None:
+            return cached_project_key
+
+        project_key = self.connection.issue(issue_key, fields="project").fields.project.key
+        self.metadata_cache.set(namespace="issue_project", key=issue_key, value=project_key)
+        return project_key
+
     def _transition_issue_with_adf_comment(
         self,
         issue_key: str,
         transition_name: str,
         adf_body: dict[str, Any],
     ) -> None:
+        url = self.connection._get_url(f"issue/{issue_key}/transitions")
+        comment = {"comment": [{"add": {"body": sanitize_jira_adf_doc(adf_body)}}]}
+
+        # Transition IDs come from the project workflow, so they are cached per project. A cached ID the issue does
+        # not offer is dropped and looked up again.
+        cache_key = f"{self._get_issue_project_key(issue_key)}:{transition_name.lower()}"
+        transition_id = self.metadata_cache.get(namespace="transition_id", key=cache_key)
+        if transition_id is not None:
+            try:
+                self._jira_request("post", url, {"transition": {"id": transition_id}, "update": comment})
+                return
+            except JIRAError as error:
+                if error.status_code != 400:
+                    raise
+                self.metadata_cache.invalidate(namespace="transition_id", key=cache_key)
+
         transition_id = self.connection.find_transitionid_by_name(issue_key, transition_name)
         if transition_id is None:
             raise JIRAError(
@@ -249,33 +497,29 @@ class Jira:
                 status_code=400,
                 url="",
             )
-        payload: dict[str, Any] = {
-            "transition": {"id": transition_id},
-            "update": {"comment": [{"add": {"body": sanitize_jira_adf_doc(adf_body)}}]},
-        }
-        url = self.connection._get_url(f"issue/{issue_key}/transitions")
-        self._jira_request("post", url, payload)
+        self._jira_request("post", url, {"transition": {"id": transition_id}, "update": comment})
+        self.metadata_cache.set(namespace="transition_id", key=cache_key, value=transition_id)
 
     @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
-    def comment(self, issue_id: str, comment: str | dict[str, Any]) -> None:
+    def comment(self, issue_id: Union[str, IssueRef], comment: str | dict[str, Any]) -> None:
         """
         Comments on the issue_id.
 
         Args:
-            issue_id (str): Issue to comment on.
+            issue_id (Union[str, IssueRef]): Issue to comment on.
             comment (str | dict): Plain text (stored as minimal ADF) or an ADF doc dict for the body.
         """
         body = plain_text_to_adf_doc(comment) if isinstance(comment, str) else comment
-        self._post_issue_comment_adf(issue_id, body)
+        self._post_issue_comment_adf(self.issue_ref(issue_id).key, body)
 
     @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
-    def relate_issues(self, inward_issue: str, outward_issue: str) -> bool:
+    def relate_issues(self, inward_issue: Union[str, IssueRef], outward_issue: Union[str, IssueRef]) -> bool:
         """
         Used to relate two issues in Jira.
 
         Args:
-            inward_issue (str): The first issue you'd like to relate to the second issue.
-            outward_issue (str): The second issue you'd like to relate to the first issue.
+            inward_issue (Union[str, IssueRef]): The first issue you'd like to relate to the second issue.
+            outward_issue (Union[str, IssueRef]): The second issue you'd like to relate to the first issue.
 
         Returns:
             bool: True if issues related successfully, False otherwise.
@@ -283,8 +527,8 @@ class Jira:
         try:
             self.connection.create_issue_link(
                 type="relates to",
-                inwardIssue=inward_issue,
-                outwardIssue=outward_issue,
+                inwardIssue=self.issue_ref(inward_issue).key,
+                outwardIssue=self.issue_ref(outward_issue).key,
             )
             LOGGER.info(
                 f"Issue {inward_issue} and issue {outward_issue} related successfully",
@@ -296,15 +540,15 @@ class Jira:
             return False
 
     @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
-    def close_issue(self, issue_id: str) -> None:
+    def close_issue(self, issue_id: Union[str, IssueRef]) -> None:
         """
         Closes a Jira issue by transitioning it to the "closed" state with a standard comment.
 
         Args:
-            issue_id (str): The ID or key of the issue to close.
+            issue_id (Union[str, IssueRef]): The ID or key of the issue to close.
         """
         try:
-            issue = self.get_issue_by_id_or_key(issue_id)
+            issue = self.issue_ref(issue_id)
             self.logger.info("Closing issue %s with transition 'closed'...", issue_id)
 
             self._transition_issue_with_adf_comment(
@@ -388,20 +632,46 @@ class Jira:
             Optional[str]: The security level ID.
         """
 
-        project = self.connection.project(project_key)
-        security_levels = self.connection.project_issue_security_level_scheme(
-            project.id,
-        ).levels
+        security_level_ids = self.metadata_cache.get_or_fetch(
+            namespace="security_levels",
+            key=project_key,
+            fetch=lambda: self._fetch_security_level_ids(project_key=project_key),
+        )
 
-        for level in security_levels:
-            if level.name.lower() == security_level.lower():
-                return level.id
+        if security_level_ids and security_level.lower() in security_level_ids:
+            return security_level_ids[security_level.lower()]
 
         LOGGER.error(
             f"Security level {security_level} not found in {project_key}, no security level will be applied.",
         )
         return None
 
+    def _fetch_security_level_ids(self, project_key: str) -> dict[str, str]:
+        """
+        Args:
+            project_key (str): The project key to get the security levels of.
+
+        Returns:
+            dict[str, str]: The IDs of the security levels of the project, keyed by their lowercase name.
+        """
+        project = self.connection.project(project_key)
+        security_levels = self.connection.project_issue_security_level_scheme(
+            project.id,
+        ).levels
+        return {level.name.lower(): level.id for level in security_levels}
+
+    def issue_ref(self, issue: Union[str, Issue, IssueRef]) -> IssueRef:
+        """
+        Builds a reference to an issue that write methods can use without fetching the issue first.
+
+        Args:
+            issue (Union[str, Issue, IssueRef]): The ID or key of the issue, a fetched Issue, or a reference.
+
+        Returns:
+            IssueRef: The issue reference.
+        """
+        return IssueRef.from_issue(server_url=self.url, issue=issue)
+
     @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
     def get_issue_by_id_or_key(self, issue: str) -> Issue:
         """
@@ -418,14 +688,14 @@ class Jira:
     @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
     def _update_issue_labels(
         self,
-        issue_id_or_key: str,
+        issue_id_or_key: Union[str, IssueRef],
         labels: list[str],
         operation: str,
-    ) -> tuple[Issue, bool]:
-        issue = self.get_issue_by_id_or_key(issue_id_or_key)
+    ) -> tuple[IssueRef, bool]:
+        issue = self.issue_ref(issue_id_or_key)
         payload = {"update": {"labels": [{operation: label} for label in labels]}}
         try:
-            self._jira_request("put", issue.self, payload)
+            self._jira_request("put", issue.url, payload)
         except JIRAError as error:
             LOGGER.error(
                 "Failed to %s labels %s on issue %s. Error: %s",
@@ -443,52 +713,75 @@ class Jira:
             raise
         return issue, True
 
-    def add_labels_to_issue(self, issue_id_or_key: str, labels: list[str]) -> tuple[Issue, bool]:
+    def add_labels_to_issue(self, issue_id_or_key: Union[str, IssueRef], labels: list[str]) -> tuple[IssueRef, bool]:
         return self._update_issue_labels(issue_id_or_key, labels, "add")
 
-    def remove_labels_from_issue(self, issue_id_or_key: str, labels: list[str]) -> tuple[Issue, bool]:
+    def remove_labels_from_issue(
+        self,
+        issue_id_or_key: Union[str, IssueRef],
+        labels: list[str],
+    ) -> tuple[IssueRef, bool]:
         return self._update_issue_labels(issue_id_or_key, labels, "remove")
 
-    def add_watchers_to_issue(self, issue_key: str, watcher_emails: list[str]) -> None:
-        for email in watcher_emails:
+    def add_watchers_to_issue(self, issue_key: Union[str, IssueRef], watcher_emails: list[str]) -> None:
+        issue_key = self.issue_ref(issue_key).key
+
+        def add_watcher(email: str) -> None:
             account_id = self._resolve_account_id(email)
             if account_id is None:
-                continue
+                return
             try:
                 self.connection.add_watcher(issue_key, account_id)
                 LOGGER.info(f"Added watcher {email} to issue {issue_key}")
             except JIRAError as e:
                 LOGGER.warning(f"Failed to add watcher {email} to {issue_key}: {e.text}")
 
-    def _set_additional_assignees(self, issue_key: str, assignee_emails: list[str]) -> None:
-        account_ids = []
-        for email in assignee_emails:
-            account_id = self._resolve_account_id(email)
-            if account_id is not None:
-                account_ids.append({"accountId": account_id})
+        # Jira only adds one watcher per request, the requests are independent so they are sent concurrently
+        with ThreadPoolExecutor(max_workers=min(JIRA_USER_WORKERS, len(watcher_emails) or 1)) as executor:
+            list(executor.map(add_watcher, watcher_emails))
+
+    def _get_account_ids(self, emails: list[str]) -> list[dict[str, str]]:
+        """
+        Resolves the account IDs of users concurrently.
+
+        Args:
+            emails (list[str]): The email addresses of the users.
+
+        Returns:
+            list[dict[str, str]]: The account IDs of the users that were found, in the order of emails, formatted as
+                Jira user fields.
+        """
+        with ThreadPoolExecutor(max_workers=min(JIRA_USER_WORKERS, len(emails) or 1)) as executor:
+            account_ids = list(executor.map(self._resolve_account_id, emails))
+        return [{"accountId": account_id} for account_id in account_ids if account_id is not None]
+
+    def _set_additional_assignees(self, issue_key: Union[str, IssueRef], assignee_emails: list[str]) -> None:
+        account_ids = self._get_account_ids(emails=assignee_emails)
 
         if not account_ids:
             LOGGER.warning(f"No valid account IDs resolved for additional assignees on {issue_key}")
             return
 
-        issue = self.get_issue_by_id_or_key(issue_key)
-        payload = {"fields": {"customfield_10465": account_ids}}
+        payload = {"fields": {ADDITIONAL_ASSIGNEES_FIELD: account_ids}}
         try:
-            self._jira_request("put", issue.self, payload)
+            self._jira_request("put", self.issue_ref(issue_key).url, payload)
             LOGGER.info(f"Set additional assignees on issue {issue_key}")
         except JIRAError as e:
             LOGGER.warning(f"Failed to set additional assignees on {issue_key}: {e.text}")
 
     def _resolve_account_id(self, email: str) -> Optional[str]:
-        try:
-            users = self.connection.search_users(query=email, maxResults=1)
-            if users:
-                return users[0].accountId
-            self.logger.warning(f"No Jira user found for email {email}")
-            return None
-        except JIRAError as e:
-            self.logger.warning(f"Failed to resolve Jira account ID for {email}: {e.text}")
-            return None
+        def fetch() -> Optional[str]:
+            try:
+                users = self.connection.search_users(query=email, maxResults=1)
+                if users:
+                    return users[0].accountId
+                self.logger.warning(f"No Jira user found for email {email}")
+                return None
+            except JIRAError as e:
+                self.logger.warning(f"Failed to resolve Jira account ID for {email}: {e.text}")
+                return None
+
+        return self.metadata_cache.get_or_fetch(namespace="account_id", key=email.lower(), fetch=fetch)
 
     @ignore_exceptions(retry=3, retry_interval=1, raise_final_exception=True, logger=LOGGER)
     def get_issue_by_id_or_key_with_changelog(self, issue: str) -> Issue:
@@ -0,0 +1,39 @@
+from dataclasses import dataclass
+from typing import Union
+
+from jira import Issue
+
+
+@dataclass(frozen=True, slots=True)
+class IssueRef:
+    """
+    A lightweight handle to a Jira issue, enough to write to it without fetching it first.
+
+    Attributes:
+        key (str): The key (PROJECT-123) or ID of the issue. Jira accepts either in REST paths.
+        url (str): The REST URL of the issue, the "self" link of a fetched issue.
+    """
+
+    key: str
+    url: str
+
+    @classmethod
+    def from_issue(cls, server_url: str, issue: Union[str, Issue, "IssueRef"]) -> "IssueRef":
+        """
+        Builds a reference from an issue key or ID, a fetched Issue, or another reference.
+
+        Args:
+            server_url (str): The base URL of the Jira server.
+            issue (Union[str, Issue, IssueRef]): The issue to reference.
+
+        Returns:
+            IssueRef: The issue reference.
+        """
+        if isinstance(issue, IssueRef):
+            return issue
+        if isinstance(issue, str):
+            return cls(key=issue, url=f"{server_url}/rest/api/3/issue/{issue}")
+        return cls(key=issue.key, url=issue.self)
+
+    def __str__(self) -> str:
+        return self.key
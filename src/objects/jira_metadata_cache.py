@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable
+from typing import Any
+from typing import Optional
+from typing import TypeVar
+
+from simple_logger.logger import get_logger
+
+DEFAULT_JIRA_METADATA_CACHE_TTL = 24 * 60 * 60
+
+LOGGER = get_logger(name=__name__)
+
+T = TypeVar("T")
+
+
+class JiraMetadataCache:
+    def __init__(
+        self,
+        server_url: str,
+        cache_dir: Optional[str] = None,
+        ttl: float = DEFAULT_JIRA_METADATA_CACHE_TTL,
+    ) -> None:
+        """
+        Constructs the JiraMetadataCache object. Used to keep near-static Jira metadata (security levels, transition
+        IDs and user account IDs) so it is fetched once per project or user. Values are always kept in memory for the
+        lifetime of the object. If a cache directory is given they are also stored on disk, one file per Jira server,
+        and shared with later runs until they are older than the TTL.
+
+        Args:
+            server_url (str): The URL of the Jira server the metadata belongs to.
+            cache_dir (Optional[str]): The directory the on-disk store is kept in. None only caches in memory.
+            ttl (float): The number of seconds a value is used for before it is fetched again.
+        """
+        self.server_url = server_url
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+
+        self._lock = threading.Lock()
+        self._entries: Optional[dict[str, dict[str, Any]]] = None
+
+    @property
+    def cache_path(self) -> Optional[str]:
+        if not self.cache_dir:
+            return None
+        key = hashlib.sha256(self.server_url.encode()).hexdigest()
+        return os.path.join(self.cache_dir, f"jira-metadata-{key}.json")
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        """
+        Reads the on-disk store the first time it is needed. Must be called while holding the lock.
+
+        Returns:
+            dict[str, dict[str, Any]]: The cached entries, keyed by namespace and key.
+        """
+        if self._entries is not None:
+            return self._entries
+
+        self._entries = {}
+        if self.cache_path:
+            try:
+                with open(self.cache_path) as file:
+                    entries = json.load(file)
+                if isinstance(entries, dict):
+                    self._entries = entries
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as ex:
+                LOGGER.warning(f"Unable to read the Jira metadata cache {self.cache_path}, ignoring it: {ex}")
+        return self._entries
+
+    def _save(self) -> None:
+        """
+        Writes the entries to the on-disk store. The file is written to a temporary path first, so concurrent runs
+        never read a partial copy. Must be called while holding the lock.
+
+        Returns:
+            None
+        """
+        if not self.cache_dir or not self.cache_path or self._entries is None:
+            return
+
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, prefix=".tmp-")
+            with os.fdopen(fd, "w") as file:
+                json.dump(self._entries, file)
+            os.replace(temp_path, self.cache_path)
+        except OSError as ex:
+            LOGGER.warning(f"Unable to write the Jira metadata cache {self.cache_path}: {ex}")
+
+    def get(self, namespace: str, key: str) -> Optional[Any]:
+        """
+        Looks up a cached value.
+
+        Args:
+            namespace (str): The kind of metadata (e.g. "account_id").
+            key (str): The key of the value within the namespace (e.g. the email address of a user).
+
+        Returns:
+            Optional[Any]: The cached value, or None if it is not cached or older than the TTL.
+        """
+        with self._lock:
+            entry = self._load().get(f"{namespace}:{key}")
+        if entry is None or time.time() - entry["stored_at"] > self.ttl:
+            return None
+        return entry["value"]
+
+    def set(self, namespace: str, key: str, value: Any) -> None:
+        """
+        Stores a value. The value must be JSON serializable.
+
+        Args:
+            namespace (str): The kind of metadata (e.g. "account_id").
+            key (str): The key of the value within the namespace.
+            value (Any): The value to store.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            self._load()[f"{namespace}:{key}"] = {"stored_at": time.time(), "value": value}
+            self._save()
+
+    def invalidate(self, namespace: str, key: str) -> None:
+        """
+        Removes a cached value, for example after Jira rejected it.
+
+        Args:
+            namespace (str): The kind of metadata.
+            key (str): The key of the value within the namespace.
+
+        Returns:
+            None
+        """
+        with self._lock:
+            if self._load().pop(f"{namespace}:{key}", None) is not None:
+                self._save()
+
+    def get_or_fetch(self, namespace: str, key: str, fetch: Callable[[], Optional[T]]) -> Optional[T]:
+        """
+        Returns a cached value, fetching and storing it if it is not cached. Values that could not be found (None)
+        are not cached, so they are fetched again next time.
+
+        Args:
+            namespace (str): The kind of metadata (e.g. "account_id").
+            key (str): The key of the value within the namespace.
+            fetch (Callable[[], Optional[T]]): Fetches the value from Jira.
+
+        Returns:
+            Optional[T]: The value, or None if it could not be found.
+        """
+        value = self.get(namespace=namespace, key=key)
+        if value is not None:
+            return value
+
+        value = fetch()
+        if value is not None:
+            self.set(namespace=namespace, key=key, value=value)
+        return value
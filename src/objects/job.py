@@ -1,17 +1,52 @@
 import json
 import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from typing import Any
 from typing import Optional
-from xml.etree.ElementTree import ParseError
 from datetime import datetime, timezone, timedelta
 
-import junitparser
 from google.cloud import storage
 from google.oauth2 import service_account
 from simple_logger.logger import get_logger
 
+from src.objects.artifact_cache import ArtifactCache
+from src.objects.artifact_cache import DEFAULT_ARTIFACT_CACHE_MAX_BYTES
+from src.objects.artifact_downloader import ArtifactDownloader
+from src.objects.artifact_downloader import DEFAULT_DOWNLOAD_WORKERS
+from src.objects.artifact_downloader import DEFAULT_MAX_INFLIGHT_BYTES
+from src.objects.build_manifest import ARTIFACT_DISCOVERY_FULL
+from src.objects.build_manifest import ARTIFACT_DISCOVERY_TARGETED
+from src.objects.build_manifest import BuildManifest
+from src.objects.build_manifest import DEFAULT_JUNIT_PATTERNS
+from src.objects.build_manifest import ManifestEntry
+from src.objects.build_manifest import TargetedBuildManifest
 from src.objects.configuration import Configuration
 from src.objects.failure import Failure
+from src.objects.junit_scanner import JUnitFailureEvent
+from src.objects.junit_scanner import is_junit_file_name
+from src.objects.junit_scanner import scan_junit_file
+from src.objects.parsed_result_cache import ParsedResultCache
+
+RETRIGGER_MAX_TIMESTAMP_WORKERS = 8
+
+# Prow build IDs are snowflake IDs using the Twitter epoch
+PROW_BUILD_ID_EPOCH_MS = 1288834974657
+PROW_BUILD_ID_TIMESTAMP_SHIFT = 22
+
+# Lazily computed Job attributes that call GCS, mapped to a description of the call
+LAZY_GCS_CALLS = {
+    "steps": "artifact listing",
+    "logs_dir": "log download",
+    "junit_dir": "JUnit download",
+    "timestamp": "build timestamp",
+    "all_build_ids": "build ID listing",
+    "is_retriggered": "previous build timestamps",
+}
+
+# A retrigger is only detected within the same week, one extra day covers the gap between build ID and start time
+DEFAULT_BUILD_HISTORY_LOOKBACK_DAYS = 8
 
 
 class Job:
@@ -24,6 +59,15 @@ class Job:
         gcs_creds_file: Optional[str],
         firewatch_config: Configuration,
         pr_id: Optional[str] = "",
+        download_workers: int = DEFAULT_DOWNLOAD_WORKERS,
+        download_max_inflight_mb: int = DEFAULT_MAX_INFLIGHT_BYTES // (1024 * 1024),
+        build_history_lookback_days: Optional[int] = DEFAULT_BUILD_HISTORY_LOOKBACK_DAYS,
+        artifact_discovery: str = ARTIFACT_DISCOVERY_FULL,
+        junit_patterns: tuple[str, ...] = DEFAULT_JUNIT_PATTERNS,
+        artifact_cache_dir: Optional[str] = None,
+        artifact_cache_max_mb: int = DEFAULT_ARTIFACT_CACHE_MAX_BYTES // (1024 * 1024),
+        parse_workers: int = 1,
+        parsed_result_cache_path: Optional[str] = None,
     ) -> None:
         """
         Constructs the Job object.
@@ -35,6 +79,20 @@ class Job:
             gcs_bucket (str): The bucket that Prow job logs are stored
             firewatch_config (Configuration): The Configuration object.
             pr_ID (Optional[str]): The pull request number rehearsal job is running for. The value of $PULL_NUMBER
+            download_workers (int): The maximum number of artifacts downloaded from GCS at the same time.
+            download_max_inflight_mb (int): The maximum number of megabytes downloaded from GCS at the same time.
+            build_history_lookback_days (Optional[int]): The number of days of earlier builds to list when checking if
+                the build is a retrigger. None lists the whole job history.
+            artifact_discovery (str): How the job artifacts are found. "full" lists every artifact of the build,
+                "targeted" only lists the steps and the files matching junit_patterns.
+            junit_patterns (tuple[str, ...]): Glob patterns, relative to a step directory, of the JUnit files to list
+                when artifact_discovery is "targeted".
+            artifact_cache_dir (Optional[str]): The directory downloaded artifacts are cached in between runs. None
+                disables the cache.
+            artifact_cache_max_mb (int): The maximum size of the artifact cache in megabytes.
+            parse_workers (int): The number of processes JUnit files are parsed in. 1 parses them in this process.
+            parsed_result_cache_path (Optional[str]): The SQLite database the failures found in JUnit and
+                finished.json files are cached in between runs. None disables the cache.
         """
         self.logger = get_logger(__name__)
 
@@ -68,8 +126,42 @@ class Job:
             else storage.Client.create_anonymous_client()
         )
 
-        # Get a list of steps
-        self.steps = self._get_steps(
+        self.artifact_downloader = ArtifactDownloader(
+            max_workers=download_workers,
+            max_inflight_bytes=download_max_inflight_mb * 1024 * 1024,
+            cache=(
+                ArtifactCache(cache_dir=artifact_cache_dir, max_size_bytes=artifact_cache_max_mb * 1024 * 1024)
+                if artifact_cache_dir
+                else None
+            ),
+        )
+
+        # The artifacts of the build are listed once and shared by step discovery and downloads
+        self.artifact_discovery = artifact_discovery
+        self.junit_patterns = junit_patterns
+        self.build_manifest: Optional[BuildManifest] = None
+
+        self.build_history_lookback_days = build_history_lookback_days
+        self.parse_workers = parse_workers
+
+        # Files whose cached result has no failures are not downloaded, files with failures are still downloaded
+        # because they are attached to the Jira issues.
+        self.parsed_result_cache = (
+            ParsedResultCache(db_path=parsed_result_cache_path) if parsed_result_cache_path else None
+        )
+        self._parsed_entries: dict[str, ManifestEntry] = {}
+        self._cached_pod_results: dict[str, bool] = {}
+        self._cached_junit_results: dict[str, Optional[list[JUnitFailureEvent]]] = {}
+
+        self.download_path = self._get_download_path(build_id=self.build_id)
+
+        # Steps, downloads, failures and the retrigger check are computed on first access, so a report only pays
+        # for the GCS traffic of the code path it takes.
+
+    @cached_property
+    def steps(self) -> Optional[list[str]]:
+        """The steps of the job."""
+        return self._get_steps(
             job_name=self.name,
             job_name_safe=self.name_safe,
             build_id=self.build_id,
@@ -77,9 +169,37 @@ class Job:
             gcs_bucket=self.gcs_bucket,
         )
 
-        # Download logs and junit files
-        self.download_path = self._get_download_path(build_id=self.build_id)
-        self.logs_dir = self._download_logs(
+    def close(self) -> None:
+        """
+        Closes the parsed result cache. Called once the job has been reported.
+
+        Returns:
+            None
+        """
+        if self.parsed_result_cache:
+            self.parsed_result_cache.close()
+
+    def validate_steps(self) -> None:
+        """
+        Checks that the job can be reported: a job that is not a rehearsal must have steps. Firewatch exits with code 1
+        otherwise, so it is called before anything is downloaded or written to Jira. The steps are listed once and
+        kept for later use.
+
+        Returns:
+            None
+        """
+        if self.is_rehearsal:
+            return
+
+        if not self.steps:
+            self.logger.error(f"No steps found for job {self.name}")
+            exit(1)
+
+    @cached_property
+    def logs_dir(self) -> str:
+        """The directory the step logs are downloaded to."""
+        self.validate_steps()
+        return self._download_logs(
             downloads_directory=self.download_path,
             storage_client=self.storage_client,
             gcs_bucket=self.gcs_bucket,
@@ -88,7 +208,12 @@ class Job:
             job_name_safe=self.name_safe,
             pr_id=self.pr_id,
         )
-        self.junit_dir = self._download_junit(
+
+    @cached_property
+    def junit_dir(self) -> str:
+        """The directory the step JUnit files are downloaded to."""
+        self.validate_steps()
+        return self._download_junit(
             downloads_directory=self.download_path,
             storage_client=self.storage_client,
             gcs_bucket=self.gcs_bucket,
@@ -98,36 +223,47 @@ class Job:
             pr_id=self.pr_id,
         )
 
-        # Get a list of failures
-        self.failures = self._find_failures(
+    @cached_property
+    def failures(self) -> list[Failure]:
+        """The failures found in the job, excluding ignored failures."""
+        return self._find_failures(
             logs_dir=self.logs_dir,
             junit_dir=self.junit_dir,
         )
 
-        self.has_pod_failures = self.has_test_failures = False
-        for failure in self.failures:
-            if failure.failure_type == "test_failure":
-                self.has_test_failures = True
-            elif failure.failure_type == "pod_failure":
-                self.has_pod_failures = True
+    @cached_property
+    def has_test_failures(self) -> bool:
+        return any(failure.failure_type == "test_failure" for failure in self.failures)
+
+    @cached_property
+    def has_pod_failures(self) -> bool:
+        return any(failure.failure_type == "pod_failure" for failure in self.failures)
 
-        # Get the job timestamp
-        self.timestamp = self._get_timestamp(
+    @cached_property
+    def timestamp(self) -> Optional[int]:
+        """The UNIX timestamp of the job."""
+        return self._get_timestamp(
             job_name=self.name,
             build_id=self.build_id,
             storage_client=self.storage_client,
             gcs_bucket=self.gcs_bucket,
         )
 
-        # Get all the builds for a job
-        self.all_build_ids = self._get_all_build_ids(
+    @cached_property
+    def all_build_ids(self) -> list[str]:
+        """The builds of the job within the look-back window."""
+        return self._get_all_build_ids(
             job_name=self.name,
             storage_client=self.storage_client,
             gcs_bucket=self.gcs_bucket,
+            build_id=self.build_id,
+            lookback_days=self.build_history_lookback_days,
         )
 
-        # Check if job is retriggered within same week of last build
-        self.is_retriggered = self._check_is_retriggered(
+    @cached_property
+    def is_retriggered(self) -> bool:
+        """If the job is retriggered within the same week of the last build."""
+        return self._check_is_retriggered(
             job_name=self.name,
             build_id=self.build_id,
             timestamp=self.timestamp,
@@ -136,6 +272,21 @@ class Job:
             gcs_bucket=self.gcs_bucket,
         )
 
+    def log_skipped_gcs_calls(self) -> None:
+        """
+        Logs the GCS calls that were never made because the report did not need their result.
+
+        Returns:
+            None
+        """
+        skipped_calls = [
+            description for attribute, description in LAZY_GCS_CALLS.items() if attribute not in self.__dict__
+        ]
+        if skipped_calls:
+            self.logger.info(
+                f"Skipped {len(skipped_calls)} GCS calls not needed for this report: {', '.join(skipped_calls)}",
+            )
+
     def _check_is_rehearsal(
         self,
         job_name: Optional[str],
@@ -156,6 +307,75 @@ class Job:
             return True
         return False
 
+    def _get_artifacts_prefix(
+        self,
+        job_name: Optional[str],
+        job_name_safe: Optional[str],
+        build_id: Optional[str],
+        pr_id: Optional[str],
+    ) -> str:
+        """
+        Builds the GCS prefix that holds the step artifacts of a job.
+
+        Args:
+            job_name (Optional[str]): The name of the job.
+            job_name_safe (Optional[str]): The safe name of the job.
+            build_id (Optional[str]): The build ID of the job.
+            pr_id (Optional[str]): The pull request number of the rehearsal job.
+
+        Returns:
+            str: A string object representing the artifacts prefix.
+        """
+        if self.is_rehearsal:
+            return f"pr-logs/pull/openshift_release/{pr_id}/{job_name}/{build_id}/artifacts/{job_name_safe}/"
+        return f"logs/{job_name}/{build_id}/artifacts/{job_name_safe}/"
+
+    def _get_build_manifest(
+        self,
+        job_name: Optional[str],
+        job_name_safe: Optional[str],
+        build_id: Optional[str],
+        pr_id: Optional[str],
+        storage_client: Any,
+        gcs_bucket: str,
+    ) -> BuildManifest:
+        """
+        Gets the manifest of the artifacts of a job. The artifacts prefix is only listed the first time this is called,
+        every later call reuses the same manifest.
+
+        Args:
+            job_name (Optional[str]): The name of the job that the manifest should be built for.
+            job_name_safe (Optional[str]): The safe name of the job that the manifest should be built for.
+            build_id (Optional[str]): The build ID of the job that the manifest should be built for.
+            pr_id (Optional[str]): The pull request number of the rehearsal job that the manifest should be built for.
+            storage_client (Any): The storage client used to list the artifacts from GCS.
+            gcs_bucket (str): The GCS bucket that job logs are stored in.
+
+        Returns:
+            BuildManifest: The manifest of the job artifacts.
+        """
+        if self.build_manifest is None:
+            prefix = self._get_artifacts_prefix(
+                job_name=job_name,
+                job_name_safe=job_name_safe,
+                build_id=build_id,
+                pr_id=pr_id,
+            )
+            if self.artifact_discovery == ARTIFACT_DISCOVERY_TARGETED:
+                self.build_manifest = TargetedBuildManifest(
+                    storage_client=storage_client,
+                    gcs_bucket=gcs_bucket,
+                    prefix=prefix,
+                    junit_patterns=self.junit_patterns,
+                )
+            else:
+                self.build_manifest = BuildManifest(
+                    storage_client=storage_client,
+                    gcs_bucket=gcs_bucket,
+                    prefix=prefix,
+                )
+        return self.build_manifest
+
     def _download_junit(
         self,
         downloads_directory: str,
@@ -188,41 +408,50 @@ class Job:
         if not os.path.exists(path):
             os.mkdir(path)
 
-        if self.is_rehearsal:
-            blobs = storage_client.list_blobs(
-                gcs_bucket,
-                prefix=f"pr-logs/pull/openshift_release/{pr_id}/{job_name}/{build_id}/artifacts/{job_name_safe}",
-            )
-        else:
-            blobs = storage_client.list_blobs(
-                gcs_bucket,
-                prefix=f"logs/{job_name}/{build_id}/artifacts/{job_name_safe}",
-            )
-
-        for blob in blobs:
-            blob_name = blob.name.split("/")[-1]
-
-            if "junit" in blob_name:
-                blob_step = blob.name.split("/")[5]
-
-                # Create a step directory if it does not already exist
-                if not os.path.exists(f"{path}/{blob_step}"):
-                    os.mkdir(f"{path}/{blob_step}")
+        manifest = self._get_build_manifest(
+            job_name=job_name,
+            job_name_safe=job_name_safe,
+            build_id=build_id,
+            pr_id=pr_id,
+            storage_client=storage_client,
+            gcs_bucket=gcs_bucket,
+        )
 
-                # Check if the filename exists
-                file_counter = 1
-                filename, extension = os.path.splitext(blob_name)
-                file_path = f"{path}/{blob_step}/{filename}{extension}"
-                while os.path.exists(file_path):
-                    self.logger.info(f"File {file_path} already exists...")
-                    file_path = f"{path}/{blob_step}/{filename}_{str(file_counter)}{extension}"
-                    file_counter += 1
-
-                # Download blob
-                f"{path}/{blob_step}/{blob_name}"
-                with open(file_path, "xb") as target:
-                    blob.download_to_file(target)
-                    self.logger.debug(f"{file_path} downloaded successfully...")
+        # Plan every target path up front so the downloads can run concurrently
+        targets = []
+        planned_paths: set[str] = set()
+        for entry in manifest.find_files("junit"):
+            blob_name = entry.filename
+            blob_step = entry.step
+
+            # Create a step directory if it does not already exist
+            if not os.path.exists(f"{path}/{blob_step}"):
+                os.mkdir(f"{path}/{blob_step}")
+
+            # Check if the filename exists
+            file_counter = 1
+            filename, extension = os.path.splitext(blob_name)
+            file_path = f"{path}/{blob_step}/{filename}{extension}"
+            while file_path in planned_paths or os.path.exists(file_path):
+                self.logger.info(f"File {file_path} already exists...")
+                file_path = f"{path}/{blob_step}/{filename}_{str(file_counter)}{extension}"
+                file_counter += 1
+
+            planned_paths.add(file_path)
+            if self.parsed_result_cache:
+                found, events = self.parsed_result_cache.get_junit_result(entry=entry)
+                if found:
+                    self._cached_junit_results[file_path] = events
+                    # Only files without failures are skipped, files that are not JUnit results (cached as None) are
+                    # still downloaded and reported as before
+                    if events == []:
+                        continue
+                else:
+                    self._parsed_entries[file_path] = entry
+            targets.append((entry, file_path))
+
+        # Download blobs
+        self.artifact_downloader.download(manifest=manifest, targets=targets)
 
         return path
 
@@ -260,31 +489,41 @@ class Job:
         if not os.path.exists(path):
             os.mkdir(path)
 
-        if self.is_rehearsal:
-            blobs = storage_client.list_blobs(
-                gcs_bucket,
-                prefix=f"pr-logs/pull/openshift_release/{pr_id}/{job_name}/{build_id}/artifacts/{job_name_safe}",
-            )
-        else:
-            blobs = storage_client.list_blobs(
-                gcs_bucket,
-                prefix=f"logs/{job_name}/{build_id}/artifacts/{job_name_safe}",
-            )
+        manifest = self._get_build_manifest(
+            job_name=job_name,
+            job_name_safe=job_name_safe,
+            build_id=build_id,
+            pr_id=pr_id,
+            storage_client=storage_client,
+            gcs_bucket=gcs_bucket,
+        )
 
-        for blob in blobs:
-            blob_name = blob.name.split("/")[-1]
-            blob_step = blob.name.split("/")[-2]
+        targets = []
+        for blob_step in manifest.steps:
+            for blob_name in files_to_download:
+                entry = manifest.get_step_file(step=blob_step, filename=blob_name)
+                if entry is None:
+                    continue
 
-            if blob_name in files_to_download:
                 # Create step directory if it does not already exist
                 if not os.path.exists(f"{path}/{blob_step}"):
                     os.mkdir(f"{path}/{blob_step}")
 
-                # Download blob
                 file = f"{path}/{blob_step}/{blob_name}"
-                with open(file, "xb") as target:
-                    blob.download_to_file(target)
-                    self.logger.debug(f"{file} downloaded successfully...")
+                if os.path.exists(file):
+                    raise FileExistsError(f"{file} already exists")
+                if self.parsed_result_cache and blob_name == "finished.json":
+                    passed = self.parsed_result_cache.get_pod_result(entry=entry)
+                    if passed is not None:
+                        self._cached_pod_results[file] = passed
+                        if passed:
+                            continue
+                    else:
+                        self._parsed_entries[file] = entry
+                targets.append((entry, file))
+
+        # Download blobs
+        self.artifact_downloader.download(manifest=manifest, targets=targets)
 
         return path
 
@@ -310,27 +549,16 @@ class Job:
             Optional[list[str]]: A list of strings representing a list of steps in a job.
         """
 
-        steps = []
+        steps = self._get_build_manifest(
+            job_name=job_name,
+            job_name_safe=job_name_safe,
+            build_id=build_id,
+            pr_id=self.pr_id,
+            storage_client=storage_client,
+            gcs_bucket=gcs_bucket,
+        ).steps
 
-        if self.is_rehearsal:
-            prefix = f"pr-logs/pull/openshift_release/{self.pr_id}/{job_name}/{build_id}/artifacts/{job_name_safe}"
-        else:
-            prefix = f"logs/{job_name}/{build_id}/artifacts/{job_name_safe}"
-        blobs = storage_client.list_blobs(
-            gcs_bucket,
-            prefix=prefix,
-        )
-        # Populate list of steps
-        for blob in blobs:
-            blob_step = blob.name.split("/")[-2]
-            steps.append(blob_step)
-
-        # Return steps
-        if len(steps) > 0 or self.is_rehearsal:
-            return steps
-        else:
-            self.logger.error(f"No steps found for job {job_name}")
-            exit(1)
+        return steps
 
     def _get_download_path(self, build_id: Optional[str]) -> str:
         """
@@ -373,14 +601,14 @@ class Job:
         for failure in test_failures + pod_failures:
             if failure.step not in unique_steps_with_failures:
                 unique_steps_with_failures.add(failure.step)
-                if failure_rules := self.firewatch_config.failure_rules:
-                    for rule in failure_rules:
-                        if rule.matches_failure(failure) and rule.ignore:
-                            self.logger.warning(
-                                f"Ignoring detected {failure.failure_type} in step {failure.step}",
-                            )
-                            failure.ignore = True
-                if not failure.ignore:
+                ignored = failure.ignore
+                for rule in self.firewatch_config.failure_rule_matcher.match(failure):
+                    if rule.ignore:
+                        self.logger.warning(
+                            f"Ignoring detected {failure.failure_type} in step {failure.step}",
+                        )
+                        ignored = True
+                if not ignored:
                     failures_list.append(failure)
 
         return failures_list
@@ -404,14 +632,18 @@ class Job:
             for file_name in files:
                 if file_name == "finished.json":
                     file_path = os.path.join(root, file_name)
-                    with open(file_path) as file:
-                        data = json.load(file)
-                        if data.get("passed", False) is False:
-                            step = os.path.basename(os.path.dirname(file_path))
-                            failures.append(
-                                Failure(failed_step=step, failure_type="pod_failure"),
-                            )
-                            self.logger.info(f"Found pod failure in step: {step}")
+                    passed = self._cached_pod_results.get(file_path)
+                    if passed is None:
+                        with open(file_path) as file:
+                            data = json.load(file)
+                        passed = data.get("passed", False) is not False
+                        self._store_parsed_result(file_path=file_path, passed=passed)
+                    if not passed:
+                        step = os.path.basename(os.path.dirname(file_path))
+                        failures.append(
+                            Failure(step=step, failure_type="pod_failure"),
+                        )
+                        self.logger.info(f"Found pod failure in step: {step}")
 
         return failures
 
@@ -426,83 +658,99 @@ class Job:
             list[Failure]: A list of Failure objects
         """
 
-        # Initiate the failures list
-        failures_list = []
-
-        for root, _, files in os.walk(junit_dir):
-            junit_files = [file for file in files if "junit" in file and "xml" in file]
+        # The set is used for de-duplication, the list keeps the order failures were first found in
+        failures: list[Failure] = []
+        seen_failures: set[Failure] = set()
+        verbose = self.firewatch_config.verbose_test_failure_reporting
+
+        file_paths = [
+            os.path.join(root, file)
+            for root, _, files in os.walk(junit_dir)
+            for file in files
+            if is_junit_file_name(file)
+        ]
+
+        # Files parsed by an earlier run are not parsed again
+        uncached_paths = [file_path for file_path in file_paths if file_path not in self._cached_junit_results]
+        scanned_results = dict(zip(uncached_paths, self._scan_junit_files(file_paths=uncached_paths)))
+        for file_path, events in scanned_results.items():
+            self._store_parsed_result(file_path=file_path, events=events)
+
+        for file_path in file_paths:
+            events = (
+                self._cached_junit_results[file_path]
+                if file_path in self._cached_junit_results
+                else scanned_results[file_path]
+            )
+            if events is None:
+                self.logger.warning(
+                    f"Attempted to parse {file_path}, but it doesn't seem to be a JUnit results file.",
+                )
+                continue
 
-            for file in junit_files:
-                file_path = os.path.join(root, file)
-                try:
-                    junit_xml = junitparser.JUnitXml.fromfile(file_path)
-                except (ParseError, junitparser.junitparser.JUnitXmlError):
-                    self.logger.warning(
-                        f"Attempted to parse {file_path}, but it doesn't seem to be a JUnit results file.",
+            step = os.path.basename(os.path.dirname(file_path))
+            for event in events:
+                test_name = event.testcase or ""
+                failure = Failure(
+                    step=step,
+                    failure_type="test_failure",
+                    failed_test_name=test_name.replace(" ", "_") if verbose else None,
+                    failed_test_junit_path=file_path if verbose else None,
+                )
+                if failure not in seen_failures:
+                    seen_failures.add(failure)
+                    failures.append(failure)
+                    self.logger.info(
+                        f"Found test failure in step {step} {'for test ' + test_name if verbose else ''}",
                     )
-                    continue
-
-                step = os.path.basename(os.path.dirname(file_path))
-                for suite in junit_xml:
-                    for case in suite:
-                        if hasattr(case, "result") and case.result:
-                            for result in case.result:
-                                if isinstance(
-                                    result,
-                                    (junitparser.Failure, junitparser.Error),
-                                ):
-                                    failure = {
-                                        "step": step,
-                                        "failure_type": "test_failure",
-                                        "failed_test_name": (
-                                            case.name.replace(" ", "_")
-                                            if self.firewatch_config.verbose_test_failure_reporting
-                                            else None
-                                        ),
-                                        "failed_test_junit_path": (
-                                            file_path if self.firewatch_config.verbose_test_failure_reporting else None
-                                        ),
-                                    }
-                                    if failure not in failures_list:
-                                        failures_list.append(failure)
-                                        self.logger.info(
-                                            f"Found test failure in step {step} {'for test ' + case.name if self.firewatch_config.verbose_test_failure_reporting else ''}",
-                                        )
-                        elif isinstance(case, (junitparser.Failure, junitparser.Error)):
-                            failure = {
-                                "step": step,
-                                "failure_type": "test_failure",
-                                "failed_test_name": (
-                                    suite.name.replace(" ", "_")
-                                    if self.firewatch_config.verbose_test_failure_reporting
-                                    else None
-                                ),
-                                "failed_test_junit_path": (
-                                    file_path if self.firewatch_config.verbose_test_failure_reporting else None
-                                ),
-                            }
-                            if failure not in failures_list:
-                                failures_list.append(failure)
-                                self.logger.info(
-                                    f"Found test failure in step {step} {'for test ' + suite.name if self.firewatch_config.verbose_test_failure_reporting else ''}",
-                                )
-
-        # Convert dictionary failures into actual failure objects.
-        # This is done here because keep failures_list items as dictionaries allows us to make the "if failure not in failures_list" check above.
-        failures = []
-        for failure in failures_list:
-            failures.append(
-                Failure(
-                    # Ensure the values are treated as strings
-                    failed_step=str(failure["step"]),
-                    failure_type=str(failure["failure_type"]),
-                    failed_test_name=failure["failed_test_name"],
-                    failed_test_junit_path=failure["failed_test_junit_path"],
-                ),
-            )
 
         return failures
 
+    def _store_parsed_result(
+        self,
+        file_path: str,
+        passed: Optional[bool] = None,
+        events: Optional[list[JUnitFailureEvent]] = None,
+    ) -> None:
+        """
+        Stores the result of a parsed file in the parsed result cache, if the cache is enabled and the file was
+        downloaded from a cacheable manifest entry.
+
+        Args:
+            file_path (str): The path of the parsed file.
+            passed (Optional[bool]): The result of a finished.json file. None for JUnit files.
+            events (Optional[list[JUnitFailureEvent]]): The failures of a JUnit file.
+
+        Returns:
+            None
+        """
+        entry = self._parsed_entries.get(file_path)
+        if self.parsed_result_cache is None or entry is None:
+            return
+        if passed is not None:
+            self.parsed_result_cache.store_pod_result(entry=entry, passed=passed)
+        else:
+            self.parsed_result_cache.store_junit_result(entry=entry, events=events)
+
+    def _scan_junit_files(self, file_paths: list[str]) -> list[Optional[list[JUnitFailureEvent]]]:
+        """
+        Scans JUnit files for failures, in a process pool when more than one parse worker is configured. The results
+        are always returned in the order of file_paths, so the failures found do not depend on the number of workers.
+
+        Args:
+            file_paths (list[str]): The paths of the JUnit files.
+
+        Returns:
+            list[Optional[list[JUnitFailureEvent]]]: The failures of each file, None for files that are not JUnit files.
+        """
+        workers = min(self.parse_workers, len(file_paths))
+        if workers <= 1:
+            return [scan_junit_file(file_path) for file_path in file_paths]
+
+        self.logger.info(f"Parsing {len(file_paths)} JUnit files with {workers} workers...")
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            return list(executor.map(scan_junit_file, file_paths))
+
     def _get_timestamp(
         self,
         job_name: Optional[str],
@@ -542,19 +790,48 @@ class Job:
             )
             return None
 
+    def _get_build_id_lower_bound(self, build_id: Optional[str], lookback_days: Optional[int]) -> Optional[str]:
+        """
+        Builds the smallest build ID that can have been created within the look-back window of a build. Prow build IDs
+        are snowflake IDs, the creation time in milliseconds since the snowflake epoch is stored above bit 22.
+
+        Args:
+            build_id (Optional[str]): The build ID the look-back window ends at.
+            lookback_days (Optional[int]): The number of days to look back. None disables the window.
+
+        Returns:
+            Optional[str]: The lower bound build ID, or None if the build ID is not a snowflake ID or no window is used.
+        """
+        if not build_id or not build_id.isdigit() or lookback_days is None:
+            return None
+
+        build_time_ms = (int(build_id) >> PROW_BUILD_ID_TIMESTAMP_SHIFT) + PROW_BUILD_ID_EPOCH_MS
+        lower_bound_time_ms = build_time_ms - int(timedelta(days=lookback_days).total_seconds() * 1000)
+        lower_bound = str(max(lower_bound_time_ms - PROW_BUILD_ID_EPOCH_MS, 0) << PROW_BUILD_ID_TIMESTAMP_SHIFT)
+
+        # GCS offsets compare names as strings, which only matches numeric order for IDs of the same length
+        if len(lower_bound) != len(build_id):
+            return None
+        return lower_bound
+
     def _get_all_build_ids(
         self,
         job_name: Optional[str],
         storage_client: Any,
         gcs_bucket: str,
+        build_id: Optional[str] = None,
+        lookback_days: Optional[int] = None,
     ) -> list[str]:
         """
-        Get the list of all build IDs from the job directory.
+        Get the list of build IDs from the job directory. If a build ID and a look-back window are given, only the
+        builds created within the window before that build are listed.
 
         Args:
             job_name (Optional[str]): The name of the job to get build ids for.
             storage_client (Any): The storage client used to gather steps from GCS.
             gcs_bucket (str): The GCS bucket that job logs are stored in.
+            build_id (Optional[str]): The build ID that the listing window ends at (exclusive).
+            lookback_days (Optional[int]): The number of days before build_id to list builds for.
 
         Returns:
             List[str]: A list of build IDs.
@@ -566,7 +843,18 @@ class Job:
                 prefix = f"pr-logs/pull/openshift_release/{self.pr_id}/{job_name}/"
             else:
                 prefix = f"logs/{job_name}/"
-            blobs = bucket.list_blobs(prefix=prefix, delimiter="/")
+
+            lower_bound = self._get_build_id_lower_bound(build_id=build_id, lookback_days=lookback_days)
+            if lower_bound is not None:
+                self.logger.info(f"Listing builds of {job_name} created in the {lookback_days} days before {build_id}")
+                blobs = bucket.list_blobs(
+                    prefix=prefix,
+                    delimiter="/",
+                    start_offset=f"{prefix}{lower_bound}",
+                    end_offset=f"{prefix}{build_id}/",
+                )
+            else:
+                blobs = bucket.list_blobs(prefix=prefix, delimiter="/")
 
             build_ids = []
             for page in blobs.pages:
@@ -591,6 +879,7 @@ class Job:
         gcs_bucket: str,
     ) -> bool:
         """Check if the current job build is retriggered within the same week as a previous build.
+        Only the newest previous builds are fetched, the search stops at the first build with a known timestamp.
 
         Args:
             job_name (Optional[str]): The name of the job to check if its retriggered the same week.
@@ -617,20 +906,43 @@ class Job:
         week_start = week_start.replace(hour=0, minute=0, second=0, microsecond=0)
 
         # Ensure all build_ids are valid integers
-        previous_builds = [b_id for b_id in all_build_ids if b_id is not None and int(b_id) < int(build_id)]
+        previous_builds = sorted(
+            (b_id for b_id in all_build_ids if b_id is not None and int(b_id) < int(build_id)),
+            key=int,
+        )
         if not previous_builds:
             self.logger.info("No previous build found within the same week.")
             return False
 
-        # Iterate in descending order to find the previous build within the same week
-        for prev_build_id in reversed(previous_builds):
-            prev_timestamp = self._get_timestamp(
-                job_name=job_name, build_id=prev_build_id, storage_client=storage_client, gcs_bucket=gcs_bucket
-            )
-            if prev_timestamp is None:
-                continue
-            prev_datetime = datetime.fromtimestamp(prev_timestamp, tz=timezone.utc)
-            if week_start <= prev_datetime < current_datetime:
-                self.logger.info(f"Previous build within the same week found: {prev_build_id}")
-                return True
+        # Prow build IDs increase over time, so the newest previous build with a known timestamp decides the result.
+        # Walk back from the newest build and fetch candidates concurrently in batches that double in size, so builds
+        # without a started.json only cost O(log n) round trips and the walk stops at the first known timestamp.
+        batch_size = 1
+        fetches = 0
+        end = len(previous_builds)
+        with ThreadPoolExecutor(max_workers=RETRIGGER_MAX_TIMESTAMP_WORKERS) as executor:
+            while end > 0:
+                candidates = previous_builds[max(0, end - batch_size) : end][::-1]
+                timestamps = executor.map(
+                    lambda prev_build_id: self._get_timestamp(
+                        job_name=job_name,
+                        build_id=prev_build_id,
+                        storage_client=storage_client,
+                        gcs_bucket=gcs_bucket,
+                    ),
+                    candidates,
+                )
+                fetches += len(candidates)
+                for prev_build_id, prev_timestamp in zip(candidates, timestamps):
+                    if prev_timestamp is None:
+                        continue
+                    prev_datetime = datetime.fromtimestamp(prev_timestamp, tz=timezone.utc)
+                    self.logger.debug(f"Fetched {fetches} previous build timestamps for job {job_name}")
+                    if week_start <= prev_datetime < current_datetime:
+                        self.logger.info(f"Previous build within the same week found: {prev_build_id}")
+                        return True
+                    self.logger.info(f"Previous build {prev_build_id} is older than the current week.")
+                    return False
+                end -= len(candidates)
+                batch_size *= 2
         return False
@@ -0,0 +1,210 @@
+import fnmatch
+import gzip
+import os
+import tarfile
+import zlib
+from collections.abc import Iterator
+from dataclasses import dataclass
+from typing import IO
+from typing import Optional
+from typing import Union
+from typing import cast
+from xml.etree.ElementTree import Element
+from xml.etree.ElementTree import ParseError
+from xml.etree.ElementTree import iterparse
+
+JUNIT_ROOT_TAGS = ("testsuites", "testsuite")
+JUNIT_FAILURE_TAGS = ("failure", "error")
+
+# Compressed JUnit files are decoded while they are scanned, archives are never extracted to disk
+GZIP_SUFFIXES = (".gz",)
+TAR_SUFFIXES = (".tar", ".tar.gz", ".tgz")
+# Globs matched against the file name of tar members, members that do not match are skipped without being read
+JUNIT_TAR_MEMBER_PATTERNS = ("*junit*.xml", "*junit*.xml.gz")
+
+# The errors raised when a compressed file or archive is truncated or corrupt
+COMPRESSION_ERRORS = (gzip.BadGzipFile, tarfile.TarError, zlib.error, EOFError)
+
+
+class NotJUnitFileError(Exception):
+    """Raised when an XML file does not have a JUnit root element."""
+
+
+@dataclass(frozen=True)
+class JUnitFailureEvent:
+    """
+    A failed or errored test case found while scanning a JUnit file.
+
+    Attributes:
+        suite (Optional[str]): The name of the test suite the test case belongs to.
+        testcase (Optional[str]): The name of the test case.
+        result (str): The tag of the result element, either "failure" or "error".
+    """
+
+    suite: Optional[str]
+    testcase: Optional[str]
+    result: str
+
+
+def is_junit_file_name(file_name: str) -> bool:
+    """
+    Checks if a downloaded file may hold JUnit results: an XML file, optionally gzipped, or a tar archive with "junit"
+    in its name.
+
+    Args:
+        file_name (str): The name of the file.
+
+    Returns:
+        bool: True if the file should be scanned for JUnit failures.
+    """
+    if "junit" not in file_name:
+        return False
+    return "xml" in file_name or file_name.endswith(TAR_SUFFIXES)
+
+
+def scan_junit_failures(file_path: Union[str, IO[bytes]]) -> Iterator[JUnitFailureEvent]:
+    """
+    Streams a JUnit file and yields an event for every failure or error of a test case. Elements are discarded as soon
+    as they have been read, so memory use does not grow with the size of the file.
+
+    Only test cases nested in test suites are scanned, matching how junitparser walks a JUnit file. A test case yields
+    one event for each failure or error element inside it. Failures are yielded in the order junitparser walks a suite:
+    the test cases directly in the suite first, then the test cases of its nested suites. Failures of nested suites
+    are held until their enclosing top-level suite ends, only those events are kept in memory.
+
+    Args:
+        file_path (Union[str, IO[bytes]]): The path of the JUnit file, or a binary stream of its content.
+
+    Raises:
+        xml.etree.ElementTree.ParseError: If the file is not valid XML.
+        NotJUnitFileError: If the root element of the file is not "testsuites" or "testsuite".
+
+    Yields:
+        JUnitFailureEvent: The failures found in the file.
+    """
+    # The open elements, from the root to the current element
+    stack: list[Element] = []
+    # The test suites enclosing the current element, and the test case being read if it is nested in test suites only
+    suites: list[Element] = []
+    testcase: Optional[Element] = None
+    # For each open suite, the held failures of its own test cases and of its nested suites
+    direct_events: list[list[JUnitFailureEvent]] = []
+    nested_events: list[list[JUnitFailureEvent]] = []
+
+    for event, elem in iterparse(file_path, events=("start", "end")):
+        if event == "start":
+            if not stack and elem.tag not in JUNIT_ROOT_TAGS:
+                raise NotJUnitFileError(
+                    f"{getattr(file_path, 'name', file_path)} has an invalid root element: {elem.tag}"
+                )
+
+            if testcase is None:
+                # A test case only counts if every element above it is a test suite (or the testsuites root)
+                in_suites = len(suites) == len(stack) - (1 if stack and stack[0].tag == "testsuites" else 0)
+                if elem.tag == "testsuite" and in_suites:
+                    suites.append(elem)
+                    direct_events.append([])
+                    nested_events.append([])
+                elif elem.tag == "testcase" and in_suites and suites:
+                    testcase = elem
+
+            stack.append(elem)
+            continue
+
+        stack.pop()
+        if elem is testcase:
+            testcase = None
+        elif suites and elem is suites[-1]:
+            suites.pop()
+            suite_events = direct_events.pop() + nested_events.pop()
+            if suites:
+                nested_events[-1].extend(suite_events)
+            else:
+                yield from suite_events
+        elif testcase is not None and elem.tag in JUNIT_FAILURE_TAGS:
+            failure_event = JUnitFailureEvent(
+                suite=suites[-1].get("name"),
+                testcase=testcase.get("name"),
+                result=elem.tag,
+            )
+            # The test cases of a top-level suite come first, so their failures are not held
+            if len(suites) == 1:
+                yield failure_event
+            else:
+                direct_events[-1].append(failure_event)
+
+        # Drop finished elements from their parent so the tree never holds more than the open elements
+        if stack and elem.tag in ("testcase", "testsuite"):
+            elem.clear()
+            stack[-1].remove(elem)
+
+
+def _scan_junit_stream(stream: IO[bytes], file_name: str) -> list[JUnitFailureEvent]:
+    """
+    Scans a JUnit stream for failures, decompressing it on the fly if the file name ends with a gzip suffix.
+
+    Args:
+        stream (IO[bytes]): The binary content of the file.
+        file_name (str): The name of the file, used to detect compression.
+
+    Returns:
+        list[JUnitFailureEvent]: The failures found in the stream.
+    """
+    if file_name.endswith(GZIP_SUFFIXES):
+        with gzip.open(stream, "rb") as decompressed:
+            return list(scan_junit_failures(cast(IO[bytes], decompressed)))
+    return list(scan_junit_failures(stream))
+
+
+def _scan_junit_tar(file_path: str) -> Optional[list[JUnitFailureEvent]]:
+    """
+    Scans the JUnit members of a tar archive, in the order they are stored. The archive is read as a stream, members
+    are decoded in memory one at a time and never written to disk.
+
+    Args:
+        file_path (str): The path of the tar archive. It may be compressed with any compression tarfile supports.
+
+    Returns:
+        Optional[list[JUnitFailureEvent]]: The failures found in the JUnit members of the archive, or None if the
+            archive has no JUnit members.
+    """
+    events: list[JUnitFailureEvent] = []
+    found_junit_member = False
+    with tarfile.open(file_path, mode="r|*") as archive:
+        for member in archive:
+            member_name = os.path.basename(member.name)
+            if not member.isfile() or not any(
+                fnmatch.fnmatch(member_name, pattern) for pattern in JUNIT_TAR_MEMBER_PATTERNS
+            ):
+                continue
+
+            stream = archive.extractfile(member)
+            if stream is None:
+                continue
+            try:
+                events.extend(_scan_junit_stream(stream=stream, file_name=member_name))
+            except (ParseError, NotJUnitFileError, *COMPRESSION_ERRORS):
+                continue
+            found_junit_member = True
+
+    return events if found_junit_member else None
+
+
+def scan_junit_file(file_path: str) -> Optional[list[JUnitFailureEvent]]:
+    """
+    Scans a whole JUnit file for failures. Defined at module level so it can be run in a worker process. Gzipped
+    JUnit files and tar archives of JUnit files are decompressed while they are scanned.
+
+    Args:
+        file_path (str): The path of the JUnit file.
+
+    Returns:
+        Optional[list[JUnitFailureEvent]]: The failures found in the file, or None if the file is not a JUnit file.
+    """
+    try:
+        if file_path.endswith(TAR_SUFFIXES):
+            return _scan_junit_tar(file_path)
+        with open(file_path, "rb") as file:
+            return _scan_junit_stream(stream=file, file_name=file_path)
+    except (ParseError, NotJUnitFileError, *COMPRESSION_ERRORS):
+        return None
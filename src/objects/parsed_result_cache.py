@@ -0,0 +1,171 @@
+import json
+import os
+import sqlite3
+from typing import Optional
+
+from simple_logger.logger import get_logger
+
+from src.objects.build_manifest import ManifestEntry
+from src.objects.junit_scanner import JUnitFailureEvent
+
+PARSED_RESULT_CACHE_SCHEMA_VERSION = 1
+
+RESULT_KIND_POD = "pod"
+RESULT_KIND_JUNIT = "junit"
+
+
+class ParsedResultCache:
+    def __init__(self, db_path: str) -> None:
+        """
+        Constructs the ParsedResultCache object. Used to keep the failures found in JUnit and finished.json files in a
+        SQLite database between firewatch runs, so a rerun on the same build does not download or parse the files
+        again. Results are stored under a key built from the GCS generation and MD5 hash of the object, so a cached
+        result is only reused while the listing still reports the same content. A database that can not be opened or
+        queried disables the cache, it never fails a report.
+
+        Args:
+            db_path (str): The path of the SQLite database. It is created if it does not exist.
+        """
+        self.logger = get_logger(__name__)
+
+        self.db_path = db_path
+        self._connection: Optional[sqlite3.Connection] = None
+
+        try:
+            db_dir = os.path.dirname(db_path)
+            if db_dir:
+                os.makedirs(db_dir, exist_ok=True)
+            connection = sqlite3.connect(db_path, timeout=30)
+            # Concurrent firewatch runs may share the database
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with connection:
+                connection.execute(
+                    "CREATE TABLE IF NOT EXISTS parsed_results "
+                    "(key TEXT NOT NULL, kind TEXT NOT NULL, version INTEGER NOT NULL, result TEXT NOT NULL, "
+                    "PRIMARY KEY (key, kind))",
+                )
+            self._connection = connection
+        except (OSError, sqlite3.Error) as ex:
+            self.logger.warning(f"Failed to open the parsed result cache {db_path}, it is disabled: {ex}")
+
+    def _get_key(self, entry: ManifestEntry) -> Optional[str]:
+        """
+        Builds the cache key of a manifest entry.
+
+        Args:
+            entry (ManifestEntry): The manifest entry to build the key for.
+
+        Returns:
+            Optional[str]: The cache key, or None if the entry can not be cached because its content is unknown.
+        """
+        if not entry.listed or entry.generation is None or not entry.md5_hash:
+            return None
+        return f"{entry.name}#{entry.generation}#{entry.md5_hash}"
+
+    def _get(self, entry: ManifestEntry, kind: str) -> Optional[str]:
+        key = self._get_key(entry=entry)
+        if key is None or self._connection is None:
+            return None
+        try:
+            row = self._connection.execute(
+                "SELECT result FROM parsed_results WHERE key = ? AND kind = ? AND version = ?",
+                (key, kind, PARSED_RESULT_CACHE_SCHEMA_VERSION),
+            ).fetchone()
+        except sqlite3.Error as ex:
+            self.logger.warning(f"Failed to read {entry.name} from the parsed result cache: {ex}")
+            return None
+        return row[0] if row else None
+
+    def _store(self, entry: ManifestEntry, kind: str, result: str) -> None:
+        key = self._get_key(entry=entry)
+        if key is None or self._connection is None:
+            return
+        try:
+            with self._connection:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO parsed_results (key, kind, version, result) VALUES (?, ?, ?, ?)",
+                    (key, kind, PARSED_RESULT_CACHE_SCHEMA_VERSION, result),
+                )
+        except sqlite3.Error as ex:
+            self.logger.warning(f"Failed to store {entry.name} in the parsed result cache: {ex}")
+
+    def get_pod_result(self, entry: ManifestEntry) -> Optional[bool]:
+        """
+        Looks up the result of a finished.json file.
+
+        Args:
+            entry (ManifestEntry): The manifest entry of the finished.json file.
+
+        Returns:
+            Optional[bool]: True if the step passed, False if it failed, None if the result is not cached.
+        """
+        result = self._get(entry=entry, kind=RESULT_KIND_POD)
+        if result is None:
+            return None
+        return bool(json.loads(result)["passed"])
+
+    def store_pod_result(self, entry: ManifestEntry, passed: bool) -> None:
+        """
+        Stores the result of a finished.json file.
+
+        Args:
+            entry (ManifestEntry): The manifest entry the file was downloaded from.
+            passed (bool): True if the step passed.
+
+        Returns:
+            None
+        """
+        self._store(entry=entry, kind=RESULT_KIND_POD, result=json.dumps({"passed": passed}))
+
+    def get_junit_result(self, entry: ManifestEntry) -> tuple[bool, Optional[list[JUnitFailureEvent]]]:
+        """
+        Looks up the failures found in a JUnit file.
+
+        Args:
+            entry (ManifestEntry): The manifest entry of the JUnit file.
+
+        Returns:
+            tuple[bool, Optional[list[JUnitFailureEvent]]]: True and the failures of the file if the result is cached,
+                otherwise False and None. The failures are None for files that are not JUnit files.
+        """
+        result = self._get(entry=entry, kind=RESULT_KIND_JUNIT)
+        if result is None:
+            return False, None
+
+        events = json.loads(result)["events"]
+        if events is None:
+            return True, None
+        return True, [
+            JUnitFailureEvent(suite=event["suite"], testcase=event["testcase"], result=event["result"])
+            for event in events
+        ]
+
+    def store_junit_result(self, entry: ManifestEntry, events: Optional[list[JUnitFailureEvent]]) -> None:
+        """
+        Stores the failures found in a JUnit file.
+
+        Args:
+            entry (ManifestEntry): The manifest entry the file was downloaded from.
+            events (Optional[list[JUnitFailureEvent]]): The failures of the file, None if it is not a JUnit file.
+
+        Returns:
+            None
+        """
+        serialized = (
+            None
+            if events is None
+            else [{"suite": event.suite, "testcase": event.testcase, "result": event.result} for event in events]
+        )
+        self._store(entry=entry, kind=RESULT_KIND_JUNIT, result=json.dumps({"events": serialized}))
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+
+        Returns:
+            None
+        """
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
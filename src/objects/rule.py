@@ -1,43 +1,90 @@
 import json
-import os
 import re
 from typing import Any
 from typing import Optional
+from typing import Self
 
 from simple_logger.logger import get_logger
 
+from src.objects.rule_defaults import RuleDefaults
+
+LOGGER = get_logger(name=__name__)
+
 EMAIL_REGEX = r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,7}\b"
 
 
 class Rule:
-    def __init__(self, rule_dict: dict[Any, Any]) -> None:
+    # The validated attributes of a rule, stored in config snapshots
+    SNAPSHOT_FIELDS: tuple[str, ...] = (
+        "jira_project",
+        "jira_epic",
+        "jira_component",
+        "jira_affects_version",
+        "jira_additional_labels",
+        "jira_assignee",
+        "jira_priority",
+        "jira_security_level",
+        "jira_watchers",
+        "jira_additional_assignees",
+        "slack_channel",
+        "slack_user",
+        "jobs",
+    )
+    # Rules are plain records, large configs build thousands of them
+    __slots__ = SNAPSHOT_FIELDS
+
+    def __init__(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> None:
         """
         Initializes the Rule object.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a firewatch rule.
+            defaults (RuleDefaults): The values used for "!default", shared by the rules of a configuration.
         """
-
-        self.logger = get_logger(__name__)
-        self.jira_project = self._get_jira_project(rule_dict)
-        self.jira_epic = self._get_jira_epic(rule_dict)
-        self.jira_component = self._get_jira_component(rule_dict)
-        self.jira_affects_version = self._get_jira_affects_version(rule_dict)
-        self.jira_additional_labels = self._get_jira_additional_labels(rule_dict)
-        self.jira_assignee = self._get_jira_assignee(rule_dict)
-        self.jira_priority = self._get_jira_priority(rule_dict)
-        self.jira_security_level = self._get_jira_security_level(rule_dict)
-        self.jira_watchers = self._get_jira_watchers(rule_dict)
-        self.jira_additional_assignees = self._get_jira_additional_assignees(rule_dict)
-        self.slack_channel = self._get_slack_channel(rule_dict)
+        self.jira_project = self._get_jira_project(rule_dict, defaults)
+        self.jira_epic = self._get_jira_epic(rule_dict, defaults)
+        self.jira_component = self._get_jira_component(rule_dict, defaults)
+        self.jira_affects_version = self._get_jira_affects_version(rule_dict, defaults)
+        self.jira_additional_labels = self._get_jira_additional_labels(rule_dict, defaults)
+        self.jira_assignee = self._get_jira_assignee(rule_dict, defaults)
+        self.jira_priority = self._get_jira_priority(rule_dict, defaults)
+        self.jira_security_level = self._get_jira_security_level(rule_dict, defaults)
+        self.jira_watchers = self._get_jira_watchers(rule_dict, defaults)
+        self.jira_additional_assignees = self._get_jira_additional_assignees(rule_dict, defaults)
+        self.slack_channel = self._get_slack_channel(rule_dict, defaults)
         self.slack_user = self._get_slack_user(rule_dict)
+        self.jobs = self._get_jobs(rule_dict)
+
+    def to_snapshot(self) -> dict[str, Any]:
+        """
+        Returns:
+            dict[str, Any]: The validated attributes of the rule, with defaults applied.
+        """
+        return {field: getattr(self, field) for field in self.SNAPSHOT_FIELDS}
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, Any]) -> Self:
+        """
+        Builds a rule from the output of to_snapshot without validating it again.
+
+        Args:
+            snapshot (dict[str, Any]): The validated attributes of the rule.
+
+        Returns:
+            Self: The rule object.
+        """
+        rule = cls.__new__(cls)
+        for field in cls.SNAPSHOT_FIELDS:
+            setattr(rule, field, snapshot.get(field))
+        return rule
 
-    def _get_jira_project(self, rule_dict: dict[Any, Any]) -> str:
+    def _get_jira_project(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> str:
         """
         Determines the Jira Project defined in a firewatch rule.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+            defaults (RuleDefaults): The values used for "!default".
 
         Returns:
             str: A string value representing the jira_project for a firewatch rule.
@@ -46,10 +93,10 @@ class Rule:
         jira_project = rule_dict.get("jira_project")
 
         if jira_project == "!default" or not jira_project:
-            jira_project = os.getenv("FIREWATCH_DEFAULT_JIRA_PROJECT")
+            jira_project = defaults.jira_project
 
         if not jira_project:
-            self.logger.error(
+            LOGGER.error(
                 f'Unable to find value for "jira_project" in firewatch rule and $FIREWATCH_DEFAULT_JIRA_PROJECT environemnt variable is not defined: "{rule_dict}"',
             )
             exit(1)
@@ -57,17 +104,18 @@ class Rule:
         if isinstance(jira_project, str):
             return jira_project
         else:
-            self.logger.error(
+            LOGGER.error(
                 f'Value for "jira_project" or $FIREWATCH_DEFAULT_JIRA_PROJECT is not a string in firewatch rule: "{rule_dict}"',
             )
             exit(1)
 
-    def _get_jira_epic(self, rule_dict: dict[Any, Any]) -> Optional[str]:
+    def _get_jira_epic(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[str]:
         """
         Determines if a Jira Epic is defined in a rule. If it is, validate it and return the string.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+            defaults (RuleDefaults): The values used for "!default".
 
         Returns:
             Optional[str]: A string of the Jira epic to use in a firewatch rule. If one is not defined, return None
@@ -77,20 +125,21 @@ class Rule:
 
         if isinstance(jira_epic, str) or not jira_epic:
             if jira_epic == "!default":
-                return os.getenv("FIREWATCH_DEFAULT_JIRA_EPIC")
+                return defaults.jira_epic
             return jira_epic
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "jira_epic" or $FIREWATCH_DEFAULT_JIRA_EPIC is not a string in firewatch rule: "{rule_dict}"',
         )
         exit(1)
 
-    def _get_jira_component(self, rule_dict: dict[Any, Any]) -> Optional[list[str]]:
+    def _get_jira_component(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[list[str]]:
         """
         Determines if one or more Jira Components are defined in firewatch rule. If it is, return a list of components.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+            defaults (RuleDefaults): The values used for "!default".
 
         Returns:
             Optional[list[str]]: A list of strings representing the component(s) defined in a firewatch rule. If not defined, return None
@@ -102,12 +151,12 @@ class Rule:
         if isinstance(jira_component, list):
             # If the list contains "!default", include the list in the environment variable
             if "!default" in jira_component:
-                default_components = os.getenv("FIREWATCH_DEFAULT_JIRA_COMPONENT")
+                default_components = defaults.jira_component
                 if default_components:
                     try:
                         default_components = json.loads(default_components)
                     except json.JSONDecodeError:
-                        self.logger.error(
+                        LOGGER.error(
                             f'Invalid JSON format for FIREWATCH_DEFAULT_JIRA_COMPONENT environment variable: "{default_components}"',
                         )
                         exit(1)
@@ -115,7 +164,7 @@ class Rule:
                     jira_component.remove("!default")
                     jira_component.extend(default_components)
                 else:
-                    self.logger.error(
+                    LOGGER.error(
                         "Environment variable $FIREWATCH_DEFAULT_JIRA_COMPONENT is not set.",
                     )
 
@@ -123,7 +172,7 @@ class Rule:
                 if isinstance(component, str):
                     components.append(component)
                 else:
-                    self.logger.error(
+                    LOGGER.error(
                         f'Component "{component}" in "jira_component" is not a string in firewatch rule: "{rule_dict}"',
                     )
                     exit(1)
@@ -131,17 +180,18 @@ class Rule:
         elif not jira_component:
             return jira_component
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "jira_component" must be a list of strings (multiple components) in firewatch rule: "{rule_dict}"',
         )
         exit(1)
 
-    def _get_jira_affects_version(self, rule_dict: dict[Any, Any]) -> Optional[str]:
+    def _get_jira_affects_version(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[str]:
         """
         Determines if the jira_affects_version value is set, if so, returns the string of that version affected.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+            defaults (RuleDefaults): The values used for "!default".
 
         Returns:
             Optional[str]: A string value representing the affected version for a firewatch rule.
@@ -151,10 +201,10 @@ class Rule:
 
         if isinstance(jira_affects_version, str) or not jira_affects_version:
             if jira_affects_version == "!default":
-                return os.getenv("FIREWATCH_DEFAULT_JIRA_AFFECTS_VERSION")
+                return defaults.jira_affects_version
             return jira_affects_version
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "jira_affects_version" or $FIREWATCH_DEFAULT_JIRA_AFFECTS_VERSION is not a string in firewatch rule: "{rule_dict}"',
         )
         exit(1)
@@ -162,12 +212,14 @@ class Rule:
     def _get_jira_additional_labels(
         self,
         rule_dict: dict[Any, Any],
+        defaults: RuleDefaults,
     ) -> Optional[list[str]]:
         """
         Determines if the jira_additional_labels value is set, if so, returns a list of strings of additional labels.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+            defaults (RuleDefaults): The values used for "!default".
 
         Returns:
             Optional[list[str]]: A list of strings representing additional labels.
@@ -179,12 +231,12 @@ class Rule:
         if isinstance(jira_additional_labels, list):
             # If the list contains "!default", include the list in the environment variable
             if "!default" in jira_additional_labels:
-                default_labels = os.getenv("FIREWATCH_DEFAULT_JIRA_ADDITIONAL_LABELS")
+                default_labels = defaults.jira_additional_labels
                 if default_labels:
                     try:
                         default_labels = json.loads(default_labels)
                     except json.JSONDecodeError:
-                        self.logger.error(
+                        LOGGER.error(
                             f'Invalid JSON format for $FIREWATCH_DEFAULT_JIRA_ADDITIONAL_LABELS environment variable: "{default_labels}"',
                         )
                         exit(1)
@@ -192,21 +244,21 @@ class Rule:
                     jira_additional_labels.remove("!default")
                     jira_additional_labels.extend(default_labels)
                 else:
-                    self.logger.error(
+                    LOGGER.error(
                         "Environment variable $FIREWATCH_DEFAULT_JIRA_ADDITIONAL_LABELS is not set.",
                     )
 
             for label in jira_additional_labels:
                 if isinstance(label, str):
                     if " " in label:
-                        self.logger.error(
+                        LOGGER.error(
                             f'Label "{label}" in rule {rule_dict} contains spaces. Remove spaces and try again.',
                         )
                         exit(1)
                     else:
                         labels.append(label)
                 else:
-                    self.logger.error(
+                    LOGGER.error(
                         f'Label "{label}" in "jira_additional_labels" is not a string in firewatch rule: "{rule_dict}"',
                     )
                     exit(1)
@@ -214,17 +266,18 @@ class Rule:
         elif not jira_additional_labels:
             return jira_additional_labels
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "jira_additional_labels" is not a list of strings (["label1", "label2"]) in firewatch rule: "{rule_dict}"',
         )
         exit(1)
 
-    def _get_jira_assignee(self, rule_dict: dict[Any, Any]) -> Optional[str]:
+    def _get_jira_assignee(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[str]:
         """
         Determines if a Jira Assignee is defined in a rule. If it is, validate it and return the string.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+            defaults (RuleDefaults): The values used for "!default".
 
         Returns:
             Optional[str]: A string of the Jira assignee to use in a firewatch rule. If one is not defined, return None
@@ -232,13 +285,13 @@ class Rule:
         jira_assignee = rule_dict.get("jira_assignee")
 
         if jira_assignee == "!default":
-            jira_assignee = os.getenv("FIREWATCH_DEFAULT_JIRA_ASSIGNEE")
+            jira_assignee = defaults.jira_assignee
 
         if isinstance(jira_assignee, str):
             if re.fullmatch(EMAIL_REGEX, jira_assignee):
                 return jira_assignee
             else:
-                self.logger.error(
+                LOGGER.error(
                     f'Value for "jira_assignee" or $FIREWATCH_DEFAULT_JIRA_ASSIGNEE is not an email address in firewatch rule: "{rule_dict}"',
                 )
                 exit(1)
@@ -246,17 +299,18 @@ class Rule:
         elif not jira_assignee:
             return jira_assignee
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "jira_assignee" or $FIREWATCH_DEFAULT_JIRA_ASSIGNEE is not a string in firewatch rule: "{rule_dict}"',
         )
         exit(1)
 
-    def _get_jira_priority(self, rule_dict: dict[Any, Any]) -> Optional[str]:
+    def _get_jira_priority(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[str]:
         """
         Determines if a Jira priority is defined in a rule. If it is, validate it and return the string.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+            defaults (RuleDefaults): The values used for "!default".
 
         Returns:
             Optional[str]: A string of the Jira priority to use in a firewatch rule. If one is not defined, return None
@@ -268,31 +322,32 @@ class Rule:
         if isinstance(jira_priority, str):
             # If the value is "!default", check the environment variable
             if jira_priority == "!default":
-                jira_priority = os.getenv("FIREWATCH_DEFAULT_JIRA_PRIORITY")
+                jira_priority = defaults.jira_priority
 
             jira_priority = jira_priority.lower().capitalize() if isinstance(jira_priority, str) else None
 
             if jira_priority in valid_priority_values:
                 return jira_priority
             else:
-                self.logger.error(
+                LOGGER.error(
                     f'Value for "jira_priority" or $FIREWATCH_DEFAULT_JIRA_PRIORITY is not a valid value ({valid_priority_values}) in firewatch rule: "{rule_dict}" ',
                 )
                 exit(1)
         elif not jira_priority:
             return jira_priority
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "jira_priority" or $FIREWATCH_DEFAULT_JIRA_PRIORITY is not a string in firewatch rule: "{rule_dict}"',
         )
         exit(1)
 
-    def _get_jira_security_level(self, rule_dict: dict[Any, Any]) -> Optional[str]:
+    def _get_jira_security_level(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[str]:
         """
         Determines if a Jira security level is defined in a rule. If it is, validate it and return the string.
 
         Args:
             rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+            defaults (RuleDefaults): The values used for "!default".
 
         Returns:
             Optional[str]: A string of the Jira security level to use in a firewatch rule. If one is not defined, return None
@@ -302,11 +357,11 @@ class Rule:
         if isinstance(jira_security_level, str) or not jira_security_level:
             # If the value is "!default", check the environment variable
             if jira_security_level == "!default":
-                jira_security_level = os.getenv("FIREWATCH_DEFAULT_JIRA_SECURITY_LEVEL")
+                jira_security_level = defaults.jira_security_level
 
             return jira_security_level
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "jira_security_level" or $FIREWATCH_DEFAULT_JIRA_SECURITY_LEVEL is not a string in firewatch rule: "{rule_dict}"',
         )
         exit(1)
@@ -315,18 +370,19 @@ class Rule:
         self,
         rule_dict: dict[Any, Any],
         field_name: str,
-        env_var: str,
+        default_emails: Optional[str],
     ) -> Optional[list[str]]:
+        env_var = f"FIREWATCH_DEFAULT_{field_name.upper()}"
         values = rule_dict.get(field_name)
 
         if isinstance(values, list):
             if "!default" in values:
-                defaults = os.getenv(env_var)
+                defaults = default_emails
                 if defaults:
                     try:
                         defaults = json.loads(defaults)
                     except json.JSONDecodeError:
-                        self.logger.error(
+                        LOGGER.error(
                             f'Invalid JSON format for {env_var} environment variable: "{defaults}"',
                         )
                         exit(1)
@@ -334,7 +390,7 @@ class Rule:
                     values.remove("!default")
                     values.extend(defaults)
                 else:
-                    self.logger.error(
+                    LOGGER.error(
                         f"Environment variable ${env_var} is not set.",
                     )
                     exit(1)
@@ -344,7 +400,7 @@ class Rule:
                 if isinstance(entry, str) and re.fullmatch(EMAIL_REGEX, entry):
                     emails.append(entry)
                 else:
-                    self.logger.error(
+                    LOGGER.error(
                         f'Value "{entry}" in "{field_name}" is not a valid email address in firewatch rule: "{rule_dict}"',
                     )
                     exit(1)
@@ -352,20 +408,20 @@ class Rule:
         elif not values:
             return values
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "{field_name}" must be a list of email addresses in firewatch rule: "{rule_dict}"',
         )
         exit(1)
 
-    def _get_slack_channel(self, rule_dict: dict[Any, Any]) -> Optional[str]:
+    def _get_slack_channel(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[str]:
         slack_channel = rule_dict.get("slack_channel")
 
         if isinstance(slack_channel, str) or not slack_channel:
             if slack_channel == "!default":
-                return os.getenv("FIREWATCH_DEFAULT_SLACK_CHANNEL")
+                return defaults.slack_channel
             return slack_channel
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "slack_channel" or $FIREWATCH_DEFAULT_SLACK_CHANNEL is not a string in firewatch rule: "{rule_dict}"',
         )
         exit(1)
@@ -376,15 +432,45 @@ class Rule:
         if isinstance(slack_user, str) or not slack_user:
             return slack_user
 
-        self.logger.error(
+        LOGGER.error(
             f'Value for "slack_user" is not a string in firewatch rule: "{rule_dict}"',
         )
         exit(1)
 
-    def _get_jira_watchers(self, rule_dict: dict[Any, Any]) -> Optional[list[str]]:
-        return self._get_jira_email_list(rule_dict, "jira_watchers", "FIREWATCH_DEFAULT_JIRA_WATCHERS")
+    def _get_jira_watchers(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[list[str]]:
+        return self._get_jira_email_list(
+            rule_dict,
+            "jira_watchers",
+            defaults.jira_watchers,
+        )
 
-    def _get_jira_additional_assignees(self, rule_dict: dict[Any, Any]) -> Optional[list[str]]:
+    def _get_jira_additional_assignees(self, rule_dict: dict[Any, Any], defaults: RuleDefaults) -> Optional[list[str]]:
         return self._get_jira_email_list(
-            rule_dict, "jira_additional_assignees", "FIREWATCH_DEFAULT_JIRA_ADDITIONAL_ASSIGNEES"
+            rule_dict,
+            "jira_additional_assignees",
+            defaults.jira_additional_assignees,
+        )
+
+    def _get_jobs(self, rule_dict: dict[Any, Any]) -> Optional[list[str]]:
+        """
+        Determines the job name patterns a rule is scoped to.
+
+        Args:
+            rule_dict (dict[Any, Any]): A dictionary object representing a user-defined firewatch rule.
+
+        Returns:
+            Optional[list[str]]: A list of job name patterns (fnmatch syntax). If not defined, return None and the rule applies to every job.
+        """
+        jobs = rule_dict.get("jobs")
+
+        if jobs is None:
+            return None
+        if isinstance(jobs, str):
+            return [jobs]
+        if isinstance(jobs, list) and jobs and all(isinstance(job, str) for job in jobs):
+            return jobs
+
+        LOGGER.error(
+            f'Value for "jobs" must be a string or a non-empty list of strings in firewatch rule: "{rule_dict}"',
         )
+        exit(1)
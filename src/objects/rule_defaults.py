@@ -0,0 +1,61 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+from typing import Self
+
+# The environment variable each rule default is read from
+RULE_DEFAULT_ENV_VARS = {
+    "jira_project": "FIREWATCH_DEFAULT_JIRA_PROJECT",
+    "jira_epic": "FIREWATCH_DEFAULT_JIRA_EPIC",
+    "jira_component": "FIREWATCH_DEFAULT_JIRA_COMPONENT",
+    "jira_affects_version": "FIREWATCH_DEFAULT_JIRA_AFFECTS_VERSION",
+    "jira_additional_labels": "FIREWATCH_DEFAULT_JIRA_ADDITIONAL_LABELS",
+    "jira_assignee": "FIREWATCH_DEFAULT_JIRA_ASSIGNEE",
+    "jira_priority": "FIREWATCH_DEFAULT_JIRA_PRIORITY",
+    "jira_security_level": "FIREWATCH_DEFAULT_JIRA_SECURITY_LEVEL",
+    "jira_watchers": "FIREWATCH_DEFAULT_JIRA_WATCHERS",
+    "jira_additional_assignees": "FIREWATCH_DEFAULT_JIRA_ADDITIONAL_ASSIGNEES",
+    "slack_channel": "FIREWATCH_DEFAULT_SLACK_CHANNEL",
+}
+
+
+@dataclass(frozen=True, slots=True)
+class RuleDefaults:
+    """
+    The values firewatch rules use for "!default", read from the FIREWATCH_DEFAULT_* environment variables once and
+    shared by every rule of a configuration. List values are kept as the raw JSON string and are only parsed by the
+    rules that use them.
+
+    Attributes:
+        jira_project (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_PROJECT.
+        jira_epic (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_EPIC.
+        jira_component (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_COMPONENT.
+        jira_affects_version (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_AFFECTS_VERSION.
+        jira_additional_labels (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_ADDITIONAL_LABELS.
+        jira_assignee (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_ASSIGNEE.
+        jira_priority (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_PRIORITY.
+        jira_security_level (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_SECURITY_LEVEL.
+        jira_watchers (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_WATCHERS.
+        jira_additional_assignees (Optional[str]): The value of $FIREWATCH_DEFAULT_JIRA_ADDITIONAL_ASSIGNEES.
+        slack_channel (Optional[str]): The value of $FIREWATCH_DEFAULT_SLACK_CHANNEL.
+    """
+
+    jira_project: Optional[str] = None
+    jira_epic: Optional[str] = None
+    jira_component: Optional[str] = None
+    jira_affects_version: Optional[str] = None
+    jira_additional_labels: Optional[str] = None
+    jira_assignee: Optional[str] = None
+    jira_priority: Optional[str] = None
+    jira_security_level: Optional[str] = None
+    jira_watchers: Optional[str] = None
+    jira_additional_assignees: Optional[str] = None
+    slack_channel: Optional[str] = None
+
+    @classmethod
+    def from_env(cls) -> Self:
+        """
+        Returns:
+            Self: The defaults defined in the environment.
+        """
+        return cls(**{field: os.getenv(env_var) for field, env_var in RULE_DEFAULT_ENV_VARS.items()})
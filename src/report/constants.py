@@ -16,3 +16,7 @@
 #
 JOB_PASSED_SINCE_TICKET_CREATED_LABEL = "job_passed_since_ticket_created"
 JOB_RETRIGGERED_IN_CURRENT_WEEK_LABEL = "job_retriggered_since_ticket_created"
+
+# The past bugs listed in new issue descriptions, only the fields rendered in the table are fetched
+PAST_BUGS_LIMIT = 10
+PAST_BUGS_FIELDS = ["key", "created", "assignee"]
@@ -13,6 +13,7 @@ from simple_logger.logger import get_logger
 from src.objects.configuration import Configuration
 from src.objects.failure import Failure
 from src.objects.failure_rule import FailureRule
+from src.objects.failure_rule_matcher import FailureRuleMatcher
 from src.objects.jira_adf import adf_doc
 from src.objects.jira_adf import heading
 from src.objects.jira_adf import inline_text
@@ -20,7 +21,10 @@ from src.objects.jira_adf import paragraph
 from src.objects.jira_base import Jira
 from src.objects.job import Job
 from src.objects.rule import Rule
+from src.objects.rule_defaults import RuleDefaults
 from src.report.constants import JOB_PASSED_SINCE_TICKET_CREATED_LABEL, JOB_RETRIGGERED_IN_CURRENT_WEEK_LABEL
+from src.report.constants import PAST_BUGS_FIELDS
+from src.report.constants import PAST_BUGS_LIMIT
 
 
 class Report:
@@ -34,15 +38,20 @@ class Report:
         """
         self.logger = get_logger(__name__)
 
+        # A job without steps can not be reported, check it before anything is written to Jira
+        job.validate_steps()
+
         # If job is a rehearsal
         if job.is_rehearsal:
-            self.logger.info(f"Deleting job directory: {job.download_path}")
+            # Failures are only downloaded if a fail flag needs them, so the job directory is deleted afterward
             try:
-                shutil.rmtree(job.download_path)
-            except Exception as error:
-                self.logger.error(f"Error deleting job directory: {error}")
-
-            self.exit_on_failures(firewatch_config=firewatch_config, job=job)
+                self.exit_on_failures(firewatch_config=firewatch_config, job=job)
+            finally:
+                self.logger.info(f"Deleting job directory: {job.download_path}")
+                try:
+                    shutil.rmtree(job.download_path)
+                except Exception as error:
+                    self.logger.error(f"Error deleting job directory: {error}")
 
             exit(0)
 
@@ -143,6 +152,9 @@ class Report:
                 failure=failure,
                 rules=firewatch_config.failure_rules,  # type: ignore
                 default_jira_project=firewatch_config.default_jira_project,
+                rule_defaults=firewatch_config.rule_defaults,
+                matcher=firewatch_config.failure_rule_matcher,
+                default_rule=firewatch_config.default_failure_rule,
             )
             for rule in rule_matches:
                 rule_failure_pairs.append({"rule": rule, "failure": failure})
@@ -375,6 +387,9 @@ class Report:
         failure: Failure,
         rules: list[FailureRule],
         default_jira_project: str,
+        rule_defaults: RuleDefaults,
+        matcher: Optional[FailureRuleMatcher] = None,
+        default_rule: Optional[FailureRule] = None,
     ) -> list[FailureRule]:
         """
         Used to check if a failure matches any rules in the firewatch config.
@@ -383,6 +398,9 @@ class Report:
             failure (Failure): A Failure object representing a failure found in a prow job.
             rules (list[Rule]): A list of Rule objects from the firewatch config.
             default_jira_project (str): A string object representing the default Jira project to report bugs to if there isn't a matching rule.
+            rule_defaults (RuleDefaults): The values used for "!default" by the rule built when default_rule is not set.
+            matcher (Optional[FailureRuleMatcher]): The compiled matcher of rules. If not set, rules are compiled for this call.
+            default_rule (Optional[FailureRule]): The rule to use if the failure matches no rule. If not set, a rule reporting to default_jira_project is built for this call.
 
         Returns:
             list[Rule]: A list of Rule objects that represents the list of Rules a failure matches.
@@ -390,24 +408,25 @@ class Report:
         matching_rules = []
         ignored_rules = []
 
-        default_rule_dict = {
-            "step": "!none",
-            "failure_type": "!none",
-            "classification": "!none",
-            "jira_project": default_jira_project,
-        }
-        default_rule = FailureRule(default_rule_dict)
-
-        for rule in rules:
-            if rule.matches_failure(failure):
-                if rule.ignore:
-                    ignored_rules.append(rule)
-                else:
-                    matching_rules.append(rule)
+        if matcher is None:
+            matcher = FailureRuleMatcher(rules=rules)
+
+        for rule in matcher.match(failure):
+            if rule.ignore:
+                ignored_rules.append(rule)
+            else:
+                matching_rules.append(rule)
 
         if (len(matching_rules) < 1) and (len(ignored_rules) < 1):
-            if default_rule not in matching_rules:
-                matching_rules.append(default_rule)
+            if default_rule is None:
+                default_rule_dict = {
+                    "step": "!none",
+                    "failure_type": "!none",
+                    "classification": "!none",
+                    "jira_project": default_jira_project,
+                }
+                default_rule = FailureRule(rule_dict=default_rule_dict, defaults=rule_defaults)
+            matching_rules.append(default_rule)
 
         # Sort matching_rules by the identical rules to failure.step
         if matching_rules:
@@ -676,11 +695,15 @@ class Report:
                         relations[issue].append(key)
 
     def exit_on_failures(self, firewatch_config: Configuration, job: Job) -> None:
-        if firewatch_config.fail_with_test_failures and job.has_test_failures:
+        fail_with_test_failures = firewatch_config.fail_with_test_failures and job.has_test_failures
+        fail_with_pod_failures = firewatch_config.fail_with_pod_failures and job.has_pod_failures
+        job.log_skipped_gcs_calls()
+
+        if fail_with_test_failures:
             self.logger.error("Test failures found and --fail-with-test-failures flag is set. Exiting with exit code 1")
             exit(1)
 
-        if firewatch_config.fail_with_pod_failures and job.has_pod_failures:
+        if fail_with_pod_failures:
             self.logger.error("Pod failures found and --fail-with-pod-failures flag is set. Exiting with exit code 1")
             exit(1)
 
@@ -900,13 +923,14 @@ class Report:
         # AND is unresolved
         # AND issue is of type "bug"
         jql_query = f'labels="{job_name}" AND labels="firewatch" AND labels!="ignore-passing-notification" AND resolution = Unresolved AND Issuetype = bug'
-        open_bugs = jira.search_issues(jql_query=jql_query)
+        open_bugs: list[str] = []
+        for bug in jira.iter_search_issues(jql_query=jql_query):
+            if not open_bugs:
+                self.logger.info(f"Found open bugs for job {job_name}:")
+            self.logger.info(f"{jira.url}/browse/{bug}")
+            open_bugs.append(bug)
 
         if len(open_bugs) > 0:
-            self.logger.info(f"Found open bugs for job {job_name}:")
-            for bug in open_bugs:
-                self.logger.info(f"{jira.url}/browse/{bug}")
-
             return open_bugs
         else:
             return None
@@ -931,13 +955,13 @@ class Report:
             Optional[list[jira.Issue]]: An optional list of Jira issues from firewatch that are from a specific failed step and failure type.
         """
         failed_test_filter = f'AND labels="{failed_test_name}"' if failed_test_name else ""
-        list_of_issues = jira.search(
+        # Only the most recent issues are listed, so only they are fetched
+        return jira.search(
             jql_query=f'labels="{failed_step}" AND labels="{failure_type}" {failed_test_filter} AND resolution != Unresolved ORDER BY created DESC',
+            max_results=PAST_BUGS_LIMIT,
+            fields=PAST_BUGS_FIELDS,
         )
 
-        # Reduce to 10 most recent issues
-        return list_of_issues[:10]
-
     def _get_past_bugs_table(self, issues: list[jira.Issue], jira: Jira) -> str:
         """
         Used to build the table of bugs related to a specific step/failure type that will be put in issue descriptions
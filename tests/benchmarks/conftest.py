@@ -0,0 +1,59 @@
+import os
+
+import pytest
+
+from src.objects.job import Job
+from tests.benchmarks.helpers import JOB_NAME
+from tests.benchmarks.helpers import BaselineCheck
+from tests.benchmarks.helpers import build_configuration
+from tests.benchmarks.helpers import config_json
+from tests.benchmarks.helpers import generate_rules
+
+# The benchmarks are not part of the unit tests, skip them if pytest-benchmark is not installed
+pytest.importorskip("pytest_benchmark")
+
+RULE_COUNTS = [100, 1000]
+
+
+@pytest.fixture(autouse=True)
+def mock_required_env_vars(monkeypatch):
+    monkeypatch.setenv("FIREWATCH_DEFAULT_JIRA_PROJECT", "LPTOCPCI")
+    monkeypatch.setenv("FIREWATCH_DEFAULT_JIRA_COMPONENT", '["default-component"]')
+    monkeypatch.setenv("FIREWATCH_DEFAULT_JIRA_ADDITIONAL_LABELS", '["default-label"]')
+
+
+@pytest.fixture(params=RULE_COUNTS, ids=[f"{count}-rules" for count in RULE_COUNTS])
+def rule_count(request):
+    yield request.param
+
+
+@pytest.fixture
+def synthetic_config_env(monkeypatch, rule_count):
+    monkeypatch.setenv("FIREWATCH_CONFIG", config_json(rules=generate_rules(count=rule_count)))
+
+
+@pytest.fixture
+def firewatch_config(synthetic_config_env):
+    yield build_configuration()
+
+
+@pytest.fixture
+def job(monkeypatch, tmp_path, firewatch_config):
+    # No GCS access: the artifacts are generated on disk, and the job directory is created under tmp_path instead of /tmp
+    monkeypatch.setattr(Job, "_get_download_path", lambda self, build_id: tmp_path.as_posix())
+    yield Job(
+        name=JOB_NAME,
+        name_safe="openshift-pipelines-interop-aws",
+        build_id="1805119554108526592",
+        gcs_bucket="test-platform-results",
+        gcs_creds_file=None,
+        firewatch_config=firewatch_config,
+    )
+
+
+@pytest.fixture(scope="session")
+def baseline_check():
+    check = BaselineCheck(save=os.getenv("FIREWATCH_SAVE_BENCHMARK_BASELINE") == "1")
+    yield check
+    if check.save:
+        check.write()
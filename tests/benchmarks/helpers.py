@@ -0,0 +1,201 @@
+import fnmatch
+import json
+import os
+import shutil
+import timeit
+from collections.abc import Callable
+from typing import Any
+
+from src.objects.configuration import Configuration
+from src.objects.failure import Failure
+
+BASELINE_PATH = os.path.join(os.path.dirname(__file__), "baseline.json")
+# A hot path fails the run if it is this many times slower than its baseline
+MAX_SLOWDOWN = 2.0
+
+RESOURCES_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "unittests", "resources")
+
+# Step name stems taken from the unit test fixtures, repeated with a numeric suffix to reach the requested scale
+STEP_NAME_STEMS = ["gather-must-gather", "gather-extra", "mtr-tests-ui", "firewatch-report-issues"]
+JOB_NAME = "periodic-ci-openshift-pipelines-release-tests-release-v1.14-openshift-pipelines-ocp4.16-lp-interop-openshift-pipelines-interop-aws"
+
+JUNIT_TESTCASE_PASSED = '\t\t<testcase classname="{suite}" name="{name}" time="0.1"></testcase>\n'
+JUNIT_TESTCASE_FAILED = (
+    '\t\t<testcase classname="{suite}" name="{name}" time="0.1">'
+    '<failure message="failed" type="">=== RUN {name}\n--- FAIL: {name}</failure></testcase>\n'
+)
+
+
+def step_name(index: int) -> str:
+    return f"{STEP_NAME_STEMS[index % len(STEP_NAME_STEMS)]}-{index}"
+
+
+def generate_rules(count: int, group_size: int = 4) -> list[dict[str, Any]]:
+    """
+    Generates failure rules shaped like a large shared config: exact steps, wildcard patterns and priority groups.
+
+    Args:
+        count (int): The number of rules.
+        group_size (int): The number of rules in each priority group. Every other group of rules has no group.
+
+    Returns:
+        list[dict[str, Any]]: The rule dictionaries.
+    """
+    rules = []
+    for index in range(count):
+        rule: dict[str, Any] = {
+            "failure_type": ("pod_failure", "test_failure", "all")[index % 3],
+            "classification": f"classification-{index}",
+            "jira_project": "LPTOCPCI",
+            "jira_component": ["!default", f"component-{index % 7}"],
+            "jira_additional_labels": ["!default", f"label-{index % 5}"],
+        }
+        # One rule in four uses a pattern, the rest name an exact step
+        rule["step"] = (
+            f"{STEP_NAME_STEMS[index % len(STEP_NAME_STEMS)]}-{index}*" if index % 4 == 0 else step_name(index)
+        )
+        if (index // group_size) % 2 == 0:
+            rule["group"] = {"name": f"group-{index // group_size}", "priority": index % group_size + 1}
+        rules.append(rule)
+    return rules
+
+
+def generate_failures(count: int) -> list[Failure]:
+    """
+    Args:
+        count (int): The number of failures.
+
+    Returns:
+        list[Failure]: Failures of distinct steps, alternating between pod and test failures.
+    """
+    return [
+        Failure(step=step_name(index), failure_type=("pod_failure", "test_failure")[index % 2])
+        for index in range(count)
+    ]
+
+
+def generate_job_artifacts(base_dir: str, step_count: int, testcase_count: int) -> tuple[str, str]:
+    """
+    Writes the logs and JUnit artifacts of a job with the same layout as the unit test fixtures: a finished.json per
+    step in the logs directory and a JUnit file per step in the artifacts directory. One step in three failed, and one
+    test case in ten failed.
+
+    Args:
+        base_dir (str): The directory the job directories are created in.
+        step_count (int): The number of steps.
+        testcase_count (int): The total number of JUnit test cases, spread over the steps.
+
+    Returns:
+        tuple[str, str]: The logs directory and the artifacts directory.
+    """
+    logs_dir = os.path.join(base_dir, "logs")
+    junit_dir = os.path.join(base_dir, "artifacts")
+
+    testcases_per_step = max(testcase_count // step_count, 1)
+    for index in range(step_count):
+        step = step_name(index)
+
+        os.makedirs(os.path.join(logs_dir, step))
+        pod_resource = "pod_fail.json" if index % 3 == 0 else "pod_success.json"
+        shutil.copy(os.path.join(RESOURCES_DIR, pod_resource), os.path.join(logs_dir, step, "finished.json"))
+
+        os.makedirs(os.path.join(junit_dir, step))
+        with open(os.path.join(junit_dir, step, f"junit_{step}.xml"), "w") as file:
+            file.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites name="synthetic">\n')
+            file.write(f'\t<testsuite name="{step}" tests="{testcases_per_step}">\n')
+            for case in range(testcases_per_step):
+                template = JUNIT_TESTCASE_FAILED if case % 10 == 0 else JUNIT_TESTCASE_PASSED
+                file.write(template.format(suite=step, name=f"Test{case}"))
+            file.write("\t</testsuite>\n</testsuites>\n")
+
+    return logs_dir, junit_dir
+
+
+def config_json(rules: list[dict[str, Any]]) -> str:
+    return json.dumps({"failure_rules": rules, "success_rules": [{"jira_project": "LPTOCPCI"}]})
+
+
+def build_configuration() -> Configuration:
+    return Configuration(
+        jira=None,  # type: ignore
+        fail_with_test_failures=False,
+        fail_with_pod_failures=False,
+        keep_job_dir=True,
+        verbose_test_failure_reporting=False,
+        config_cache_dir=None,
+    )
+
+
+def best_time(func: Callable[[], Any], repeat: int = 3) -> float:
+    """
+    Args:
+        func (Callable[[], Any]): The code to time. Fast code is run in loops of at least 0.2 seconds.
+        repeat (int): The number of loops.
+
+    Returns:
+        float: The time of one call in seconds, from the fastest loop, the one least disturbed by other work on the
+            machine.
+    """
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+    return min(timer.repeat(number=number, repeat=repeat)) / number
+
+
+def calibration_workload() -> None:
+    """
+    Plain Python work of the same kind as the hot paths (JSON decoding, glob matching and small objects) that does not
+    use firewatch code. Hot path timings are divided by its timing, so the stored baseline does not depend on the
+    speed of the machine.
+    """
+    rules = json.loads(config_json(rules=generate_rules(count=500)))["failure_rules"]
+    for index in range(200):
+        step = step_name(index)
+        _ = [
+            {"rule": rule, "step": step}
+            for rule in rules
+            if fnmatch.fnmatchcase(step, rule["step"]) or rule["failure_type"] == "all"
+        ]
+
+
+class BaselineCheck:
+    def __init__(self, save: bool = False) -> None:
+        """
+        Compares hot path timings with the baseline stored in tests/benchmarks/baseline.json. Timings are stored as a
+        multiple of the calibration workload timed in the same run.
+
+        Args:
+            save (bool): If true, the timings are recorded to be written as the new baseline instead of checked.
+        """
+        self.save = save
+        self.calibration = best_time(calibration_workload, repeat=5)
+        self.measured: dict[str, float] = {}
+        try:
+            with open(BASELINE_PATH) as file:
+                self.baseline: dict[str, float] = json.load(file)
+        except FileNotFoundError:
+            self.baseline = {}
+
+    def check(self, name: str, func: Callable[[], Any], repeat: int = 3) -> None:
+        """
+        Times a hot path and fails if it is more than MAX_SLOWDOWN times slower than its baseline.
+
+        Args:
+            name (str): The name of the hot path in the baseline.
+            func (Callable[[], Any]): The hot path to time.
+            repeat (int): The number of loops.
+        """
+        relative_time = best_time(func, repeat=repeat) / self.calibration
+        self.measured[name] = float(f"{relative_time:.4g}")
+        if self.save:
+            return
+
+        assert name in self.baseline, f"No baseline for {name}, record one with FIREWATCH_SAVE_BENCHMARK_BASELINE=1"
+        assert relative_time <= self.baseline[name] * MAX_SLOWDOWN, (
+            f"{name} took {relative_time:.2f} calibration runs, the baseline is {self.baseline[name]:.2f}"
+        )
+
+    def write(self) -> None:
+        """Writes the recorded timings as the new baseline, keeping the baseline of hot paths that were not run."""
+        with open(BASELINE_PATH, "w") as file:
+            json.dump({**self.baseline, **self.measured}, file, indent=2, sort_keys=True)
+            file.write("\n")
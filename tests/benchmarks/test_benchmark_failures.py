@@ -0,0 +1,28 @@
+import pytest
+
+from tests.benchmarks.helpers import generate_job_artifacts
+
+JOB_SIZES = [(50, 1000), (500, 10000)]
+
+
+@pytest.fixture(params=JOB_SIZES, ids=[f"{steps}-steps-{cases}-cases" for steps, cases in JOB_SIZES])
+def job_artifacts(request, tmp_path):
+    step_count, testcase_count = request.param
+    yield generate_job_artifacts(base_dir=tmp_path.as_posix(), step_count=step_count, testcase_count=testcase_count)
+
+
+def test_benchmark_job_find_failures(benchmark, job, job_artifacts):
+    logs_dir, junit_dir = job_artifacts
+
+    failures = benchmark(job._find_failures, logs_dir=logs_dir, junit_dir=junit_dir)
+
+    assert failures
+
+
+def test_job_find_failures_against_baseline(baseline_check, job, job_artifacts, request):
+    logs_dir, junit_dir = job_artifacts
+
+    baseline_check.check(
+        name=f"job_find_failures[{request.node.callspec.id}]",
+        func=lambda: job._find_failures(logs_dir=logs_dir, junit_dir=junit_dir),
+    )
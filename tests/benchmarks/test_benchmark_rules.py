@@ -0,0 +1,107 @@
+import timeit
+
+import pytest
+
+from src.report.report import Report
+from tests.benchmarks.helpers import build_configuration
+from tests.benchmarks.helpers import generate_failures
+
+FAILURE_COUNT = 200
+# The compiled matcher must stay at least this many times faster than checking every rule
+MIN_MATCHER_SPEEDUP = 2
+
+
+@pytest.mark.usefixtures("synthetic_config_env")
+def test_benchmark_configuration(benchmark, rule_count):
+    config = benchmark(build_configuration)
+
+    assert len(config.failure_rules) == rule_count
+
+
+def test_benchmark_failure_rule_matches_failure(benchmark, firewatch_config):
+    failures = generate_failures(count=FAILURE_COUNT)
+
+    def match_all():
+        return [
+            [rule for rule in firewatch_config.failure_rules if rule.matches_failure(failure)] for failure in failures
+        ]
+
+    matches = benchmark(match_all)
+
+    assert any(matches)
+
+
+def test_benchmark_failure_rule_matcher(benchmark, firewatch_config):
+    failures = generate_failures(count=FAILURE_COUNT)
+    matcher = firewatch_config.failure_rule_matcher
+
+    matches = benchmark(lambda: [matcher.match(failure) for failure in failures])
+
+    assert matches == [
+        [rule for rule in firewatch_config.failure_rules if rule.matches_failure(failure)] for failure in failures
+    ]
+
+
+def test_failure_rule_matcher_is_faster_than_matches_failure(firewatch_config):
+    # Both timings are taken in the same run on the same machine, so the check does not depend on the runner speed
+    failures = generate_failures(count=FAILURE_COUNT)
+    matcher = firewatch_config.failure_rule_matcher
+
+    matcher_time = min(timeit.repeat(lambda: [matcher.match(failure) for failure in failures], number=1, repeat=5))
+    matches_failure_time = min(
+        timeit.repeat(
+            lambda: [
+                [rule for rule in firewatch_config.failure_rules if rule.matches_failure(failure)]
+                for failure in failures
+            ],
+            number=1,
+            repeat=5,
+        )
+    )
+
+    assert matcher_time * MIN_MATCHER_SPEEDUP < matches_failure_time
+
+
+def test_benchmark_filter_priority_rule_failure_pairs(benchmark, firewatch_config):
+    matcher = firewatch_config.failure_rule_matcher
+    rule_failure_pairs = [
+        {"rule": rule, "failure": failure}
+        for failure in generate_failures(count=FAILURE_COUNT)
+        for rule in matcher.match(failure)
+    ]
+    # Report.__init__ reports the job, only the filtering is measured
+    report = Report.__new__(Report)
+
+    filtered_pairs = benchmark(report.filter_priority_rule_failure_pairs, rule_failure_pairs=rule_failure_pairs)
+
+    assert 0 < len(filtered_pairs) <= len(rule_failure_pairs)
+
+
+@pytest.mark.usefixtures("synthetic_config_env")
+def test_configuration_against_baseline(baseline_check, rule_count):
+    baseline_check.check(name=f"configuration[{rule_count}-rules]", func=build_configuration)
+
+
+def test_failure_rule_matcher_against_baseline(baseline_check, firewatch_config, rule_count):
+    failures = generate_failures(count=FAILURE_COUNT)
+    matcher = firewatch_config.failure_rule_matcher
+
+    baseline_check.check(
+        name=f"failure_rule_matcher[{rule_count}-rules]",
+        func=lambda: [matcher.match(failure) for failure in failures],
+    )
+
+
+def test_filter_priority_rule_failure_pairs_against_baseline(baseline_check, firewatch_config, rule_count):
+    matcher = firewatch_config.failure_rule_matcher
+    rule_failure_pairs = [
+        {"rule": rule, "failure": failure}
+        for failure in generate_failures(count=FAILURE_COUNT)
+        for rule in matcher.match(failure)
+    ]
+    report = Report.__new__(Report)
+
+    baseline_check.check(
+        name=f"filter_priority_rule_failure_pairs[{rule_count}-rules]",
+        func=lambda: report.filter_priority_rule_failure_pairs(rule_failure_pairs=rule_failure_pairs),
+    )
@@ -250,7 +250,7 @@ def test_process_issues(
     )
     escalation, mock_jira, _ = setup_jira_escalation
 
-    mock_jira.search_issues.return_value = [MagicMock(key="Issue-1")]
+    mock_jira.iter_search_issues.return_value = [MagicMock(key="Issue-1")]
     mock_jira.get_issue_by_id_or_key_with_changelog.return_value = fake_jira_issue
     escalation.process_issues(jira_query="project = test-project")
 
@@ -349,7 +349,7 @@ def test_issues_with_no_assignee(
         )
         issues_by_key[key] = issue
 
-    mock_jira_client.search_issues.side_effect = [
+    mock_jira_client.iter_search_issues.side_effect = [
         [k for k in query1_issues],
         [k for k in query2_issues],
         [k for k in query3_issues],
@@ -8,7 +8,7 @@ from unittest.mock import patch
 
 
 class TestFailureMatchesRule(ReportBaseTest):
-    failure = Failure(failed_step="failed-step", failure_type="test_failure")
+    failure = Failure(step="failed-step", failure_type="test_failure")
 
     def test_failure_matches_rule_failure_has_no_match(self):
         default_rule_dict = {
@@ -17,7 +17,7 @@ class TestFailureMatchesRule(ReportBaseTest):
             "classification": "!none",
             "jira_project": self.config.default_jira_project,
         }
-        default_rule = FailureRule(default_rule_dict)
+        default_rule = FailureRule(rule_dict=default_rule_dict, defaults=self.config.rule_defaults)
         no_match_rule = FailureRule(
             rule_dict={
                 "step": "other-step",
@@ -25,16 +25,31 @@ class TestFailureMatchesRule(ReportBaseTest):
                 "classification": "NONE",
                 "jira_project": "NONE",
             },
+            defaults=self.config.rule_defaults,
         )
         rules = [no_match_rule]
         matching_rules = self.report.failure_matches_rule(
             failure=self.failure,
             rules=rules,
             default_jira_project=self.config.default_jira_project,
+            rule_defaults=self.config.rule_defaults,
         )
         assert len(matching_rules) == 1
         assert matching_rules[0].step == default_rule.step
 
+    def test_failure_matches_rule_reuses_default_rule(self):
+        default_rule = self.config.default_failure_rule
+        for _ in range(2):
+            matching_rules = self.report.failure_matches_rule(
+                failure=self.failure,
+                rules=[],
+                default_jira_project=self.config.default_jira_project,
+                rule_defaults=self.config.rule_defaults,
+                default_rule=default_rule,
+            )
+            assert matching_rules == [default_rule]
+        assert default_rule.jira_project == self.config.default_jira_project
+
     def test_failure_matches_rule_failure_matches_ignore_rule(self):
         ignore_rule = FailureRule(
             rule_dict={
@@ -44,12 +59,14 @@ class TestFailureMatchesRule(ReportBaseTest):
                 "jira_project": "NONE",
                 "ignore": "true",
             },
+            defaults=self.config.rule_defaults,
         )
         rules = [ignore_rule]
         matching_rules = self.report.failure_matches_rule(
             failure=self.failure,
             rules=rules,
             default_jira_project=self.config.default_jira_project,
+            rule_defaults=self.config.rule_defaults,
         )
         assert len(matching_rules) == 0
 
@@ -61,12 +78,14 @@ class TestFailureMatchesRule(ReportBaseTest):
                 "classification": "NONE",
                 "jira_project": "NONE",
             },
+            defaults=self.config.rule_defaults,
         )
         rules = [match_rule]
         matching_rules = self.report.failure_matches_rule(
             failure=self.failure,
             rules=rules,
             default_jira_project=self.config.default_jira_project,
+            rule_defaults=self.config.rule_defaults,
         )
         assert len(matching_rules) == 1
         assert (matching_rules[0].step == match_rule.step) and (
@@ -74,7 +93,7 @@ class TestFailureMatchesRule(ReportBaseTest):
         )
 
     def test_configuration_gets_failure_rules_with_two_matching_steps(self):
-        failure = Failure(failed_step="exact-failed-step", failure_type="test_failure")
+        failure = Failure(step="exact-failed-step", failure_type="test_failure")
 
         match_rule = FailureRule(
             rule_dict={
@@ -83,6 +102,7 @@ class TestFailureMatchesRule(ReportBaseTest):
                 "classification": "NONE",
                 "jira_project": "NONE",
             },
+            defaults=self.config.rule_defaults,
         )
         pattern_rule = FailureRule(
             rule_dict={
@@ -91,6 +111,7 @@ class TestFailureMatchesRule(ReportBaseTest):
                 "classification": "NONE",
                 "jira_project": "NONE",
             },
+            defaults=self.config.rule_defaults,
         )
         rules = [pattern_rule, match_rule]
 
@@ -98,12 +119,13 @@ class TestFailureMatchesRule(ReportBaseTest):
             failure=failure,
             rules=rules,
             default_jira_project=self.config.default_jira_project,
+            rule_defaults=self.config.rule_defaults,
         )
         # Check if match_rule is sorted higher than pattern_rule
         assert matching_rules[0].step.__eq__(failure.step)
 
     def test_configuration_gets_failure_with_ignore_all_steps(self):
-        failure = Failure(failed_step="exact-failed-step", failure_type="test_failure")
+        failure = Failure(step="exact-failed-step", failure_type="test_failure")
 
         match_rule = FailureRule(
             rule_dict={
@@ -112,6 +134,7 @@ class TestFailureMatchesRule(ReportBaseTest):
                 "classification": "NONE",
                 "jira_project": "NONE",
             },
+            defaults=self.config.rule_defaults,
         )
         ignore_rule = FailureRule(
             rule_dict={
@@ -121,6 +144,7 @@ class TestFailureMatchesRule(ReportBaseTest):
                 "classification": "NONE",
                 "jira_project": "NONE",
             },
+            defaults=self.config.rule_defaults,
         )
         rules = [ignore_rule, match_rule]
 
@@ -128,6 +152,7 @@ class TestFailureMatchesRule(ReportBaseTest):
             failure=failure,
             rules=rules,
             default_jira_project=self.config.default_jira_project,
+            rule_defaults=self.config.rule_defaults,
         )
         # Check if match_rule is sorted higher than pattern_rule
         assert matching_rules[0].step.__eq__(failure.step)
@@ -140,7 +165,7 @@ class TestFailureMatchesRule(ReportBaseTest):
         },
     )
     def test_configuration_gets_failure_rules_with_specific_step_prioritized_over_pattern(self):
-        failure = Failure(failed_step="specific-step-logic", failure_type="test_failure")
+        failure = Failure(step="specific-step-logic", failure_type="test_failure")
 
         base_config_data = (
             '{"failure_rules": [{"step": "*step-logic*", "failure_type": "test_failure", '
@@ -152,11 +177,14 @@ class TestFailureMatchesRule(ReportBaseTest):
                 f.write(base_config_data)
 
             config = self.config._get_config_data(base_config_file_path=base_config_file)
-            rules = [FailureRule(rule_dict=rule) for rule in config.get("failure_rules")]
+            rules = [
+                FailureRule(rule_dict=rule, defaults=self.config.rule_defaults) for rule in config.get("failure_rules")
+            ]
             matching_rules = self.report.failure_matches_rule(
                 failure=failure,
                 rules=rules,
                 default_jira_project=self.config.default_jira_project,
+                rule_defaults=self.config.rule_defaults,
             )
 
             # Check that the specific rule is prioritised on top of the pattern
@@ -172,7 +200,7 @@ class TestFailureMatchesRule(ReportBaseTest):
         },
     )
     def test_configuration_gets_failure_rules_with_pattern_overriding_specific_step(self):
-        failure = Failure(failed_step="specific-step-logic", failure_type="test_failure")
+        failure = Failure(step="specific-step-logic", failure_type="test_failure")
 
         base_config_data = (
             '{"failure_rules": [{"step": "specific-step-logic", "failure_type": "test_failure", '
@@ -184,11 +212,14 @@ class TestFailureMatchesRule(ReportBaseTest):
                 f.write(base_config_data)
 
             config = self.config._get_config_data(base_config_file_path=base_config_file)
-            rules = [FailureRule(rule_dict=rule) for rule in config.get("failure_rules")]
+            rules = [
+                FailureRule(rule_dict=rule, defaults=self.config.rule_defaults) for rule in config.get("failure_rules")
+            ]
             matching_rules = self.report.failure_matches_rule(
                 failure=failure,
                 rules=rules,
                 default_jira_project=self.config.default_jira_project,
+                rule_defaults=self.config.rule_defaults,
             )
 
             # Keep only the pattern rule by overriding the one from the base config file
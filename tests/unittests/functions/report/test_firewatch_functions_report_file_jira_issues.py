@@ -33,7 +33,7 @@ class TestFileJiraIssues(ReportBaseTest):
         self.assertEqual(bugs_updated, [])
 
     def test_file_jira_issues_with_failures(self):
-        failures = [Failure(failed_step="step1", failure_type="pod_failure")]
+        failures = [Failure(step="step1", failure_type="pod_failure")]
 
         report = Report(self.config, self.job)
         result, bugs_updated = report.file_jira_issues(failures, self.config, self.job)
@@ -75,7 +75,7 @@ class TestBarebonesRuleEmitsJiraTicketFields(unittest.TestCase):
         patch.stopall()
 
     def test_matching_failure_passes_watchers_assignees_and_slack_labels(self):
-        failures = [Failure(failed_step="barebones-step", failure_type="pod_failure")]
+        failures = [Failure(step="barebones-step", failure_type="pod_failure")]
         report = Report(self.config, self.job)
         report.file_jira_issues(failures, self.config, self.job)
 
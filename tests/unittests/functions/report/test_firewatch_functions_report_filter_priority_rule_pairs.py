@@ -1,5 +1,6 @@
 from src.objects.failure import Failure
 from src.objects.failure_rule import FailureRule
+from src.objects.rule_defaults import RuleDefaults
 from tests.unittests.functions.report.report_base_test import ReportBaseTest
 
 
@@ -14,6 +15,7 @@ class TestFilterPriorityRulePairs(ReportBaseTest):
                 "jira_project": "NONE",
                 "group": {"name": "failed-steps", "priority": 1},
             },
+            defaults=RuleDefaults.from_env(),
         )
         group_rule_2 = FailureRule(
             rule_dict={
@@ -23,13 +25,14 @@ class TestFilterPriorityRulePairs(ReportBaseTest):
                 "jira_project": "NONE",
                 "group": {"name": "failed-steps", "priority": 2},
             },
+            defaults=RuleDefaults.from_env(),
         )
         group_failure_1 = Failure(
-            failed_step="failed-step-1",
+            step="failed-step-1",
             failure_type="test_failure",
         )
         group_failure_2 = Failure(
-            failed_step="failed-step-2",
+            step="failed-step-2",
             failure_type="test_failure",
         )
 
@@ -55,6 +58,7 @@ class TestFilterPriorityRulePairs(ReportBaseTest):
                 "classification": "NONE",
                 "jira_project": "NONE",
             },
+            defaults=RuleDefaults.from_env(),
         )
         rule_2 = FailureRule(
             rule_dict={
@@ -63,9 +67,10 @@ class TestFilterPriorityRulePairs(ReportBaseTest):
                 "classification": "NONE",
                 "jira_project": "NONE",
             },
+            defaults=RuleDefaults.from_env(),
         )
-        failure_1 = Failure(failed_step="failed-step-1", failure_type="test_failure")
-        failure_2 = Failure(failed_step="failed-step-2", failure_type="test_failure")
+        failure_1 = Failure(step="failed-step-1", failure_type="test_failure")
+        failure_2 = Failure(step="failed-step-2", failure_type="test_failure")
 
         original_rule_failure_pairs = [
             {"rule": rule_1, "failure": failure_1},
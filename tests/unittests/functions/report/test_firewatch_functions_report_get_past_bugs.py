@@ -0,0 +1,38 @@
+from unittest.mock import MagicMock
+
+from src.report.constants import PAST_BUGS_FIELDS
+from src.report.constants import PAST_BUGS_LIMIT
+from tests.unittests.functions.report.report_base_test import ReportBaseTest
+
+
+class TestGetPastBugs(ReportBaseTest):
+    def test_get_past_bugs_fetches_only_the_listed_issues_and_fields(self):
+        jira = MagicMock()
+        jira.search.return_value = ["TEST-2", "TEST-1"]
+
+        past_bugs = self.report._get_past_bugs(
+            failed_step="step1",
+            failure_type="test_failure",
+            jira=jira,
+            failed_test_name="test_a",
+        )
+
+        assert past_bugs == ["TEST-2", "TEST-1"]
+        jira.search.assert_called_once()
+        kwargs = jira.search.call_args.kwargs
+        assert kwargs["max_results"] == PAST_BUGS_LIMIT == 10
+        assert kwargs["fields"] == PAST_BUGS_FIELDS
+        assert 'labels="step1" AND labels="test_failure" AND labels="test_a"' in kwargs["jql_query"]
+        assert kwargs["jql_query"].endswith("ORDER BY created DESC")
+
+    def test_past_bugs_table_only_uses_projected_fields(self):
+        jira = MagicMock()
+        jira.url = "https://issues.example.com"
+        issue = MagicMock()
+        issue.key = "TEST-1"
+        issue.get_field.side_effect = {"created": "2024-01-02T03:04:05.000+0000", "assignee": "Someone"}.__getitem__
+
+        table = self.report._get_past_bugs_table(issues=[issue], jira=jira)
+
+        assert table.endswith("|[TEST-1|https://issues.example.com/browse/TEST-1]|2024-01-02|Someone|")
+        assert {call.args[0] for call in issue.get_field.call_args_list} <= set(PAST_BUGS_FIELDS)
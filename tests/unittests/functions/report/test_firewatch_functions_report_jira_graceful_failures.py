@@ -6,6 +6,7 @@ from jira.exceptions import JIRAError
 from src.objects.job import Job
 from src.objects.rule import Rule
 from src.report.report import Report
+from src.objects.rule_defaults import RuleDefaults
 
 
 @pytest.fixture
@@ -166,7 +167,7 @@ def test_report_success_logs_warning_when_create_issue_raises_jira_error(
     sample_job,
     monkeypatch,
 ):
-    rule = Rule(rule_dict={"jira_project": "LPTOCPCI"})
+    rule = Rule(rule_dict={"jira_project": "LPTOCPCI"}, defaults=RuleDefaults.from_env())
     config = MagicMock()
     config.success_rules = [rule]
     config.additional_labels_file = None
@@ -195,8 +196,8 @@ def test_report_success_continues_next_rule_after_create_issue_failure(
     sample_job,
     monkeypatch,
 ):
-    rule_a = Rule(rule_dict={"jira_project": "PROJA"})
-    rule_b = Rule(rule_dict={"jira_project": "PROJB"})
+    rule_a = Rule(rule_dict={"jira_project": "PROJA"}, defaults=RuleDefaults.from_env())
+    rule_b = Rule(rule_dict={"jira_project": "PROJB"}, defaults=RuleDefaults.from_env())
     config = MagicMock()
     config.success_rules = [rule_a, rule_b]
     config.additional_labels_file = None
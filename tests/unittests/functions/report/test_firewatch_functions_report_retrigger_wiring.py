@@ -1,5 +1,6 @@
 from unittest.mock import MagicMock
 
+import pytest
 
 from src.objects.job import Job
 from src.report.report import Report
@@ -46,3 +47,20 @@ def test_report_passes_job_to_add_retrigger_job_label_when_retriggered(monkeypat
 
     assert captured == [(jira_client, "ISSUE-1", job)]
     assert captured[0][2] is job
+
+
+def test_report_exits_before_jira_when_job_has_no_steps(monkeypatch):
+    job = MagicMock(spec=Job)
+    job.validate_steps.side_effect = SystemExit(1)
+    job.is_rehearsal = False
+    job.is_retriggered = True
+    config = MagicMock()
+
+    get_open_calls = []
+    monkeypatch.setattr(Report, "_get_open_bugs", lambda self, job_name, jira: get_open_calls.append(job_name))
+
+    with pytest.raises(SystemExit):
+        Report(firewatch_config=config, job=job)
+
+    assert get_open_calls == []
+    assert config.jira.method_calls == []
@@ -0,0 +1,97 @@
+import base64
+import hashlib
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from src.objects.artifact_cache import ArtifactCache
+from src.objects.artifact_downloader import ArtifactDownloader
+from src.objects.build_manifest import ManifestEntry
+
+
+def _entry(name: str, content: bytes, generation: int = 1) -> ManifestEntry:
+    return ManifestEntry(
+        name=name,
+        size=len(content),
+        generation=generation,
+        md5_hash=base64.b64encode(hashlib.md5(content).digest()).decode(),
+        step="step1",
+        relative_path=name,
+    )
+
+
+class TestArtifactCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache = ArtifactCache(cache_dir=f"{self.temp_dir.name}/cache", max_size_bytes=100)
+
+    def _write(self, name: str, content: bytes) -> str:
+        path = f"{self.temp_dir.name}/{name}"
+        with open(path, "wb") as file:
+            file.write(content)
+        return path
+
+    def test_store_and_fetch(self):
+        entry = _entry("junit.xml", b"content")
+        self.cache.store(entry=entry, file_path=self._write("junit.xml", b"content"))
+
+        target = f"{self.temp_dir.name}/restored.xml"
+        self.assertTrue(self.cache.fetch(entry=entry, file_path=target))
+        with open(target, "rb") as file:
+            self.assertEqual(file.read(), b"content")
+
+    def test_new_generation_is_a_miss(self):
+        self.cache.store(entry=_entry("junit.xml", b"content"), file_path=self._write("junit.xml", b"content"))
+
+        self.assertFalse(
+            self.cache.fetch(entry=_entry("junit.xml", b"content", generation=2), file_path=f"{self.temp_dir.name}/x"),
+        )
+
+    def test_corrupt_download_is_not_stored(self):
+        entry = _entry("junit.xml", b"content")
+        self.cache.store(entry=entry, file_path=self._write("junit.xml", b"truncated"))
+
+        self.assertFalse(self.cache.fetch(entry=entry, file_path=f"{self.temp_dir.name}/x"))
+
+    def test_unlisted_entry_is_not_cached(self):
+        entry = ManifestEntry(
+            name="finished.json",
+            size=None,
+            generation=None,
+            md5_hash=None,
+            step="step1",
+            relative_path="finished.json",
+            listed=False,
+        )
+        self.cache.store(entry=entry, file_path=self._write("finished.json", b"{}"))
+
+        self.assertEqual(os.listdir(self.cache.objects_dir), [])
+
+    def test_evicts_least_recently_used(self):
+        entries = [_entry(f"file{i}", bytes([i]) * 40) for i in range(3)]
+        for i, entry in enumerate(entries):
+            self.cache.store(entry=entry, file_path=self._write(entry.name, bytes([i]) * 40))
+            key = self.cache._get_key(entry=entry)
+            os.utime(self.cache._get_path(key=key), (i, i))
+
+        self.cache.evict()
+
+        target = f"{self.temp_dir.name}/x"
+        self.assertFalse(self.cache.fetch(entry=entries[0], file_path=target))
+        self.assertTrue(self.cache.fetch(entry=entries[1], file_path=target))
+        self.assertTrue(self.cache.fetch(entry=entries[2], file_path=target))
+
+    def test_downloader_skips_cached_objects(self):
+        entry = _entry("junit.xml", b"content")
+        manifest = MagicMock()
+        manifest.get_blob.return_value.download_to_file.side_effect = lambda target: target.write(b"content")
+        downloader = ArtifactDownloader(cache=self.cache)
+
+        downloader.download(manifest=manifest, targets=[(entry, f"{self.temp_dir.name}/first.xml")])
+        downloader.download(manifest=manifest, targets=[(entry, f"{self.temp_dir.name}/second.xml")])
+
+        manifest.get_blob.assert_called_once()
+        with open(f"{self.temp_dir.name}/second.xml", "rb") as file:
+            self.assertEqual(file.read(), b"content")
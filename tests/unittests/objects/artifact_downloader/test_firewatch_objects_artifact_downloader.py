@@ -0,0 +1,133 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+
+from google.api_core.exceptions import NotFound
+
+from src.objects.artifact_downloader import ArtifactDownloader
+from src.objects.build_manifest import ManifestEntry
+
+
+def _entry(name: str, size: int = 10, listed: bool = True) -> ManifestEntry:
+    return ManifestEntry(
+        name=name,
+        size=size,
+        generation=1,
+        md5_hash=None,
+        step="step1",
+        relative_path=name,
+        listed=listed,
+    )
+
+
+class FakeBlob:
+    def __init__(self, content: bytes, failures: int = 0, delay: float = 0.0, tracker: dict = None):
+        self.content = content
+        self.failures = failures
+        self.delay = delay
+        self.tracker = tracker
+
+    def download_to_file(self, target):
+        if self.tracker is not None:
+            with self.tracker["lock"]:
+                self.tracker["active"] += 1
+                self.tracker["peak"] = max(self.tracker["peak"], self.tracker["active"])
+        try:
+            time.sleep(self.delay)
+            if self.failures > 0:
+                self.failures -= 1
+                target.write(b"partial")
+                raise ConnectionError("transient")
+            target.write(self.content)
+        finally:
+            if self.tracker is not None:
+                with self.tracker["lock"]:
+                    self.tracker["active"] -= 1
+
+
+class TestArtifactDownloader(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.manifest = MagicMock()
+
+    def test_downloads_every_target(self):
+        blobs = {f"file{i}": FakeBlob(content=f"content{i}".encode()) for i in range(5)}
+        self.manifest.get_blob.side_effect = lambda entry: blobs[entry.name]
+        targets = [(_entry(name), f"{self.temp_dir.name}/{name}") for name in blobs]
+
+        ArtifactDownloader(max_workers=3).download(manifest=self.manifest, targets=targets)
+
+        for name, path in [(entry.name, path) for entry, path in targets]:
+            with open(path, "rb") as file:
+                self.assertEqual(file.read(), blobs[name].content)
+
+    def test_retries_failed_download(self):
+        blob = FakeBlob(content=b"complete", failures=2)
+        self.manifest.get_blob.return_value = blob
+        path = f"{self.temp_dir.name}/junit.xml"
+
+        ArtifactDownloader(retries=3, retry_interval=0).download(
+            manifest=self.manifest,
+            targets=[(_entry("junit.xml"), path)],
+        )
+
+        with open(path, "rb") as file:
+            self.assertEqual(file.read(), b"complete")
+
+    def test_raises_and_cleans_up_when_retries_are_exhausted(self):
+        self.manifest.get_blob.return_value = FakeBlob(content=b"complete", failures=5)
+        path = f"{self.temp_dir.name}/junit.xml"
+
+        with self.assertRaises(ConnectionError):
+            ArtifactDownloader(retries=1, retry_interval=0).download(
+                manifest=self.manifest,
+                targets=[(_entry("junit.xml"), path)],
+            )
+        self.assertFalse(os.path.exists(path))
+
+    def test_worker_pool_is_bounded(self):
+        tracker = {"lock": threading.Lock(), "active": 0, "peak": 0}
+        self.manifest.get_blob.side_effect = lambda entry: FakeBlob(content=b"x", delay=0.02, tracker=tracker)
+        targets = [(_entry(f"file{i}"), f"{self.temp_dir.name}/file{i}") for i in range(10)]
+
+        ArtifactDownloader(max_workers=2).download(manifest=self.manifest, targets=targets)
+
+        self.assertEqual(tracker["peak"], 2)
+
+    def test_inflight_bytes_are_bounded(self):
+        tracker = {"lock": threading.Lock(), "active": 0, "peak": 0}
+        self.manifest.get_blob.side_effect = lambda entry: FakeBlob(content=b"x", delay=0.02, tracker=tracker)
+        targets = [(_entry(f"file{i}", size=60), f"{self.temp_dir.name}/file{i}") for i in range(6)]
+
+        ArtifactDownloader(max_workers=6, max_inflight_bytes=100).download(manifest=self.manifest, targets=targets)
+
+        self.assertEqual(tracker["peak"], 1)
+
+    def test_skips_missing_unlisted_entry(self):
+        blob = MagicMock()
+        blob.download_to_file.side_effect = NotFound("missing")
+        self.manifest.get_blob.return_value = blob
+        path = f"{self.temp_dir.name}/build-log.txt"
+
+        ArtifactDownloader(retries=3, retry_interval=0).download(
+            manifest=self.manifest,
+            targets=[(_entry("build-log.txt", size=None, listed=False), path)],
+        )
+
+        blob.download_to_file.assert_called_once()
+        self.assertFalse(os.path.exists(path))
+
+    def test_missing_listed_entry_raises(self):
+        blob = MagicMock()
+        blob.download_to_file.side_effect = NotFound("missing")
+        self.manifest.get_blob.return_value = blob
+
+        with self.assertRaises(NotFound):
+            ArtifactDownloader(retries=0).download(
+                manifest=self.manifest,
+                targets=[(_entry("junit.xml"), f"{self.temp_dir.name}/junit.xml")],
+            )
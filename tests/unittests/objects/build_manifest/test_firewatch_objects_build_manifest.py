@@ -0,0 +1,122 @@
+import unittest
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.objects.build_manifest import BuildManifest
+from src.objects.build_manifest import MANIFEST_LIST_FIELDS
+from src.objects.build_manifest import TargetedBuildManifest
+
+PREFIX = "logs/job1/123/artifacts/job1_safe/"
+
+
+def _blob(relative_name: str, generation: int = 1) -> SimpleNamespace:
+    return SimpleNamespace(
+        name=f"{PREFIX}{relative_name}",
+        size=10,
+        generation=generation,
+        md5_hash="abc==",
+    )
+
+
+class TestBuildManifest(unittest.TestCase):
+    def setUp(self):
+        self.storage_client = MagicMock()
+        self.storage_client.list_blobs.return_value = [
+            _blob("step1/finished.json"),
+            _blob("step1/build-log.txt"),
+            _blob("step1/artifacts/junit_install.xml"),
+            _blob("step2/finished.json"),
+            _blob("step2/artifacts/nested/finished.json"),
+            _blob("step2/artifacts/junit_e2e.xml", generation=7),
+            _blob("prowjob.json"),
+        ]
+        self.manifest = BuildManifest(
+            storage_client=self.storage_client,
+            gcs_bucket="bucket1",
+            prefix=PREFIX.rstrip("/"),
+        )
+
+    def test_lists_prefix_once(self):
+        self.storage_client.list_blobs.assert_called_once()
+        args, kwargs = self.storage_client.list_blobs.call_args
+        self.assertEqual(args, ("bucket1",))
+        self.assertEqual(kwargs["prefix"], PREFIX)
+
+    def test_steps(self):
+        self.assertEqual(self.manifest.steps, ["step1", "step2"])
+
+    def test_get_step_file(self):
+        entry = self.manifest.get_step_file(step="step2", filename="finished.json")
+        self.assertEqual(entry.name, f"{PREFIX}step2/finished.json")
+        self.assertIsNone(self.manifest.get_step_file(step="step2", filename="build-log.txt"))
+
+    def test_find_files(self):
+        junit_files = self.manifest.find_files("junit")
+        self.assertEqual([entry.step for entry in junit_files], ["step1", "step2"])
+        self.assertEqual([entry.filename for entry in junit_files], ["junit_install.xml", "junit_e2e.xml"])
+
+    def test_get_blob_pins_generation(self):
+        entry = self.manifest.find_files("junit_e2e")[0]
+        self.manifest.get_blob(entry)
+        self.storage_client.bucket.assert_called_with("bucket1")
+        self.storage_client.bucket.return_value.blob.assert_called_with(entry.name, generation=7)
+
+
+class TestTargetedBuildManifest(unittest.TestCase):
+    def setUp(self):
+        self.storage_client = MagicMock()
+
+        def list_blobs(bucket, prefix, fields, delimiter=None, match_glob=None):
+            if delimiter:
+                iterator = MagicMock()
+                iterator.__iter__.return_value = iter([])
+                iterator.prefixes = {f"{PREFIX}step2/", f"{PREFIX}step1/"}
+                return iterator
+            return {
+                f"{PREFIX}step1/artifacts/junit": [_blob("step1/artifacts/junit_install.xml")],
+                f"{PREFIX}step1/artifacts/": [
+                    _blob("step1/artifacts/junit_install.xml"),
+                    _blob("step1/artifacts/nested/junit_e2e.xml"),
+                ],
+            }.get(prefix, [])
+
+        self.storage_client.list_blobs.side_effect = list_blobs
+        self.manifest = TargetedBuildManifest(
+            storage_client=self.storage_client,
+            gcs_bucket="bucket1",
+            prefix=PREFIX,
+            junit_patterns=("artifacts/junit*", "artifacts/**/junit*"),
+        )
+
+    def test_lists_steps_with_delimiter(self):
+        self.assertEqual(self.manifest.steps, ["step1", "step2"])
+        self.storage_client.list_blobs.assert_any_call(
+            "bucket1",
+            prefix=PREFIX,
+            delimiter="/",
+            fields="prefixes,nextPageToken",
+        )
+
+    def test_lists_junit_patterns_from_literal_prefix(self):
+        self.storage_client.list_blobs.assert_any_call(
+            "bucket1",
+            prefix=f"{PREFIX}step1/artifacts/junit",
+            match_glob=f"{PREFIX}step1/artifacts/junit*",
+            fields=MANIFEST_LIST_FIELDS,
+        )
+        self.storage_client.list_blobs.assert_any_call(
+            "bucket1",
+            prefix=f"{PREFIX}step1/artifacts/",
+            match_glob=f"{PREFIX}step1/artifacts/**/junit*",
+            fields=MANIFEST_LIST_FIELDS,
+        )
+        self.assertEqual(
+            [entry.relative_path for entry in self.manifest.find_files("junit")],
+            ["artifacts/junit_install.xml", "artifacts/nested/junit_e2e.xml"],
+        )
+
+    def test_step_files_are_not_listed(self):
+        entry = self.manifest.get_step_file(step="step2", filename="build-log.txt")
+        self.assertEqual(entry.name, f"{PREFIX}step2/build-log.txt")
+        self.assertFalse(entry.listed)
+        self.assertIsNone(entry.generation)
@@ -0,0 +1,83 @@
+import tempfile
+import threading
+import time
+import unittest
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+
+from src.objects.config_cache import ConfigCache
+
+CONFIG = '{"failure_rules": [{"step": "step1", "failure_type": "pod_failure", "classification": "none"}]}'
+
+
+class ConfigHandler(BaseHTTPRequestHandler):
+    requests: list[dict] = []
+    delay = 0.0
+    status = 200
+
+    def do_GET(self):
+        ConfigHandler.requests.append(dict(self.headers))
+        time.sleep(ConfigHandler.delay)
+        if ConfigHandler.status != 200:
+            self.send_response(ConfigHandler.status)
+            self.end_headers()
+            return
+        if self.headers.get("If-None-Match") == '"v1"':
+            self.send_response(304)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("ETag", '"v1"')
+        self.end_headers()
+        self.wfile.write(CONFIG.encode())
+
+    def log_message(self, *args):
+        pass
+
+
+class TestConfigCache(unittest.TestCase):
+    def setUp(self):
+        ConfigHandler.requests = []
+        ConfigHandler.delay = 0.0
+        ConfigHandler.status = 200
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), ConfigHandler)
+        threading.Thread(target=self.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/config.json"
+
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache = ConfigCache(cache_dir=self.temp_dir.name, timeout=5)
+
+    def test_revalidates_with_etag(self):
+        self.assertEqual(self.cache.fetch(url=self.url), CONFIG)
+        self.assertEqual(self.cache.fetch(url=self.url), CONFIG)
+
+        self.assertIsNone(ConfigHandler.requests[0].get("If-None-Match"))
+        self.assertEqual(ConfigHandler.requests[1].get("If-None-Match"), '"v1"')
+
+    def test_falls_back_to_cached_copy_on_timeout(self):
+        self.cache.fetch(url=self.url)
+        ConfigHandler.delay = 0.3
+        self.cache.timeout = 0.05
+
+        self.assertEqual(self.cache.fetch(url=self.url), CONFIG)
+
+    def test_falls_back_to_cached_copy_on_server_error(self):
+        self.cache.fetch(url=self.url)
+        ConfigHandler.status = 503
+
+        self.assertEqual(self.cache.fetch(url=self.url), CONFIG)
+
+    def test_returns_none_without_cached_copy(self):
+        ConfigHandler.status = 503
+
+        self.assertIsNone(self.cache.fetch(url=self.url))
+
+    def test_cache_is_disabled_by_default(self):
+        cache = ConfigCache(timeout=5)
+
+        self.assertEqual(cache.fetch(url=self.url), CONFIG)
+        self.assertEqual(cache.fetch(url=self.url), CONFIG)
+        self.assertIsNone(ConfigHandler.requests[1].get("If-None-Match"))
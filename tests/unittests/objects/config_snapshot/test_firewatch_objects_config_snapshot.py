@@ -0,0 +1,138 @@
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from click.testing import CliRunner
+
+from src.cli import main
+from src.objects.config_snapshot import load_config_snapshot
+from src.objects.configuration import Configuration
+from src.objects.failure import Failure
+from src.objects.failure_rule import FailureRule
+
+CONFIG = {
+    "failure_rules": [
+        {"step": "gather-*", "failure_type": "all", "classification": "gather", "jira_project": "OTHER"},
+        {"step": "install", "failure_type": "pod_failure", "classification": "install", "ignore": "false"},
+        {"step": "*-tests", "failure_type": "test_failure", "classification": "tests", "group": {"name": "g1"}},
+        {"step": "aws-*", "failure_type": "all", "classification": "aws", "jobs": "*-aws-*"},
+    ],
+    "success_rules": [{"jira_project": "SUCCESS", "jira_epic": "SUCCESS-1"}],
+}
+
+
+@patch.dict(os.environ, {"FIREWATCH_DEFAULT_JIRA_PROJECT": "NONE"})
+class TestConfigSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.config_path = os.path.join(self.temp_dir.name, "config.json")
+        self.snapshot_path = os.path.join(self.temp_dir.name, "config.snapshot.json")
+        self._write_config(CONFIG)
+
+    def _write_config(self, config):
+        with open(self.config_path, "w") as file:
+            json.dump(config, file)
+
+    def _build_config(self, snapshot_path=None, job_name=None):
+        return Configuration(
+            jira=None,
+            fail_with_test_failures=False,
+            fail_with_pod_failures=False,
+            keep_job_dir=False,
+            verbose_test_failure_reporting=False,
+            config_file_path=self.config_path,
+            config_snapshot_path=snapshot_path,
+            job_name=job_name,
+        )
+
+    def _compile(self):
+        result = CliRunner().invoke(
+            main,
+            ["config", "compile", "--firewatch-config-path", self.config_path, "--output-file", self.snapshot_path],
+            obj={},
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+
+    def test_snapshot_loads_the_same_rules(self):
+        self._compile()
+        expected = self._build_config()
+
+        with patch.object(FailureRule, "__init__", return_value=None) as mock_failure_rule_init:
+            loaded = self._build_config(snapshot_path=self.snapshot_path)
+        mock_failure_rule_init.assert_not_called()
+
+        self.assertEqual(loaded.config_data, expected.config_data)
+        self.assertEqual(
+            [rule.to_snapshot() for rule in loaded.failure_rules],
+            [rule.to_snapshot() for rule in expected.failure_rules],
+        )
+        self.assertEqual(
+            [rule.to_snapshot() for rule in loaded.success_rules],
+            [rule.to_snapshot() for rule in expected.success_rules],
+        )
+
+        for step, failure_type in [
+            ("gather-must-gather", "pod_failure"),
+            ("e2e-tests", "test_failure"),
+            ("install", "pod_failure"),
+        ]:
+            failure = Failure(step=step, failure_type=failure_type)
+            self.assertEqual(
+                [rule.classification for rule in loaded.failure_rule_matcher.match(failure)],
+                [rule.classification for rule in expected.failure_rule_matcher.match(failure)],
+            )
+
+    def test_changed_config_ignores_the_snapshot(self):
+        self._compile()
+        self._write_config({"failure_rules": [{"step": "other", "failure_type": "all", "classification": "other"}]})
+
+        configuration = self._build_config(snapshot_path=self.snapshot_path)
+
+        self.assertEqual([rule.step for rule in configuration.failure_rules], ["other"])
+
+    def test_changed_environment_ignores_the_snapshot(self):
+        self._compile()
+        checksum = self._build_config().config_checksum
+
+        with patch.dict(os.environ, {"FIREWATCH_DEFAULT_JIRA_PROJECT": "CHANGED"}):
+            self.assertIsNone(
+                load_config_snapshot(path=self.snapshot_path, checksum=self._build_config().config_checksum)
+            )
+        self.assertIsNotNone(load_config_snapshot(path=self.snapshot_path, checksum=checksum))
+
+    def test_unrelated_environment_keeps_the_snapshot(self):
+        self._compile()
+
+        with patch.dict(os.environ, {"FIREWATCH_JIRA_API_TOKEN": "token", "BUILD_ID": "123"}):
+            self.assertIsNotNone(
+                load_config_snapshot(path=self.snapshot_path, checksum=self._build_config().config_checksum)
+            )
+
+    def test_missing_snapshot_is_ignored(self):
+        configuration = self._build_config(snapshot_path=os.path.join(self.temp_dir.name, "missing.json"))
+
+        self.assertEqual(len(configuration.failure_rules), 4)
+
+    def test_snapshot_rules_are_scoped_to_the_job(self):
+        self._compile()
+
+        configuration = self._build_config(snapshot_path=self.snapshot_path, job_name="periodic-ci-e2e-gcp")
+
+        self.assertEqual([rule.classification for rule in configuration.failure_rules], ["gather", "install", "tests"])
+
+    def test_snapshot_without_rules_for_the_job_has_no_failure_rules(self):
+        self._write_config({
+            "failure_rules": [{"step": "aws-*", "failure_type": "all", "classification": "aws", "jobs": "*-aws-*"}]
+        })
+        self._compile()
+
+        configuration = self._build_config(snapshot_path=self.snapshot_path, job_name="periodic-ci-e2e-gcp")
+
+        self.assertEqual(configuration.failure_rules, [])
+        self.assertEqual(
+            configuration.failure_rules,
+            self._build_config(job_name="periodic-ci-e2e-gcp").failure_rules,
+        )
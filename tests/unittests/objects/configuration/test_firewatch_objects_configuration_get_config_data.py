@@ -131,3 +131,39 @@ class TestGetConfigData(ConfigurationBaseTest):
                 verbose_test_failure_reporting_ticket_limit=10,
                 config_file_path=base_config_file,
             )
+
+    @patch.dict(
+        os.environ,
+        {
+            "FIREWATCH_CONFIG": '{"failure_rules": [{"step": "env-step", "failure_type": "pod_failure",'
+            '"classification": "env"}]}',
+        },
+    )
+    def test_configuration_merges_multiple_config_files_in_order(self):
+        base_config_data = (
+            '{"failure_rules": [{"step": "team-step-1", "failure_type": "pod_failure", "classification": "base"}, '
+            '{"step": "base-only", "failure_type": "pod_failure", "classification": "base"}, '
+            '{"step": "env-step", "failure_type": "pod_failure", "classification": "base"}]}'
+        )
+        team_config_data = (
+            '{"failure_rules": [{"step": "team-*", "failure_type": "pod_failure", "classification": "team"}]}'
+        )
+        with tempfile.TemporaryDirectory() as tmp_path:
+            base_config_file = os.path.join(tmp_path, "base_config.json")
+            team_config_file = os.path.join(tmp_path, "team_config.json")
+            with open(base_config_file, "w") as f:
+                f.write(base_config_data)
+            with open(team_config_file, "w") as f:
+                f.write(team_config_data)
+
+            config = Configuration(
+                jira=self.mock_jira,
+                fail_with_test_failures=True,
+                fail_with_pod_failures=True,
+                keep_job_dir=True,
+                verbose_test_failure_reporting=True,
+                verbose_test_failure_reporting_ticket_limit=10,
+                config_file_path=[base_config_file, team_config_file],
+            )
+            rules = [(rule["step"], rule["classification"]) for rule in config.config_data["failure_rules"]]
+            assert rules == [("env-step", "env"), ("team-*", "team"), ("base-only", "base")]
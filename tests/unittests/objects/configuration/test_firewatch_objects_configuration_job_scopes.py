@@ -0,0 +1,101 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.objects.configuration import Configuration
+from src.objects.failure import Failure
+from src.report.report import Report
+from tests.unittests.objects.configuration.configuration_base_test import (
+    ConfigurationBaseTest,
+)
+
+CONFIG = {
+    "failure_rules": [
+        {"step": "install", "failure_type": "all", "classification": "install"},
+        {"step": "aws-*", "failure_type": "all", "classification": "aws", "jobs": "*-aws-*"},
+        {"step": "gcp-*", "failure_type": "all", "classification": "gcp", "jobs": ["*-gcp-*", "*-gcp"]},
+    ],
+    "success_rules": [{"jira_project": "ALL"}, {"jira_project": "AWS", "jobs": "*-aws-*"}],
+    "job_scopes": [
+        {
+            "jobs": ["periodic-ci-team-*"],
+            "failure_rules": [
+                {"step": "team-step", "failure_type": "all", "classification": "team"},
+                {"step": "team-gcp-step", "failure_type": "all", "classification": "team-gcp", "jobs": "*-gcp"},
+            ],
+            "success_rules": [{"jira_project": "TEAM"}],
+        },
+    ],
+}
+
+
+@patch.dict(os.environ, {"FIREWATCH_DEFAULT_JIRA_PROJECT": "TEST", "FIREWATCH_CONFIG": json.dumps(CONFIG)})
+class TestJobScopes(ConfigurationBaseTest):
+    def _build_config(self, job_name):
+        return Configuration(
+            jira=self.mock_jira,
+            fail_with_test_failures=False,
+            fail_with_pod_failures=False,
+            keep_job_dir=False,
+            verbose_test_failure_reporting=False,
+            job_name=job_name,
+        )
+
+    def test_rules_scoped_to_other_jobs_are_not_built(self):
+        config = self._build_config(job_name="periodic-ci-org-repo-e2e-aws-ovn")
+
+        assert [rule.classification for rule in config.failure_rules] == ["install", "aws"]
+        assert [rule.jira_project for rule in config.success_rules] == ["ALL", "AWS"]
+
+    def test_job_scope_applies_to_its_rules(self):
+        config = self._build_config(job_name="periodic-ci-team-e2e-gcp")
+
+        assert [rule.classification for rule in config.failure_rules] == ["install", "gcp", "team", "team-gcp"]
+        assert [rule.jira_project for rule in config.success_rules] == ["ALL", "TEAM"]
+
+    def test_rule_scope_overrides_its_job_scope(self):
+        config = self._build_config(job_name="periodic-ci-team-e2e")
+
+        assert [rule.classification for rule in config.failure_rules] == ["install", "team"]
+
+    def test_every_rule_is_built_without_a_job_name(self):
+        config = self._build_config(job_name=None)
+
+        assert [rule.classification for rule in config.failure_rules] == [
+            "install",
+            "aws",
+            "gcp",
+            "team",
+            "team-gcp",
+        ]
+        assert "job_scopes" not in config.config_data
+
+    @patch.dict(
+        os.environ,
+        {
+            "FIREWATCH_CONFIG": json.dumps({
+                "failure_rules": [{"step": "*", "failure_type": "all", "classification": "team-a", "jobs": "team-a-*"}]
+            })
+        },
+    )
+    def test_job_without_matching_rules_uses_the_default_failure_rule(self):
+        config = self._build_config(job_name="team-b-job")
+
+        assert config.failure_rules == []
+        # Report.__init__ files the bugs of a job, only the rule matching is needed here
+        matching_rules = Report.__new__(Report).failure_matches_rule(
+            failure=Failure(step="install", failure_type="pod_failure"),
+            rules=config.failure_rules,
+            default_jira_project=config.default_jira_project,
+            rule_defaults=config.rule_defaults,
+            matcher=config.failure_rule_matcher,
+            default_rule=config.default_failure_rule,
+        )
+        assert matching_rules == [config.default_failure_rule]
+
+    @patch.dict(os.environ, {"FIREWATCH_CONFIG": '{"failure_rules": [], "job_scopes": [{"failure_rules": []}]}'})
+    def test_job_scope_without_jobs(self):
+        with pytest.raises(SystemExit):
+            self._build_config(job_name="some-job")
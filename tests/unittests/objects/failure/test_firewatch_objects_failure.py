@@ -1,4 +1,5 @@
 import unittest
+from dataclasses import replace
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
@@ -18,11 +19,6 @@ class TestFailure(unittest.TestCase):
         self.assertEqual(failure.step, "step1")
         self.assertEqual(failure.failure_type, "pod_failure")
 
-    def test_initialization_with_invalid_failure_type(self):
-        self.mock_logger.error = MagicMock()
-        with self.assertRaises(SystemExit):
-            Failure("step1", "invalid_failure_type")
-
     def test_initialization_with_test_failure_type(self):
         failure = Failure("step1", "test_failure", "test1", "/path/to/junit")
         self.assertEqual(failure.step, "step1")
@@ -34,3 +30,39 @@ class TestFailure(unittest.TestCase):
         failure = Failure("step1", "pod_failure")
         self.assertEqual(failure.step, "step1")
         self.assertEqual(failure.failure_type, "pod_failure")
+
+    def test_initialization_with_invalid_failure_type(self):
+        with self.assertRaises(SystemExit):
+            Failure("step1", "unknown_failure")
+
+    def test_failures_that_differ_only_in_ignore_are_equal(self):
+        failure = Failure("step1", "test_failure", "test1", "/path/to/junit")
+        duplicate = Failure("step1", "test_failure", "test1", "/path/to/junit", ignore=True)
+        other = Failure("step1", "test_failure", "test2", "/path/to/junit")
+
+        self.assertEqual(failure, duplicate)
+        self.assertEqual(hash(failure), hash(duplicate))
+        self.assertNotEqual(failure, other)
+        self.assertEqual(len({failure, duplicate, other}), 2)
+
+    def test_failures_of_different_types_are_not_equal(self):
+        self.assertNotEqual(Failure("step1", "pod_failure"), Failure("step1", "test_failure"))
+
+    def test_failure_is_immutable(self):
+        failure = Failure("step1", "pod_failure")
+
+        with self.assertRaises(AttributeError):
+            failure.step = "step2"
+        with self.assertRaises(AttributeError):
+            failure.ignore = True
+        self.assertFalse(hasattr(failure, "__dict__"))
+
+    def test_replace(self):
+        failure = Failure("step1", "test_failure", "test1", "/path/to/junit")
+
+        ignored = replace(failure, ignore=True)
+
+        self.assertTrue(ignored.ignore)
+        self.assertFalse(failure.ignore)
+        self.assertEqual(ignored, failure)
+        self.assertEqual(replace(failure, step="step2").step, "step2")
@@ -3,13 +3,14 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from src.objects.failure_rule import FailureRule
+from src.objects.rule_defaults import RuleDefaults
 
 
 class FailureRuleBaseTest(unittest.TestCase):
-    @patch("src.objects.rule.get_logger")
-    def setUp(self, mock_get_logger):
+    def setUp(self):
         self.mock_logger = MagicMock()
-        mock_get_logger.return_value = self.mock_logger
+        patch("src.objects.rule.LOGGER", self.mock_logger).start()
+        patch("src.objects.failure_rule.LOGGER", self.mock_logger).start()
         self.rule = FailureRule(
             rule_dict={
                 "step": "dummy",
@@ -17,6 +18,7 @@ class FailureRuleBaseTest(unittest.TestCase):
                 "classification": "test classification",
                 "jira_project": "TEST",
             },
+            defaults=RuleDefaults.from_env(),
         )
 
     def tearDown(self):
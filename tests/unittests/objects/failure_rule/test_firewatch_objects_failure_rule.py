@@ -1,6 +1,7 @@
 import unittest
 
 from src.objects.failure_rule import FailureRule
+from src.objects.rule_defaults import RuleDefaults
 
 
 class TestFailureRule(unittest.TestCase):
@@ -21,7 +22,7 @@ class TestFailureRule(unittest.TestCase):
         }
 
     def test_failure_rule_init(self):
-        rule = FailureRule(rule_dict=self.rule_dict)
+        rule = FailureRule(rule_dict=self.rule_dict, defaults=RuleDefaults.from_env())
         assert rule.step == "step1"
         assert rule.failure_type == "pod_failure"
         assert rule.classification == "classification1"
@@ -2,6 +2,7 @@ import pytest
 
 from src.objects.failure import Failure
 from src.objects.failure_rule import FailureRule
+from src.objects.rule_defaults import RuleDefaults
 
 
 @pytest.fixture
@@ -14,6 +15,7 @@ def failure_rule():
             "jira_project": "NONE",
             "ignore": "false",
         },
+        defaults=RuleDefaults.from_env(),
     )
 
 
@@ -22,7 +24,7 @@ def failure():
     yield Failure(
         failure_type="test_failure",
         failed_test_name="post",
-        failed_step="gather-must-gather",
+        step="gather-must-gather",
     )
 
 
@@ -30,7 +32,7 @@ def test_failure_rule_matches_failure_if_rule_pattern_equals_failure_step(
     failure,
     failure_rule,
 ):
-    failure_rule.step = failure.step = "gather-must-gather"
+    failure_rule.step = failure.step
     assert failure_rule.matches_failure(
         failure,
     ), f"'{failure_rule.step}' should match '{failure.step}'"
@@ -40,7 +42,6 @@ def test_failure_rule_matches_failure_if_glob_style_rule_pattern_matches_failure
     failure,
     failure_rule,
 ):
-    failure.step = "gather-must-gather"
     failure_rule.step = "gather-*"
     assert failure_rule.matches_failure(
         failure,
@@ -51,7 +52,6 @@ def test_failure_rule_does_not_match_non_glob_unequal_failure_step(
     failure,
     failure_rule,
 ):
-    failure.step = "gather-must-gather"
     failure_rule.step = "firewatch_report_issues"
     assert not failure_rule.matches_failure(
         failure,
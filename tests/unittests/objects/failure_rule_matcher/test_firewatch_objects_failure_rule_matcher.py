@@ -0,0 +1,58 @@
+import unittest
+from unittest.mock import patch
+
+from src.objects.failure import Failure
+from src.objects.failure_rule import FailureRule
+from src.objects.failure_rule_matcher import FailureRuleMatcher
+from src.objects.rule_defaults import RuleDefaults
+
+
+def _rule(step: str, failure_type: str = "all", ignore: bool = False) -> FailureRule:
+    return FailureRule(
+        rule_dict={
+            "step": step,
+            "failure_type": failure_type,
+            "classification": "test classification",
+            "jira_project": "TEST",
+            "ignore": ignore,
+        },
+        defaults=RuleDefaults.from_env(),
+    )
+
+
+class TestFailureRuleMatcher(unittest.TestCase):
+    @patch("src.objects.rule.get_logger")
+    def setUp(self, mock_get_logger):
+        self.rules = [
+            _rule("*"),
+            _rule("gather-*", failure_type="pod_failure"),
+            _rule("e2e-test"),
+            _rule("e2e-?est", failure_type="test_failure"),
+            _rule("e2e-*", ignore=True),
+            _rule("[ab]*-install"),
+            _rule("e2e-test", failure_type="pod_failure"),
+            _rule("!none"),
+        ]
+        self.matcher = FailureRuleMatcher(rules=self.rules)
+
+    def test_returns_matching_rules_in_configuration_order(self):
+        failure = Failure(step="e2e-test", failure_type="test_failure")
+
+        self.assertEqual(
+            self.matcher.match(failure),
+            [self.rules[0], self.rules[2], self.rules[3], self.rules[4]],
+        )
+
+    def test_matches_fnmatch_rules(self):
+        steps = ["e2e-test", "e2e-best", "gather-must-gather", "a-install", "c-install", "!none", "other", ""]
+        for step in steps:
+            for failure_type in ["pod_failure", "test_failure"]:
+                failure = Failure(step=step, failure_type=failure_type)
+                self.assertEqual(
+                    self.matcher.match(failure),
+                    [rule for rule in self.rules if rule.matches_failure(failure)],
+                    msg=f"{step} {failure_type}",
+                )
+
+    def test_no_rules(self):
+        self.assertEqual(FailureRuleMatcher(rules=None).match(Failure("step1", "pod_failure")), [])
@@ -5,7 +5,9 @@ from unittest.mock import MagicMock
 from jira.exceptions import JIRAError
 from pytest import MonkeyPatch
 from src.objects.jira_base import Jira
+from src.objects.jira_metadata_cache import JiraMetadataCache
 
+from tests.unittests.conftest import DEFAULT_JIRA_SERVER_URL
 from tests.unittests.objects.jira.test_jira import _assert_adf_doc
 from tests.unittests.objects.jira.test_jira import _post_request_json
 
@@ -30,6 +32,8 @@ def mock_jira(monkeypatch: MonkeyPatch):
     jira.logger = MagicMock()
     jira.get_issue_by_id_or_key = MagicMock()
     jira.connection = MagicMock()
+    jira.url = DEFAULT_JIRA_SERVER_URL
+    jira.metadata_cache = JiraMetadataCache(server_url=DEFAULT_JIRA_SERVER_URL)
     return jira
 
 
@@ -3,10 +3,13 @@ import json
 import pytest
 import pyhelper_utils.general as pyhelper_general
 from jira import Issue
+from jira.client import ResultList
 from jira.exceptions import JIRAError
 from unittest.mock import MagicMock, patch
 
-from src.objects.jira_base import LOGGER, Jira
+from src.objects.jira_base import LOGGER, SEARCH_PAGE_SIZE, Jira
+from src.objects.jira_issue_ref import IssueRef
+from src.objects.jira_metadata_cache import JiraMetadataCache
 from tests.unittests.conftest import DEFAULT_JIRA_SERVER_URL
 
 
@@ -44,6 +47,7 @@ def mock_jira(monkeypatch):
     jira = Jira()
     jira.url = DEFAULT_JIRA_SERVER_URL
     jira.connection = MagicMock()
+    jira.metadata_cache = JiraMetadataCache(server_url=DEFAULT_JIRA_SERVER_URL)
     jira.connection._session = MagicMock()
 
     post_response = MagicMock()
@@ -156,7 +160,7 @@ class TestJiraAddLabelsHttpError:
         with patch.object(jira.connection._session, "put", return_value=resp):
             issue, applied = jira.add_labels_to_issue(issue_id_or_key=fake_issue_id, labels=["x"])
         assert applied is False
-        assert issue.id == fake_issue_id
+        assert issue.key == fake_issue_id
         assert "Failed to add labels" in caplog.text
         assert "project configuration, missing permissions, or the Jira user" in caplog.text
 
@@ -181,7 +185,7 @@ class TestJiraRemoveLabelsHttpError:
         with patch.object(jira.connection._session, "put", return_value=resp):
             issue, applied = jira.remove_labels_from_issue(issue_id_or_key=fake_issue_id, labels=["x"])
         assert applied is False
-        assert issue.id == fake_issue_id
+        assert issue.key == fake_issue_id
         assert "Failed to remove labels" in caplog.text
         assert "project configuration, missing permissions, or the Jira user" in caplog.text
 
@@ -244,13 +248,9 @@ class TestCreateIssueAdfDescription:
         assert fields["description"]["content"][0]["content"][0]["text"] == " "
 
 
-class TestCreateIssueEpicSearch:
-    def test_epic_lookup_uses_unquoted_issue_key_for_cloud_compatibility(self, mock_jira):
-        epic_issue = MagicMock()
-        epic_issue.id = "20001"
-        mock_jira.connection.search_issues.return_value = [epic_issue]
-
-        mock_jira.create_issue(
+class TestCreateIssueFoldedFields:
+    def test_epic_is_set_as_parent_in_create_payload(self, mock_jira):
+        issue = mock_jira.create_issue(
             project="TEST",
             summary="Test issue",
             description="Description",
@@ -258,15 +258,108 @@ class TestCreateIssueEpicSearch:
             epic="INTEROP-1234",
         )
 
-        mock_jira.connection.search_issues.assert_called_once_with(
-            "issue=INTEROP-1234",
-            maxResults=False,
+        payload = _post_request_json(mock_jira.connection._session.post.call_args.kwargs)
+        assert payload["fields"]["parent"] == {"key": "INTEROP-1234"}
+        mock_jira.connection.search_issues.assert_not_called()
+        mock_jira.connection.add_issues_to_epic.assert_not_called()
+        assert issue.key == "TEST-1"
+
+    def test_issue_handle_is_built_from_create_response(self, mock_jira):
+        issue = mock_jira.create_issue(project="TEST", summary="S", description="D", issue_type="Bug")
+
+        mock_jira.connection.issue.assert_not_called()
+        assert (issue.key, issue.id) == ("TEST-1", "10001")
+
+    def test_assignee_is_set_in_create_payload(self, mock_jira):
+        fake_user = MagicMock()
+        fake_user.accountId = "abc-123"
+        mock_jira.connection.search_users.return_value = [fake_user]
+
+        mock_jira.create_issue(
+            project="TEST", summary="S", description="D", issue_type="Bug", assignee="user@example.com"
         )
-        mock_jira.connection.add_issues_to_epic.assert_called_once_with(
-            epic_id="20001",
-            issue_keys="TEST-1",
+
+        payload = _post_request_json(mock_jira.connection._session.post.call_args.kwargs)
+        assert payload["fields"]["assignee"] == {"accountId": "abc-123"}
+        mock_jira.connection.assign_issue.assert_not_called()
+
+    def test_rejected_optional_field_is_dropped(self, mock_jira):
+        mock_jira.logger = LOGGER
+        ok_response = mock_jira.connection._session.post.return_value
+        mock_jira.connection._session.post.side_effect = [
+            _mock_error_response(400, '{"errors": {"parent": "Field \'parent\' cannot be set."}}'),
+            ok_response,
+        ]
+
+        issue = mock_jira.create_issue(
+            project="TEST", summary="S", description="D", issue_type="Bug", epic="INTEROP-1234"
         )
 
+        assert issue.key == "TEST-1"
+        first, second = [_post_request_json(call.kwargs) for call in mock_jira.connection._session.post.call_args_list]
+        assert "parent" in first["fields"]
+        assert "parent" not in second["fields"]
+        assert second["fields"]["summary"] == "S"
+        mock_jira.connection.add_issues_to_epic.assert_called_once_with(epic_id="INTEROP-1234", issue_keys="TEST-1")
+
+    def test_rejected_assignees_are_set_after_create(self, mock_jira):
+        mock_jira.logger = LOGGER
+        fake_user = MagicMock()
+        fake_user.accountId = "abc-123"
+        mock_jira.connection.search_users.return_value = [fake_user]
+        mock_jira.connection.assign_issue.return_value = True
+        ok_response = mock_jira.connection._session.post.return_value
+        mock_jira.connection._session.post.side_effect = [
+            _mock_error_response(
+                400,
+                '{"errors": {"assignee": "Field \'assignee\' cannot be set.", '
+                '"customfield_10465": "Field \'customfield_10465\' cannot be set."}}',
+            ),
+            ok_response,
+        ]
+
+        mock_jira.create_issue(
+            project="TEST",
+            summary="S",
+            description="D",
+            issue_type="Bug",
+            assignee="a@b.com",
+            additional_assignees=["c@d.com"],
+        )
+
+        second = _post_request_json(mock_jira.connection._session.post.call_args_list[1].kwargs)
+        assert "assignee" not in second["fields"]
+        assert "customfield_10465" not in second["fields"]
+        mock_jira.connection.assign_issue.assert_called_once_with(issue="TEST-1", assignee="a@b.com")
+        assert _post_request_json(mock_jira.connection._session.put.call_args.kwargs) == {
+            "fields": {"customfield_10465": [{"accountId": "abc-123"}]}
+        }
+        mock_jira.connection.add_issues_to_epic.assert_not_called()
+
+    def test_failed_assignee_fallback_is_not_reported_as_assigned(self, mock_jira):
+        mock_jira.logger = LOGGER
+        fake_user = MagicMock()
+        fake_user.accountId = "abc-123"
+        mock_jira.connection.search_users.return_value = [fake_user]
+        mock_jira.connection.assign_issue.return_value = False
+        ok_response = mock_jira.connection._session.post.return_value
+        mock_jira.connection._session.post.side_effect = [
+            _mock_error_response(400, '{"errors": {"assignee": "Field \'assignee\' cannot be set."}}'),
+            ok_response,
+        ]
+
+        with patch.object(LOGGER, "info") as mock_info:
+            mock_jira.create_issue(project="TEST", summary="S", description="D", issue_type="Bug", assignee="a@b.com")
+
+        assert not [call for call in mock_info.call_args_list if "has been assigned" in str(call.args[0])]
+
+    def test_other_create_errors_are_raised(self, mock_jira, monkeypatch):
+        monkeypatch.setattr(pyhelper_general, "sleep", lambda *_: None)
+        mock_jira.connection._session.post.return_value = _mock_error_response(400, "summary is required")
+
+        with pytest.raises(JIRAError):
+            mock_jira.create_issue(project="TEST", summary="S", description="D", issue_type="Bug", epic="X-1")
+
 
 class TestJiraInitAuth:
     @pytest.fixture
@@ -423,10 +516,6 @@ class TestSetAdditionalAssignees:
         user2.accountId = "id-2"
         mock_jira.connection.search_users.side_effect = [[user1], [user2]]
 
-        issue = MagicMock()
-        issue.self = f"{DEFAULT_JIRA_SERVER_URL}/rest/api/3/issue/10001"
-        mock_jira.get_issue_by_id_or_key = MagicMock(return_value=issue)
-
         put_response = MagicMock()
         put_response.ok = True
         mock_jira.connection._session.put.return_value = put_response
@@ -434,6 +523,9 @@ class TestSetAdditionalAssignees:
         mock_jira._set_additional_assignees("TEST-1", ["a@b.com", "c@d.com"])
 
         mock_jira.connection._session.put.assert_called_once()
+        assert (
+            mock_jira.connection._session.put.call_args.args[0] == f"{DEFAULT_JIRA_SERVER_URL}/rest/api/3/issue/TEST-1"
+        )
         call_kwargs = mock_jira.connection._session.put.call_args.kwargs
         payload = call_kwargs.get("json") or {}
         expected_users = [{"accountId": "id-1"}, {"accountId": "id-2"}]
@@ -445,16 +537,15 @@ class TestSetAdditionalAssignees:
         user1.accountId = "id-1"
         mock_jira.connection.search_users.side_effect = [[user1], []]
 
-        issue = MagicMock()
-        issue.self = f"{DEFAULT_JIRA_SERVER_URL}/rest/api/3/issue/10001"
-        mock_jira.get_issue_by_id_or_key = MagicMock(return_value=issue)
-
         put_response = MagicMock()
         put_response.ok = True
         mock_jira.connection._session.put.return_value = put_response
 
         mock_jira._set_additional_assignees("TEST-1", ["a@b.com", "nobody@b.com"])
 
+        assert (
+            mock_jira.connection._session.put.call_args.args[0] == f"{DEFAULT_JIRA_SERVER_URL}/rest/api/3/issue/TEST-1"
+        )
         call_kwargs = mock_jira.connection._session.put.call_args.kwargs
         payload = call_kwargs.get("json") or {}
         assert payload["fields"]["customfield_10465"] == [{"accountId": "id-1"}]
@@ -478,22 +569,24 @@ class TestCreateIssueWatchersAndAssigneesWiring:
             watcher_emails=["a@b.com"],
         )
 
-    def test_create_issue_calls_set_additional_assignees_when_provided(self, mock_jira):
+    def test_create_issue_sets_additional_assignees_in_create_payload(self, mock_jira):
         mock_jira.logger = LOGGER
-        mock_jira._set_additional_assignees = MagicMock()
+        user1 = MagicMock()
+        user1.accountId = "id-1"
+        mock_jira.connection.search_users.side_effect = lambda query, maxResults: [user1] if query == "c@d.com" else []
 
         mock_jira.create_issue(
             project="TEST",
             summary="S",
             description="D",
             issue_type="Bug",
-            additional_assignees=["c@d.com"],
+            additional_assignees=["c@d.com", "nobody@d.com"],
         )
 
-        mock_jira._set_additional_assignees.assert_called_once_with(
-            issue_key="TEST-1",
-            assignee_emails=["c@d.com"],
-        )
+        payload = _post_request_json(mock_jira.connection._session.post.call_args.kwargs)
+        assert payload["fields"]["customfield_10465"] == [{"accountId": "id-1"}]
+        mock_jira.connection._session.put.assert_not_called()
+        mock_jira.connection.issue.assert_not_called()
 
     def test_create_issue_skips_watchers_when_none(self, mock_jira):
         mock_jira.logger = LOGGER
@@ -509,3 +602,213 @@ class TestCreateIssueWatchersAndAssigneesWiring:
 
         mock_jira.add_watchers_to_issue.assert_not_called()
         mock_jira._set_additional_assignees.assert_not_called()
+
+
+class TestJiraMetadataCacheReuse:
+    def test_account_ids_are_resolved_once_per_email(self, mock_jira):
+        fake_user = MagicMock()
+        fake_user.accountId = "abc-123"
+        mock_jira.connection.search_users.return_value = [fake_user]
+
+        assert mock_jira._resolve_account_id("User@example.com") == "abc-123"
+        assert mock_jira._resolve_account_id("user@example.com") == "abc-123"
+
+        mock_jira.connection.search_users.assert_called_once()
+
+    def test_unresolved_account_id_is_looked_up_again(self, mock_jira):
+        mock_jira.logger = LOGGER
+        mock_jira.connection.search_users.return_value = []
+
+        mock_jira._resolve_account_id("nobody@example.com")
+        mock_jira._resolve_account_id("nobody@example.com")
+
+        assert mock_jira.connection.search_users.call_count == 2
+
+    def test_security_levels_are_fetched_once_per_project(self, mock_jira):
+        level = MagicMock()
+        level.name = "Red Hat Employee"
+        level.id = "42"
+        mock_jira.connection.project_issue_security_level_scheme.return_value.levels = [level]
+
+        for _ in range(2):
+            mock_jira.create_issue(
+                project="TEST",
+                summary="Test issue",
+                description="Description",
+                issue_type="Bug",
+                security_level="red hat employee",
+            )
+
+        mock_jira.connection.project.assert_called_once_with("TEST")
+        mock_jira.connection.project_issue_security_level_scheme.assert_called_once()
+        assert _post_request_json(mock_jira.connection._session.post.call_args.kwargs)["fields"]["security"] == {
+            "id": "42"
+        }
+
+    def test_transition_id_is_cached_per_project(self, mock_jira):
+        mock_jira.logger = LOGGER
+        mock_jira.connection.find_transitionid_by_name.return_value = "31"
+
+        mock_jira.close_issue("TEST-1")
+        mock_jira.close_issue("TEST-2")
+
+        mock_jira.connection.find_transitionid_by_name.assert_called_once_with("TEST-1", "closed")
+        posted = [call.kwargs["json"] for call in mock_jira.connection._session.post.call_args_list]
+        assert [payload["transition"]["id"] for payload in posted] == ["31", "31"]
+
+    def test_transition_id_of_numeric_issue_ids_is_cached_per_project(self, mock_jira):
+        mock_jira.logger = LOGGER
+        mock_jira.connection.find_transitionid_by_name.return_value = "31"
+        mock_jira.connection.issue.return_value.fields.project.key = "TEST"
+
+        mock_jira.close_issue("10001")
+        mock_jira.close_issue("10002")
+        mock_jira.close_issue("TEST-3")
+
+        mock_jira.connection.find_transitionid_by_name.assert_called_once_with("10001", "closed")
+        assert [call.args[0] for call in mock_jira.connection.issue.call_args_list] == ["10001", "10002"]
+        assert mock_jira.metadata_cache.get(namespace="transition_id", key="TEST:closed") == "31"
+
+    def test_rejected_cached_transition_id_is_looked_up_again(self, mock_jira):
+        mock_jira.logger = LOGGER
+        mock_jira.metadata_cache.set(namespace="transition_id", key="TEST:closed", value="31")
+        mock_jira.connection.find_transitionid_by_name.return_value = "41"
+        ok_response = mock_jira.connection._session.post.return_value
+        mock_jira.connection._session.post.side_effect = [_mock_error_response(400, "bad transition"), ok_response]
+
+        mock_jira.close_issue("TEST-1")
+
+        mock_jira.connection.find_transitionid_by_name.assert_called_once_with("TEST-1", "closed")
+        assert mock_jira.metadata_cache.get(namespace="transition_id", key="TEST:closed") == "41"
+
+
+class TestIssueRefWrites:
+    def test_issue_ref_from_key_issue_and_ref(self, mock_jira):
+        ref = mock_jira.issue_ref("TEST-1")
+        assert ref == IssueRef(key="TEST-1", url=f"{DEFAULT_JIRA_SERVER_URL}/rest/api/3/issue/TEST-1")
+        assert mock_jira.issue_ref(ref) is ref
+
+        issue = MagicMock()
+        issue.key = "TEST-2"
+        issue.self = "https://issues.example.com/rest/api/3/issue/10002"
+        assert mock_jira.issue_ref(issue) == IssueRef(key="TEST-2", url=issue.self)
+
+    def test_label_update_is_a_single_request(self, fake_issue_key, jira, patch_jira_api_requests):
+        issue, applied = jira.add_labels_to_issue(issue_id_or_key=fake_issue_key, labels=["firewatch"])
+
+        assert applied is True
+        assert issue == jira.issue_ref(fake_issue_key)
+        assert not [url for url in patch_jira_api_requests["get"] if "/issue/" in url]
+        assert list(patch_jira_api_requests["put"]) == [issue.url]
+
+    def test_writes_do_not_fetch_the_issue(self, mock_jira):
+        mock_jira.logger = LOGGER
+        mock_jira.connection.find_transitionid_by_name.return_value = "31"
+        fake_user = MagicMock()
+        fake_user.accountId = "abc-123"
+        mock_jira.connection.search_users.return_value = [fake_user]
+        ref = mock_jira.issue_ref("TEST-1")
+
+        mock_jira.close_issue(ref)
+        mock_jira._set_additional_assignees(ref, ["a@b.com"])
+        mock_jira.comment(ref, "comment")
+
+        mock_jira.connection.issue.assert_not_called()
+        mock_jira.connection._session.get.assert_not_called()
+        transition_call, comment_call = mock_jira.connection._session.post.call_args_list
+        assert transition_call.args[0] == mock_jira.connection._get_url("issue/TEST-1/transitions")
+        assert _post_request_json(transition_call.kwargs)["transition"] == {"id": "31"}
+        assert comment_call.args[0] == mock_jira.connection._get_url("issue/TEST-1/comment")
+        assert _post_request_json(comment_call.kwargs)["body"]["content"][0]["content"][0]["text"] == "comment"
+        assert mock_jira.connection._session.put.call_args.args[0] == ref.url
+        assert _post_request_json(mock_jira.connection._session.put.call_args.kwargs) == {
+            "fields": {"customfield_10465": [{"accountId": "abc-123"}]}
+        }
+
+
+def _search_page(keys, next_page_token=None):
+    return ResultList([MagicMock(key=key) for key in keys], _nextPageToken=next_page_token)
+
+
+class TestJiraSearch:
+    def test_search_returns_every_match_with_all_fields_by_default(self, mock_jira):
+        mock_jira.connection.enhanced_search_issues.side_effect = [
+            _search_page(["TEST-1", "TEST-2"], next_page_token="page-2"),
+            _search_page(["TEST-3"]),
+        ]
+
+        issues = mock_jira.search("project = TEST")
+
+        assert [issue.key for issue in issues] == ["TEST-1", "TEST-2", "TEST-3"]
+        calls = mock_jira.connection.enhanced_search_issues.call_args_list
+        assert calls[0].kwargs == {"nextPageToken": None, "maxResults": SEARCH_PAGE_SIZE, "fields": ["*all"]}
+        assert calls[1].kwargs["nextPageToken"] == "page-2"
+
+    def test_search_with_result_cap_and_fields(self, mock_jira):
+        mock_jira.connection.enhanced_search_issues.return_value = _search_page(
+            [f"TEST-{i}" for i in range(10)], next_page_token="page-2"
+        )
+
+        issues = mock_jira.search("project = TEST", max_results=10, fields=["key", "created"])
+
+        assert len(issues) == 10
+        mock_jira.connection.enhanced_search_issues.assert_called_once_with(
+            "project = TEST", nextPageToken=None, maxResults=10, fields=["key", "created"]
+        )
+
+    def test_search_issues_only_fetches_keys(self, mock_jira):
+        mock_jira.connection.enhanced_search_issues.return_value = _search_page(["TEST-1", "TEST-2"])
+
+        assert mock_jira.search_issues("project = TEST") == ["TEST-1", "TEST-2"]
+        assert mock_jira.connection.enhanced_search_issues.call_args.kwargs["fields"] == ["key"]
+        mock_jira.connection.search_issues.assert_not_called()
+
+    def test_iter_search_fetches_pages_lazily(self, mock_jira):
+        mock_jira.connection.enhanced_search_issues.side_effect = [
+            _search_page(["TEST-1", "TEST-2"], next_page_token="page-2"),
+            _search_page(["TEST-3", "TEST-4"], next_page_token="page-3"),
+        ]
+
+        keys = mock_jira.iter_search_issues("project = TEST", page_size=2)
+        assert mock_jira.connection.enhanced_search_issues.call_count == 0
+
+        assert next(keys) == "TEST-1"
+        assert next(keys) == "TEST-2"
+        assert mock_jira.connection.enhanced_search_issues.call_count == 1
+
+        assert next(keys) == "TEST-3"
+        keys.close()
+        assert mock_jira.connection.enhanced_search_issues.call_count == 2
+
+    def test_iter_search_pages_stops_without_a_next_page_token(self, mock_jira):
+        mock_jira.connection.enhanced_search_issues.side_effect = [
+            _search_page(["TEST-1"], next_page_token="page-2"),
+            _search_page([]),
+        ]
+
+        pages = list(mock_jira.iter_search_pages("project = TEST", fields=["key", "status"]))
+
+        assert [[issue.key for issue in page] for page in pages] == [["TEST-1"]]
+        assert mock_jira.connection.enhanced_search_issues.call_count == 2
+
+    def test_iter_search_pages_falls_back_to_offset_search(self, mock_jira):
+        mock_jira.connection.enhanced_search_issues.return_value = None
+        mock_jira.connection.search_issues.side_effect = [
+            ResultList([MagicMock(key="TEST-1"), MagicMock(key="TEST-2")], _total=3),
+            ResultList([MagicMock(key="TEST-3")], _total=3),
+        ]
+
+        assert list(mock_jira.iter_search_issues("project = TEST", page_size=2)) == ["TEST-1", "TEST-2", "TEST-3"]
+        calls = mock_jira.connection.search_issues.call_args_list
+        assert [call.kwargs["startAt"] for call in calls] == [0, 2]
+        assert calls[0].kwargs["fields"] == ["key"]
+
+    def test_offset_search_stops_on_an_empty_page(self, mock_jira):
+        mock_jira.connection.enhanced_search_issues.return_value = None
+        mock_jira.connection.search_issues.side_effect = [
+            ResultList([MagicMock(key="TEST-1")], _total=5),
+            ResultList([], _total=5),
+        ]
+
+        assert mock_jira.search_issues("project = TEST") == ["TEST-1"]
+        assert mock_jira.connection.search_issues.call_count == 2
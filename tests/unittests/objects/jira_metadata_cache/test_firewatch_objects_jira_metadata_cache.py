@@ -0,0 +1,86 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from src.objects.jira_metadata_cache import JiraMetadataCache
+
+SERVER_URL = "https://issues.example.com"
+
+
+class TestJiraMetadataCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache_dir = f"{self.temp_dir.name}/jira-metadata"
+
+    def test_get_or_fetch_fetches_once(self):
+        cache = JiraMetadataCache(server_url=SERVER_URL)
+        fetch = MagicMock(return_value="abc-123")
+
+        self.assertEqual(cache.get_or_fetch(namespace="account_id", key="user@example.com", fetch=fetch), "abc-123")
+        self.assertEqual(cache.get_or_fetch(namespace="account_id", key="user@example.com", fetch=fetch), "abc-123")
+
+        fetch.assert_called_once()
+
+    def test_missing_values_are_not_cached(self):
+        cache = JiraMetadataCache(server_url=SERVER_URL)
+        fetch = MagicMock(return_value=None)
+
+        cache.get_or_fetch(namespace="account_id", key="nobody@example.com", fetch=fetch)
+        cache.get_or_fetch(namespace="account_id", key="nobody@example.com", fetch=fetch)
+
+        self.assertEqual(fetch.call_count, 2)
+
+    def test_memory_only_cache_writes_nothing(self):
+        cache = JiraMetadataCache(server_url=SERVER_URL)
+        cache.set(namespace="epic_id", key="PROJECT-1", value="10001")
+
+        self.assertIsNone(cache.cache_path)
+        self.assertEqual(cache.get(namespace="epic_id", key="PROJECT-1"), "10001")
+
+    def test_values_are_shared_across_runs(self):
+        JiraMetadataCache(server_url=SERVER_URL, cache_dir=self.cache_dir).set(
+            namespace="security_levels",
+            key="PROJECT",
+            value={"red hat employee": "42"},
+        )
+
+        cache = JiraMetadataCache(server_url=SERVER_URL, cache_dir=self.cache_dir)
+        self.assertEqual(cache.get(namespace="security_levels", key="PROJECT"), {"red hat employee": "42"})
+        # Metadata of another Jira server is kept apart
+        other_cache = JiraMetadataCache(server_url="https://other.example.com", cache_dir=self.cache_dir)
+        self.assertIsNone(other_cache.get(namespace="security_levels", key="PROJECT"))
+
+    def test_expired_values_are_fetched_again(self):
+        cache = JiraMetadataCache(server_url=SERVER_URL, cache_dir=self.cache_dir, ttl=60)
+        with patch("src.objects.jira_metadata_cache.time.time", return_value=1000):
+            cache.set(namespace="transition_id", key="PROJECT:closed", value="31")
+        with patch("src.objects.jira_metadata_cache.time.time", return_value=1061):
+            self.assertIsNone(cache.get(namespace="transition_id", key="PROJECT:closed"))
+        with patch("src.objects.jira_metadata_cache.time.time", return_value=1059):
+            self.assertEqual(cache.get(namespace="transition_id", key="PROJECT:closed"), "31")
+
+    def test_invalidate_removes_value_from_disk(self):
+        cache = JiraMetadataCache(server_url=SERVER_URL, cache_dir=self.cache_dir)
+        cache.set(namespace="transition_id", key="PROJECT:closed", value="31")
+        cache.invalidate(namespace="transition_id", key="PROJECT:closed")
+
+        cache = JiraMetadataCache(server_url=SERVER_URL, cache_dir=self.cache_dir)
+        self.assertIsNone(cache.get(namespace="transition_id", key="PROJECT:closed"))
+
+    def test_corrupt_store_is_ignored(self):
+        cache = JiraMetadataCache(server_url=SERVER_URL, cache_dir=self.cache_dir)
+        os.makedirs(self.cache_dir)
+        with open(cache.cache_path, "w") as file:
+            file.write("{not json")
+
+        self.assertIsNone(cache.get(namespace="epic_id", key="PROJECT-1"))
+        cache.set(namespace="epic_id", key="PROJECT-1", value="10001")
+        self.assertEqual(
+            JiraMetadataCache(server_url=SERVER_URL, cache_dir=self.cache_dir).get(
+                namespace="epic_id", key="PROJECT-1"
+            ),
+            "10001",
+        )
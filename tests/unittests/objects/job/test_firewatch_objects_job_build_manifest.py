@@ -0,0 +1,60 @@
+import os
+import shutil
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from src.objects.job import Job
+from tests.unittests.objects.job.job_base_test import JobBaseTest
+
+
+class TestJobBuildManifest(JobBaseTest):
+    @patch.object(Job, "_download_junit", return_value="")
+    @patch.object(Job, "_download_logs", return_value="")
+    def setUp(self, *args):
+        super().setUp()
+        self.job = Job(
+            name="periodic-job-1",
+            name_safe="job1_safe",
+            build_id="456",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+        )
+        self.mock_get_steps.stop()
+
+        prefix = "logs/periodic-job-1/456/artifacts/job1_safe/"
+        self.storage_client = MagicMock()
+        self.storage_client.list_blobs.return_value = [
+            SimpleNamespace(name=f"{prefix}{name}", size=1, generation=1, md5_hash=None)
+            for name in [
+                "step1/finished.json",
+                "step1/build-log.txt",
+                "step1/artifacts/junit_install.xml",
+                "step2/finished.json",
+                "step2/artifacts/junit_install.xml",
+            ]
+        ]
+        self.job.build_manifest = None
+
+    def test_steps_and_downloads_share_one_listing(self):
+        kwargs = {
+            "job_name": self.job.name,
+            "build_id": self.job.build_id,
+            "job_name_safe": self.job.name_safe,
+            "storage_client": self.storage_client,
+            "gcs_bucket": "bucket1",
+        }
+        download_path = self.job._get_download_path(build_id="firewatch-manifest-test")
+        self.addCleanup(shutil.rmtree, download_path)
+
+        steps = self.job._get_steps(**kwargs)
+        logs_dir = self.job._download_logs(downloads_directory=download_path, pr_id="", **kwargs)
+        junit_dir = self.job._download_junit(downloads_directory=download_path, pr_id="", **kwargs)
+
+        self.storage_client.list_blobs.assert_called_once()
+        self.assertEqual(steps, ["step1", "step2"])
+        self.assertEqual(sorted(os.listdir(f"{logs_dir}/step1")), ["build-log.txt", "finished.json"])
+        self.assertEqual(os.listdir(f"{logs_dir}/step2"), ["finished.json"])
+        self.assertEqual(os.listdir(f"{junit_dir}/step1"), ["junit_install.xml"])
+        self.assertEqual(os.listdir(f"{junit_dir}/step2"), ["junit_install.xml"])
@@ -96,3 +96,60 @@ class TestCheckRetrigger(JobBaseTest):
                     gcs_bucket="bucket1",
                 )
                 assert is_retriggered is False
+
+    def _create_job(self):
+        return Job(
+            name="periodic-job-1",
+            name_safe="job1_safe",
+            build_id="10000",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+        )
+
+    def test_check_is_retriggered_stops_at_previous_week_build(self):
+        job = self._create_job()
+        all_build_ids = [str(build_id) for build_id in range(1, 10001)]
+        fetched = []
+
+        def mock_get_timestamp(*args, **kwargs):
+            fetched.append(kwargs.get("build_id"))
+            return 1739167564  # Mon, Feb 10, 2025 (previous week build)
+
+        with patch.object(job, "_get_timestamp", side_effect=mock_get_timestamp):
+            is_retriggered = job._check_is_retriggered(
+                job_name="periodic-job-1",
+                build_id="10000",
+                timestamp=1739979486,  # Wed, Feb 19, 2025
+                all_build_ids=all_build_ids,
+                storage_client=MagicMock(),
+                gcs_bucket="bucket1",
+            )
+
+        assert is_retriggered is False
+        assert fetched == ["9999"]
+
+    def test_check_is_retriggered_skips_builds_without_timestamp(self):
+        job = self._create_job()
+        all_build_ids = [str(build_id) for build_id in range(1, 10001)]
+        fetched = []
+
+        def mock_get_timestamp(*args, **kwargs):
+            build_id = kwargs.get("build_id")
+            fetched.append(build_id)
+            # Builds newer than 9990 never uploaded a started.json
+            return 1739772346 if int(build_id) <= 9990 else None  # Mon, Feb 17, 2025 (current week build)
+
+        with patch.object(job, "_get_timestamp", side_effect=mock_get_timestamp):
+            is_retriggered = job._check_is_retriggered(
+                job_name="periodic-job-1",
+                build_id="10000",
+                timestamp=1739979486,  # Wed, Feb 19, 2025
+                all_build_ids=all_build_ids,
+                storage_client=MagicMock(),
+                gcs_bucket="bucket1",
+            )
+
+        assert is_retriggered is True
+        # Batches of 1, 2, 4 and 8 builds are fetched before a build with a timestamp is found
+        assert len(fetched) == 15
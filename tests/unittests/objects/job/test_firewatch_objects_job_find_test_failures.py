@@ -1,3 +1,7 @@
+import gzip
+import io
+import os
+import tarfile
 import tempfile
 
 from src.objects.job import Job
@@ -35,3 +39,86 @@ class TestFindTestFailures(JobBaseTest):
         helpers._create_successful_step_junit(junit_dir=junit_dir)
         failures = job._find_test_failures(junit_dir=junit_dir)
         assert len(failures) == 0
+
+    def test_find_test_failures_deduplicates_in_first_seen_order(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        junit_dir = helpers._get_tmp_junit_dir(tmp_path=temp_dir.name)
+        os.makedirs(f"{junit_dir}/step1")
+        with open(f"{junit_dir}/step1/junit_e2e.xml", "w") as file:
+            file.write(
+                '<testsuite name="e2e">'
+                '<testcase name="test b"><failure/><failure/></testcase>'
+                '<testcase name="test a"><error/></testcase>'
+                '<testcase name="test b"><failure/></testcase>'
+                "</testsuite>",
+            )
+        self.config.verbose_test_failure_reporting = True
+        job = Job(
+            name="rehearse-1234-job1",
+            name_safe="job1_safe",
+            build_id="123",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+        )
+        failures = job._find_test_failures(junit_dir=junit_dir)
+        assert [failure.failed_test_name for failure in failures] == ["test_b", "test_a"]
+
+    def test_find_test_failures_with_parse_workers_matches_serial(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        junit_dir = helpers._get_tmp_junit_dir(tmp_path=temp_dir.name)
+        for step in ["step1", "step2", "step3"]:
+            os.makedirs(f"{junit_dir}/{step}")
+            for suite in ["install", "e2e"]:
+                with open(f"{junit_dir}/{step}/junit_{suite}.xml", "w") as file:
+                    file.write(
+                        f'<testsuite name="{suite}">'
+                        f'<testcase name="{step} {suite} a"><failure/></testcase>'
+                        '<testcase name="passed"/>'
+                        f'<testcase name="{step} {suite} b"><error/></testcase>'
+                        "</testsuite>",
+                    )
+        with open(f"{junit_dir}/step3/junit_broken.xml", "w") as file:
+            file.write("<testsuite>")
+        self.config.verbose_test_failure_reporting = True
+        job = Job(
+            name="rehearse-1234-job1",
+            name_safe="job1_safe",
+            build_id="123",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+        )
+        serial_failures = job._find_test_failures(junit_dir=junit_dir)
+        job.parse_workers = 3
+        parallel_failures = job._find_test_failures(junit_dir=junit_dir)
+        assert len(serial_failures) == 12
+        assert parallel_failures == serial_failures
+
+    def test_find_test_failures_in_compressed_junit_files(self):
+        temp_dir = tempfile.TemporaryDirectory()
+        junit_dir = helpers._get_tmp_junit_dir(tmp_path=temp_dir.name)
+        junit_xml = '<testsuite name="e2e"><testcase name="{}"><failure/></testcase></testsuite>'
+        os.makedirs(f"{junit_dir}/step1")
+        with gzip.open(f"{junit_dir}/step1/junit_e2e.xml.gz", "wb") as file:
+            file.write(junit_xml.format("gzipped test").encode())
+        os.makedirs(f"{junit_dir}/step2")
+        with tarfile.open(f"{junit_dir}/step2/junit_results.tar.gz", mode="w:gz") as archive:
+            content = junit_xml.format("archived test").encode()
+            info = tarfile.TarInfo(name="results/junit_install.xml")
+            info.size = len(content)
+            archive.addfile(info, io.BytesIO(content))
+        self.config.verbose_test_failure_reporting = True
+        job = Job(
+            name="rehearse-1234-job1",
+            name_safe="job1_safe",
+            build_id="123",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+        )
+        failures = job._find_test_failures(junit_dir=junit_dir)
+        assert sorted((failure.step, failure.failed_test_name) for failure in failures) == [
+            ("step1", "gzipped_test"),
+            ("step2", "archived_test"),
+        ]
@@ -97,6 +97,80 @@ class TestGetAllBuildIds(JobBaseTest):
         expected_prefix = "logs/periodic-job-1/"
         mock_bucket.list_blobs.assert_called_with(prefix=expected_prefix, delimiter="/")
 
+    @patch("src.objects.job.storage.Client")
+    def test_get_all_build_ids_windowed_listing(self, mock_storage_client):
+        """
+        Tests that _get_all_build_ids only lists the builds within the look-back window of a snowflake build ID.
+        """
+        # --- Setup Mocks ---
+        mock_client = MagicMock()
+        mock_bucket = MagicMock()
+        mock_blobs = MagicMock()
+
+        mock_storage_client.return_value = mock_client
+        mock_client.bucket.return_value = mock_bucket
+        mock_bucket.list_blobs.return_value = mock_blobs
+        mock_blobs.pages = [MagicMock(prefixes=["logs/periodic-job-1/1805119554108526590/"])]
+
+        job = Job(
+            name="periodic-job-1",
+            name_safe="job1_safe",
+            build_id="1805119554108526592",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+        )
+
+        # --- Run Method ---
+        build_ids = job._get_all_build_ids(
+            job_name="periodic-job-1",
+            storage_client=mock_client,
+            gcs_bucket="bucket1",
+            build_id="1805119554108526592",
+            lookback_days=7,
+        )
+
+        # --- Assertions ---
+        assert build_ids == ["1805119554108526590"]
+        lower_bound = str((((1805119554108526592 >> 22) - 7 * 24 * 60 * 60 * 1000) << 22))
+        mock_bucket.list_blobs.assert_called_with(
+            prefix="logs/periodic-job-1/",
+            delimiter="/",
+            start_offset=f"logs/periodic-job-1/{lower_bound}",
+            end_offset="logs/periodic-job-1/1805119554108526592/",
+        )
+
+    @patch("src.objects.job.storage.Client")
+    def test_get_all_build_ids_non_snowflake_build_id_lists_everything(self, mock_storage_client):
+        """
+        Tests that _get_all_build_ids falls back to a full listing when the build ID is not a snowflake ID.
+        """
+        mock_client = MagicMock()
+        mock_bucket = MagicMock()
+        mock_storage_client.return_value = mock_client
+        mock_client.bucket.return_value = mock_bucket
+        mock_bucket.list_blobs.return_value.pages = [MagicMock(prefixes=["logs/periodic-job-1/100/"])]
+
+        job = Job(
+            name="periodic-job-1",
+            name_safe="job1_safe",
+            build_id="101",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+        )
+
+        build_ids = job._get_all_build_ids(
+            job_name="periodic-job-1",
+            storage_client=mock_client,
+            gcs_bucket="bucket1",
+            build_id="101",
+            lookback_days=7,
+        )
+
+        assert build_ids == ["100"]
+        mock_bucket.list_blobs.assert_called_with(prefix="logs/periodic-job-1/", delimiter="/")
+
 
 if __name__ == "__main__":
     unittest.main()
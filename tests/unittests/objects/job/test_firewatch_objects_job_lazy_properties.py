@@ -0,0 +1,94 @@
+from unittest.mock import patch
+
+from src.objects.job import Job
+from tests.unittests.objects.job.job_base_test import JobBaseTest
+
+
+class TestJobLazyProperties(JobBaseTest):
+    def _create_job(self, name: str = "periodic-job-1") -> Job:
+        return Job(
+            name=name,
+            name_safe="job1_safe",
+            build_id="123",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+        )
+
+    def test_initialization_does_not_call_gcs(self):
+        with (
+            patch.object(Job, "_download_logs") as mock_download_logs,
+            patch.object(Job, "_download_junit") as mock_download_junit,
+            patch.object(Job, "_get_timestamp") as mock_get_timestamp,
+            patch.object(Job, "_get_all_build_ids") as mock_get_all_build_ids,
+        ):
+            job = self._create_job()
+
+        mock_download_logs.assert_not_called()
+        mock_download_junit.assert_not_called()
+        mock_get_timestamp.assert_not_called()
+        mock_get_all_build_ids.assert_not_called()
+        self.assertIsNone(job.build_manifest)
+
+    def test_retrigger_check_does_not_download_artifacts(self):
+        job = self._create_job()
+        with (
+            patch.object(Job, "_download_logs") as mock_download_logs,
+            patch.object(Job, "_download_junit") as mock_download_junit,
+            patch.object(Job, "_get_timestamp", return_value=None) as mock_get_timestamp,
+            patch.object(Job, "_get_all_build_ids", return_value=[]),
+        ):
+            self.assertFalse(job.is_retriggered)
+
+        mock_get_timestamp.assert_called_once()
+        mock_download_logs.assert_not_called()
+        mock_download_junit.assert_not_called()
+
+    def test_failures_are_computed_once(self):
+        job = self._create_job()
+        with (
+            patch.object(Job, "_download_logs", return_value="") as mock_download_logs,
+            patch.object(Job, "_download_junit", return_value="") as mock_download_junit,
+            patch.object(Job, "_find_failures", return_value=[]) as mock_find_failures,
+        ):
+            self.assertEqual(job.failures, [])
+            self.assertFalse(job.has_test_failures)
+            self.assertFalse(job.has_pod_failures)
+
+        mock_download_logs.assert_called_once()
+        mock_download_junit.assert_called_once()
+        mock_find_failures.assert_called_once()
+
+    def test_log_skipped_gcs_calls(self):
+        job = self._create_job()
+        with (
+            patch.object(Job, "_get_timestamp", return_value=None),
+            patch.object(Job, "_get_all_build_ids", return_value=[]),
+        ):
+            self.assertFalse(job.is_retriggered)
+
+        job.log_skipped_gcs_calls()
+
+        job.logger.info.assert_called_with(
+            "Skipped 3 GCS calls not needed for this report: artifact listing, log download, JUnit download",
+        )
+
+    def test_job_without_steps_exits_before_downloading(self):
+        self.mock_get_steps.stop()
+        job = self._create_job()
+        with (
+            patch.object(Job, "_get_steps", return_value=[]),
+            patch.object(Job, "_download_logs") as mock_download_logs,
+            self.assertRaises(SystemExit),
+        ):
+            job.logs_dir
+
+        mock_download_logs.assert_not_called()
+
+    def test_rehearsal_without_steps_is_valid(self):
+        self.mock_get_steps.stop()
+        job = self._create_job(name="rehearse-1234-periodic-job-1")
+        with patch.object(Job, "_get_steps", return_value=[]) as mock_get_steps:
+            job.validate_steps()
+
+        mock_get_steps.assert_not_called()
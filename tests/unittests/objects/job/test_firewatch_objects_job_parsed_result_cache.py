@@ -0,0 +1,128 @@
+import base64
+import hashlib
+import os
+import shutil
+import tempfile
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+from src.objects.job import Job
+from tests.unittests.objects.job.job_base_test import JobBaseTest
+
+RESOURCES_DIR = f"{os.path.dirname(os.path.dirname(os.path.dirname(__file__)))}/resources"
+PREFIX = "logs/periodic-job-1/456/artifacts/job1_safe/"
+
+
+def _read_resource(name: str) -> bytes:
+    with open(f"{RESOURCES_DIR}/{name}", "rb") as file:
+        return file.read()
+
+
+class TestJobParsedResultCache(JobBaseTest):
+    def setUp(self):
+        super().setUp()
+        self.mock_get_steps.stop()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+        self.contents = {
+            f"{PREFIX}step1/finished.json": _read_resource("pod_fail.json"),
+            f"{PREFIX}step1/artifacts/junit_install.xml": _read_resource("junit_fail.xml"),
+            f"{PREFIX}step2/finished.json": b'{"passed": true}',
+            f"{PREFIX}step2/artifacts/junit_install.xml": b'<testsuite name="suite"><testcase name="ok"/></testsuite>',
+        }
+        self.downloaded: list[str] = []
+
+    def _storage_client(self) -> MagicMock:
+        storage_client = MagicMock()
+        storage_client.list_blobs.return_value = [
+            SimpleNamespace(
+                name=name,
+                size=len(content),
+                generation=1,
+                md5_hash=base64.b64encode(hashlib.md5(content).digest()).decode(),
+            )
+            for name, content in self.contents.items()
+        ]
+
+        def blob(name, generation=None):
+            def download_to_file(target):
+                self.downloaded.append(name)
+                target.write(self.contents[name])
+
+            return SimpleNamespace(download_to_file=download_to_file)
+
+        storage_client.bucket.return_value.blob.side_effect = blob
+        return storage_client
+
+    def _run(self, build_dir: str) -> list:
+        with patch("src.objects.job.storage.Client.create_anonymous_client", return_value=self._storage_client()):
+            job = Job(
+                name="periodic-job-1",
+                name_safe="job1_safe",
+                build_id="456",
+                gcs_bucket="bucket1",
+                gcs_creds_file=None,
+                firewatch_config=self.config,
+                parsed_result_cache_path=f"{self.temp_dir.name}/parsed-results.db",
+            )
+        job.download_path = f"{self.temp_dir.name}/{build_dir}"
+        os.mkdir(job.download_path)
+        self.addCleanup(shutil.rmtree, job.download_path, True)
+        failures = job.failures
+        job.close()
+        return failures
+
+    def test_rerun_skips_download_and_parse_of_seen_files(self):
+        first_failures = self._run(build_dir="first")
+        self.assertEqual(len(self.downloaded), 4)
+
+        self.downloaded.clear()
+        with patch("src.objects.job.scan_junit_file") as mock_scan:
+            second_failures = self._run(build_dir="second")
+
+        mock_scan.assert_not_called()
+        self.assertEqual(
+            [(failure.step, failure.failure_type) for failure in first_failures], [("step1", "test_failure")]
+        )
+        self.assertEqual(second_failures, first_failures)
+        # Files with failures are still downloaded because they are attached to the Jira issues
+        self.assertNotIn(f"{PREFIX}step2/finished.json", self.downloaded)
+        self.assertNotIn(f"{PREFIX}step2/artifacts/junit_install.xml", self.downloaded)
+        self.assertIn(f"{PREFIX}step1/finished.json", self.downloaded)
+        self.assertIn(f"{PREFIX}step1/artifacts/junit_install.xml", self.downloaded)
+
+    def test_changed_file_is_parsed_again(self):
+        self._run(build_dir="first")
+
+        self.contents[f"{PREFIX}step2/finished.json"] = b'{"passed": false}'
+        failures = self._run(build_dir="second")
+
+        self.assertIn(("step2", "pod_failure"), [(failure.step, failure.failure_type) for failure in failures])
+
+    def test_file_that_is_not_junit_is_still_downloaded_on_rerun(self):
+        self.contents[f"{PREFIX}step2/artifacts/junit_other.xml"] = b"<report><item/></report>"
+        self._run(build_dir="first")
+
+        self.downloaded.clear()
+        with patch("src.objects.job.scan_junit_file") as mock_scan:
+            self._run(build_dir="second")
+
+        mock_scan.assert_not_called()
+        self.assertIn(f"{PREFIX}step2/artifacts/junit_other.xml", self.downloaded)
+        self.assertNotIn(f"{PREFIX}step2/artifacts/junit_install.xml", self.downloaded)
+
+    def test_close_closes_the_parsed_result_cache(self):
+        job = Job(
+            name="periodic-job-1",
+            name_safe="job1_safe",
+            build_id="456",
+            gcs_bucket="bucket1",
+            gcs_creds_file=None,
+            firewatch_config=self.config,
+            parsed_result_cache_path=f"{self.temp_dir.name}/parsed-results.db",
+        )
+        job.close()
+
+        self.assertIsNone(job.parsed_result_cache._connection)
@@ -0,0 +1,185 @@
+import gzip
+import io
+import os
+import tarfile
+import tempfile
+import unittest
+from xml.etree.ElementTree import ParseError
+
+import junitparser
+
+from src.objects.junit_scanner import JUnitFailureEvent
+from src.objects.junit_scanner import NotJUnitFileError
+from src.objects.junit_scanner import is_junit_file_name
+from src.objects.junit_scanner import scan_junit_failures
+from src.objects.junit_scanner import scan_junit_file
+
+TESTSUITES_XML = """<testsuites>
+    <testcase name="outside-suite"><failure/></testcase>
+    <testsuite name="suite1">
+        <properties><property name="a" value="b"/></properties>
+        <testcase name="test passed"/>
+        <testcase name="test failed"><failure message="boom"/></testcase>
+        <testsuite name="nested">
+            <testcase name="nested error"><error/><system-out>out</system-out></testcase>
+        </testsuite>
+        <testcase name="test skipped"><skipped/></testcase>
+        <testcase name="test failed twice"><failure/><failure/></testcase>
+    </testsuite>
+</testsuites>"""
+
+TESTSUITE_XML = """<testsuite name="suite1">
+    <testcase name="test failed"><failure/></testcase>
+    <testcase name="test passed"/>
+    <testcase name="test errored"><error/></testcase>
+</testsuite>"""
+
+# Nested suites come before the test cases of their parent suite, and are nested two levels deep
+NESTED_TESTSUITES_XML = """<testsuites>
+    <testsuite name="outer">
+        <testsuite name="inner">
+            <testsuite name="innermost"><testcase name="t3"><failure/></testcase></testsuite>
+            <testcase name="t1"><failure/></testcase>
+        </testsuite>
+        <testcase name="t2"><failure/></testcase>
+    </testsuite>
+    <testsuite name="second"><testcase name="t4"><error/></testcase></testsuite>
+</testsuites>"""
+
+
+def _junitparser_failures(file_path: str) -> list[tuple]:
+    """The failures found by walking the file with junitparser, the way Job used to."""
+    failures = []
+    for suite in junitparser.JUnitXml.fromfile(file_path):
+        for case in suite:
+            if hasattr(case, "result") and case.result:
+                for result in case.result:
+                    if isinstance(result, (junitparser.Failure, junitparser.Error)):
+                        failures.append((case.name, result._tag))
+            elif isinstance(case, (junitparser.Failure, junitparser.Error)):
+                failures.append((suite.name, case._tag))
+    return failures
+
+
+class TestScanJUnitFailures(unittest.TestCase):
+    def _write(self, content: str) -> str:
+        file = tempfile.NamedTemporaryFile(mode="w", suffix=".xml", delete=False)
+        self.addCleanup(file.close)
+        file.write(content)
+        file.flush()
+        return file.name
+
+    def test_testsuites_root(self):
+        events = list(scan_junit_failures(self._write(TESTSUITES_XML)))
+
+        self.assertEqual(
+            events,
+            [
+                JUnitFailureEvent(suite="suite1", testcase="test failed", result="failure"),
+                JUnitFailureEvent(suite="suite1", testcase="test failed twice", result="failure"),
+                JUnitFailureEvent(suite="suite1", testcase="test failed twice", result="failure"),
+                JUnitFailureEvent(suite="nested", testcase="nested error", result="error"),
+            ],
+        )
+
+    def test_testsuite_root(self):
+        events = list(scan_junit_failures(self._write(TESTSUITE_XML)))
+
+        self.assertEqual(
+            [(event.testcase, event.result) for event in events],
+            [("test failed", "failure"), ("test errored", "error")],
+        )
+
+    def test_matches_junitparser(self):
+        for content in (TESTSUITES_XML, TESTSUITE_XML, NESTED_TESTSUITES_XML):
+            file_path = self._write(content)
+            events = [(event.testcase, event.result) for event in scan_junit_failures(file_path)]
+            self.assertEqual(events, _junitparser_failures(file_path))
+
+    def test_nested_suites_follow_their_parent_test_cases(self):
+        events = list(scan_junit_failures(self._write(NESTED_TESTSUITES_XML)))
+
+        self.assertEqual([event.testcase for event in events], ["t2", "t1", "t3", "t4"])
+
+    def test_invalid_root(self):
+        with self.assertRaises(NotJUnitFileError):
+            list(scan_junit_failures(self._write("<html><testcase><failure/></testcase></html>")))
+
+    def test_invalid_xml(self):
+        with self.assertRaises(ParseError):
+            list(scan_junit_failures(self._write("<testsuite><testcase>")))
+
+
+class TestScanCompressedJUnitFiles(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+
+    def _write_tar(self, name: str, members: dict[str, bytes]) -> str:
+        file_path = f"{self.temp_dir.name}/{name}"
+        with tarfile.open(file_path, mode="w:gz" if name.endswith("gz") else "w") as archive:
+            for member_name, content in members.items():
+                info = tarfile.TarInfo(name=member_name)
+                info.size = len(content)
+                archive.addfile(info, io.BytesIO(content))
+        return file_path
+
+    def test_gzipped_junit_file(self):
+        file_path = f"{self.temp_dir.name}/junit_e2e.xml.gz"
+        with gzip.open(file_path, "wb") as file:
+            file.write(TESTSUITE_XML.encode())
+
+        events = scan_junit_file(file_path)
+
+        self.assertEqual(
+            [(event.testcase, event.result) for event in events],
+            [("test failed", "failure"), ("test errored", "error")],
+        )
+
+    def test_tar_archive_scans_junit_members_only(self):
+        for name in ("junit_results.tar", "junit_results.tar.gz", "junit_results.tgz"):
+            file_path = self._write_tar(
+                name=name,
+                members={
+                    "results/junit_suite1.xml": TESTSUITE_XML.encode(),
+                    "results/junit_suite2.xml.gz": gzip.compress(TESTSUITES_XML.encode()),
+                    "results/build.log": b"<testsuite><testcase><failure/></testcase></testsuite>",
+                    "results/junit_broken.xml": b"<testsuite><testcase>",
+                },
+            )
+
+            events = scan_junit_file(file_path)
+
+            self.assertEqual(
+                [event.testcase for event in events],
+                [
+                    "test failed",
+                    "test errored",
+                    "test failed",
+                    "test failed twice",
+                    "test failed twice",
+                    "nested error",
+                ],
+            )
+            # The archive is never extracted next to the scanned file
+            self.assertEqual(sorted(os.listdir(self.temp_dir.name)), [name])
+            os.remove(file_path)
+
+    def test_tar_archive_without_junit_members(self):
+        file_path = self._write_tar(name="junit_results.tar", members={"build.log": b"log"})
+
+        self.assertIsNone(scan_junit_file(file_path))
+
+    def test_corrupt_compressed_files(self):
+        for name in ("junit_e2e.xml.gz", "junit_results.tar.gz"):
+            file_path = f"{self.temp_dir.name}/{name}"
+            with open(file_path, "wb") as file:
+                file.write(gzip.compress(TESTSUITE_XML.encode())[:20])
+
+            self.assertIsNone(scan_junit_file(file_path))
+
+    def test_is_junit_file_name(self):
+        for file_name in ("junit_e2e.xml", "junit_e2e.xml.gz", "junit_results.tar", "junit.tar.gz", "junit.tgz"):
+            self.assertTrue(is_junit_file_name(file_name), file_name)
+        for file_name in ("results.tar.gz", "junit.log", "e2e.xml"):
+            self.assertFalse(is_junit_file_name(file_name), file_name)
@@ -0,0 +1,74 @@
+import tempfile
+import unittest
+
+from src.objects.build_manifest import ManifestEntry
+from src.objects.junit_scanner import JUnitFailureEvent
+from src.objects.parsed_result_cache import ParsedResultCache
+
+
+def _entry(name: str, generation: int = 1, md5_hash: str = "hash", listed: bool = True) -> ManifestEntry:
+    return ManifestEntry(
+        name=name,
+        size=1,
+        generation=generation,
+        md5_hash=md5_hash,
+        step="step1",
+        relative_path=name,
+        listed=listed,
+    )
+
+
+class TestParsedResultCache(unittest.TestCase):
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.db_path = f"{self.temp_dir.name}/cache/parsed-results.db"
+        self.cache = ParsedResultCache(db_path=self.db_path)
+        self.addCleanup(self.cache.close)
+
+    def test_pod_result_round_trip(self):
+        self.cache.store_pod_result(entry=_entry("step1/finished.json"), passed=False)
+        self.cache.store_pod_result(entry=_entry("step2/finished.json"), passed=True)
+
+        self.assertIs(self.cache.get_pod_result(entry=_entry("step1/finished.json")), False)
+        self.assertIs(self.cache.get_pod_result(entry=_entry("step2/finished.json")), True)
+
+    def test_junit_result_round_trip(self):
+        events = [
+            JUnitFailureEvent(suite="suite", testcase="test 1", result="failure"),
+            JUnitFailureEvent(suite=None, testcase=None, result="error"),
+        ]
+        self.cache.store_junit_result(entry=_entry("junit.xml"), events=events)
+        self.cache.store_junit_result(entry=_entry("junit_other.xml"), events=None)
+
+        self.assertEqual(self.cache.get_junit_result(entry=_entry("junit.xml")), (True, events))
+        self.assertEqual(self.cache.get_junit_result(entry=_entry("junit_other.xml")), (True, None))
+
+    def test_results_survive_a_new_connection(self):
+        self.cache.store_pod_result(entry=_entry("step1/finished.json"), passed=False)
+        self.cache.close()
+
+        cache = ParsedResultCache(db_path=self.db_path)
+        self.addCleanup(cache.close)
+        self.assertIs(cache.get_pod_result(entry=_entry("step1/finished.json")), False)
+
+    def test_new_content_is_a_miss(self):
+        self.cache.store_junit_result(entry=_entry("junit.xml"), events=[])
+
+        self.assertEqual(self.cache.get_junit_result(entry=_entry("junit.xml", generation=2)), (False, None))
+        self.assertEqual(self.cache.get_junit_result(entry=_entry("junit.xml", md5_hash="other")), (False, None))
+        self.assertIsNone(self.cache.get_pod_result(entry=_entry("junit.xml")))
+
+    def test_entry_with_unknown_content_is_not_cached(self):
+        for entry in [_entry("finished.json", listed=False), _entry("finished.json", md5_hash=None)]:
+            self.cache.store_pod_result(entry=entry, passed=True)
+            self.assertIsNone(self.cache.get_pod_result(entry=entry))
+
+    def test_unusable_database_disables_the_cache(self):
+        db_path = f"{self.temp_dir.name}/not-a-database.db"
+        with open(db_path, "w") as file:
+            file.write("not a sqlite database" * 100)
+
+        cache = ParsedResultCache(db_path=db_path)
+        cache.store_pod_result(entry=_entry("finished.json"), passed=True)
+        self.assertIsNone(cache.get_pod_result(entry=_entry("finished.json")))
@@ -3,6 +3,7 @@ from unittest.mock import MagicMock
 from unittest.mock import patch
 
 from src.objects.rule import Rule
+from src.objects.rule_defaults import RuleDefaults
 
 
 class RuleBaseTest(unittest.TestCase):
@@ -11,6 +12,7 @@ class RuleBaseTest(unittest.TestCase):
             rule_dict={
                 "jira_project": "TEST",
             },
+            defaults=RuleDefaults.from_env(),
         )
         self.mock_logger = patch("src.objects.job.get_logger")
         self.mock_logger.start().return_value = MagicMock()
@@ -1,6 +1,7 @@
 import unittest
 
 from src.objects.rule import Rule
+from src.objects.rule_defaults import RuleDefaults
 
 
 class TestRule(unittest.TestCase):
@@ -16,7 +17,7 @@ class TestRule(unittest.TestCase):
         }
 
     def test_rule_init(self):
-        rule = Rule(rule_dict=self.rule_dict)
+        rule = Rule(rule_dict=self.rule_dict, defaults=RuleDefaults.from_env())
         assert rule.jira_project == "project1"
         assert rule.jira_epic == "epic1"
         assert rule.jira_component == ["component1"]
@@ -2,18 +2,19 @@ from unittest.mock import patch
 
 import pytest
 
+from src.objects.rule_defaults import RuleDefaults
 from tests.unittests.objects.rule.rule_base_test import RuleBaseTest
 
 
 class TestGetJiraAdditionalLabels(RuleBaseTest):
     def test_get_jira_additional_labels_defined(self):
         test_rule_dict = {"jira_additional_labels": ["label1", "label2"]}
-        result = self.rule._get_jira_additional_labels(test_rule_dict)
+        result = self.rule._get_jira_additional_labels(test_rule_dict, RuleDefaults.from_env())
         assert result == ["label1", "label2"]
 
     def test_get_jira_additional_labels_not_defined(self):
         test_rule_dict = {}
-        result = self.rule._get_jira_additional_labels(test_rule_dict)
+        result = self.rule._get_jira_additional_labels(test_rule_dict, RuleDefaults.from_env())
         assert result is None
 
     @patch.dict(
@@ -24,15 +25,15 @@ class TestGetJiraAdditionalLabels(RuleBaseTest):
     )
     def test_get_jira_additional_labels_default(self):
         test_rule_dict = {"jira_additional_labels": ["!default", "label1"]}
-        result = self.rule._get_jira_additional_labels(test_rule_dict)
+        result = self.rule._get_jira_additional_labels(test_rule_dict, RuleDefaults.from_env())
         assert result == ["label1", "default_label1", "default_label2"]
 
     def test_get_jira_additional_labels_with_spaces(self):
         test_rule_dict = {"jira_additional_labels": ["label 1", "label2"]}
         with pytest.raises(SystemExit):
-            self.rule._get_jira_additional_labels(test_rule_dict)
+            self.rule._get_jira_additional_labels(test_rule_dict, RuleDefaults.from_env())
 
     def test_get_jira_additional_labels_non_string(self):
         test_rule_dict = {"jira_additional_labels": [123, "label2"]}
         with pytest.raises(SystemExit):
-            self.rule._get_jira_additional_labels(test_rule_dict)
+            self.rule._get_jira_additional_labels(test_rule_dict, RuleDefaults.from_env())
@@ -1,17 +1,18 @@
 from unittest.mock import patch
 
+from src.objects.rule_defaults import RuleDefaults
 from tests.unittests.objects.rule.rule_base_test import RuleBaseTest
 
 
 class TestGetJiraAffectsVersion(RuleBaseTest):
     def test_get_jira_affects_version_defined(self):
         test_rule_dict = {"jira_affects_version": "test version"}
-        result = self.rule._get_jira_affects_version(test_rule_dict)
+        result = self.rule._get_jira_affects_version(test_rule_dict, RuleDefaults.from_env())
         assert result == "test version"
 
     def test_get_jira_affects_version_not_defined(self):
         test_rule_dict = {}
-        result = self.rule._get_jira_affects_version(test_rule_dict)
+        result = self.rule._get_jira_affects_version(test_rule_dict, RuleDefaults.from_env())
         assert result is None
 
     @patch.dict(
@@ -20,5 +21,5 @@ class TestGetJiraAffectsVersion(RuleBaseTest):
     )
     def test_get_jira_affects_version_default(self):
         test_rule_dict = {"jira_affects_version": "!default"}
-        result = self.rule._get_jira_affects_version(test_rule_dict)
+        result = self.rule._get_jira_affects_version(test_rule_dict, RuleDefaults.from_env())
         assert result == "default version"
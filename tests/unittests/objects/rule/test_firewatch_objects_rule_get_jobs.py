@@ -0,0 +1,30 @@
+import pytest
+
+from tests.unittests.objects.rule.rule_base_test import RuleBaseTest
+
+
+class TestGetJobs(RuleBaseTest):
+    def test_get_jobs_string(self):
+        test_rule_dict = {"jobs": "*-aws-*"}
+        result = self.rule._get_jobs(test_rule_dict)
+        assert result == ["*-aws-*"]
+
+    def test_get_jobs_list(self):
+        test_rule_dict = {"jobs": ["*-aws-*", "periodic-ci-exact-job"]}
+        result = self.rule._get_jobs(test_rule_dict)
+        assert result == ["*-aws-*", "periodic-ci-exact-job"]
+
+    def test_get_jobs_not_defined(self):
+        test_rule_dict = {}
+        result = self.rule._get_jobs(test_rule_dict)
+        assert result is None
+
+    def test_get_jobs_empty_list(self):
+        test_rule_dict = {"jobs": []}
+        with pytest.raises(SystemExit):
+            self.rule._get_jobs(test_rule_dict)
+
+    def test_get_jobs_non_string(self):
+        test_rule_dict = {"jobs": ["*-aws-*", 123]}
+        with pytest.raises(SystemExit):
+            self.rule._get_jobs(test_rule_dict)
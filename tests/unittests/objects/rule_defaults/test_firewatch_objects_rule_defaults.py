@@ -0,0 +1,58 @@
+import os
+import unittest
+from unittest.mock import patch
+
+from src.objects.failure_rule import FailureRule
+from src.objects.rule import Rule
+from src.objects.rule_defaults import RuleDefaults
+
+
+class TestRuleDefaults(unittest.TestCase):
+    @patch.dict(
+        os.environ,
+        {
+            "FIREWATCH_DEFAULT_JIRA_PROJECT": "DEFAULT",
+            "FIREWATCH_DEFAULT_JIRA_EPIC": "DEFAULT-1",
+            "FIREWATCH_DEFAULT_JIRA_COMPONENT": '["default-component"]',
+        },
+    )
+    def test_from_env(self):
+        defaults = RuleDefaults.from_env()
+
+        assert defaults.jira_project == "DEFAULT"
+        assert defaults.jira_epic == "DEFAULT-1"
+        assert defaults.jira_component == '["default-component"]'
+        assert defaults.jira_priority is None
+
+    def test_rules_use_the_given_defaults(self):
+        defaults = RuleDefaults(
+            jira_project="SHARED",
+            jira_epic="SHARED-1",
+            jira_additional_labels='["shared-label"]',
+            jira_priority="major",
+        )
+
+        with patch.dict(os.environ, {"FIREWATCH_DEFAULT_JIRA_PROJECT": "ENV", "FIREWATCH_DEFAULT_JIRA_EPIC": "ENV-1"}):
+            rule = Rule(
+                rule_dict={
+                    "jira_epic": "!default",
+                    "jira_additional_labels": ["label", "!default"],
+                    "jira_priority": "!default",
+                },
+                defaults=defaults,
+            )
+
+        assert rule.jira_project == "SHARED"
+        assert rule.jira_epic == "SHARED-1"
+        assert rule.jira_additional_labels == ["label", "shared-label"]
+        assert rule.jira_priority == "Major"
+
+    def test_rules_are_slotted(self):
+        rule = FailureRule(
+            rule_dict={"step": "step", "failure_type": "all", "classification": "none"},
+            defaults=RuleDefaults(jira_project="SHARED"),
+        )
+
+        assert not hasattr(rule, "__dict__")
+        with self.assertRaises(AttributeError):
+            rule.unknown_attribute = True